@@ -13,9 +13,10 @@ import sys
 import os
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
 
-from src.catan.board import CatanBoard
-from src.catan.vertices import VertexManager
-from src.catan.board_analyzer import BoardStrategyAnalyzer
+from catan.harbors import HARBOR_TYPE_STR
+from catan.vertices import standard_board_with_vertices
+from catan.board_analyzer import BoardStrategyAnalyzer
+from catan.scoring import PRETTY_STRATEGY
 
 def demo_complete_system():
     """Demo the complete harbor and strategy system."""
@@ -24,21 +25,19 @@ def demo_complete_system():
     
     # Create standard board
     print("📋 Creating standard board...")
-    board = CatanBoard()
-    board.create_standard_board()
+    board, vertex_manager = standard_board_with_vertices(seed=42, randomize=False)
     
     # Show corrected harbor positions
     print("\n⚓ CORRECTED HARBOR POSITIONS")
     print("-" * 30)
     
     harbor_manager = board.harbors
-    for harbor_id, harbor in harbor_manager.harbors.items():
-        vertices_str = ", ".join(map(str, harbor.vertices))
-        print(f"   {harbor.type.value} → vertices [{vertices_str}]")
+    harbor_lines = [f"   {HARBOR_TYPE_STR[harbor.type]} → vertices [{', '.join(map(str, harbor.vertices))}]"
+                    for harbor in harbor_manager.harbors.values()]
+    print("\n".join(harbor_lines))
     
-    # Create vertex manager
+    # Vertex manager comes with the cached board
     print(f"\n🔍 Setting up vertex analysis...")
-    vertex_manager = VertexManager(board)
     print(f"   ✅ Discovered {len(vertex_manager.vertices)} vertices")
     
     # 🧠 INTELLIGENT STRATEGY RECOMMENDATION
@@ -48,23 +47,21 @@ def demo_complete_system():
     analyzer = BoardStrategyAnalyzer(board, vertex_manager)
     strategy, explanation, details = analyzer.recommend_strategy()
     
-    print(f"🎯 RECOMMENDED STRATEGY: {strategy.upper().replace('_', ' ')}")
+    print(f"🎯 RECOMMENDED STRATEGY: {PRETTY_STRATEGY[strategy].upper()}")
     print(f"📝 {explanation}")
     print()
     print("📊 Strategy Scores:")
-    for strat, score in details['scores'].items():
-        indicator = "👑" if strat == strategy else "  "
-        print(f"   {indicator} {strat.replace('_', ' ').title()}: {score:.1f}")
+    score_lines = [f"   {'👑' if strat == strategy else '  '} {PRETTY_STRATEGY[strat]}: {score:.1f}"
+                   for strat, score in details['scores'].items()]
+    print("\n".join(score_lines))
     
     # Harbor analysis
     print(f"\n🏴 Harbor Analysis:")
     print(f"   ⚓ Total harbors: {len(board.get_all_harbors())}")
     
-    harbor_vertices = []
-    for vertex_id in range(54):
-        if board.is_harbor_vertex(vertex_id):
-            harbor = board.get_harbor_at_vertex(vertex_id)
-            harbor_vertices.append((vertex_id, harbor.type.value))
+    harbor_vertices = [(vertex_id, HARBOR_TYPE_STR[harbor.type])
+                       for harbor in board.harbors.harbors.values()
+                       for vertex_id in harbor.vertices]
     
     print(f"   🗺️  Harbor-accessible vertices: {len(harbor_vertices)}")
     
@@ -80,7 +77,7 @@ def demo_complete_system():
     print("   🎨 Enhanced harbor visualization (larger symbols, connections)")
     print("   📊 Comprehensive board analysis")
     
-    print(f"\n🎊 Demo completed! Recommended strategy: {strategy.upper().replace('_', ' ')}")
+    print(f"\n🎊 Demo completed! Recommended strategy: {PRETTY_STRATEGY[strategy].upper()}")
 
 if __name__ == "__main__":
     demo_complete_system()
@@ -4,16 +4,7 @@ Enhanced Catan System Demo
 =========================
 
 Demonstrates the new interactive features including:
--    for vertex_id in test_vertices:
-        is_legal = game_state.is_legal_settlement_placement(vertex_id, vertex_manager)
-        occupied = game_state.is_vertex_occupied(vertex_id)
-        
-        status = "✅ LEGAL" if is_legal else "❌ ILLEGAL"
-        reasons = []
-        if occupied:
-            reasons.append("occupied")
-        elif not is_legal:
-            reasons.append("too close to existing settlement") management with settlement legality
+- Game state management with settlement legality
 - Turn-order aware recommendations
 - Player position analysis
 - Strategic insights
@@ -25,8 +16,8 @@ from pathlib import Path
 # Add src to path
 sys.path.insert(0, str(Path(__file__).parent / "src"))
 
-from catan.board import CatanBoard
-from catan.vertices import VertexManager
+from catan.harbors import HARBOR_TYPE_STR
+from catan.vertices import standard_board_with_vertices
 from catan.state import GameState
 from catan.recommendations import SettlementRecommender
 from catan.visualize import CatanVisualizer
@@ -38,38 +29,37 @@ def main():
     
     # Create a standard board
     print("📋 Creating standard Catan board...")
-    board = CatanBoard()
-    board.create_standard_board()
-    vertex_manager = VertexManager(board)
+    board, vertex_manager = standard_board_with_vertices(seed=42, randomize=False)
     print(f"✅ Board created with {len(board.tiles)} tiles and {vertex_manager.get_vertex_count()} vertices")
     
     # Create a sample game state
     print("\n🎮 Setting up sample game state...")
-    game_state = GameState()
-    
-    # Add players with string IDs
-    game_state.add_player("alice")
-    game_state.add_player("bob")
-    game_state.add_player("charlie")
+    # GameState players are numbered from 0; names are only for display
+    player_names = ["alice", "bob", "charlie"]
+    alice = 0
+    game_state = GameState(num_players=len(player_names))
     
-    print(f"✅ Game state created with {len(game_state.players)} players")
+    print(f"✅ Game state created with {game_state.num_players} players")
     print(f"   Turn order: {game_state.turn_order}")
     
     # For this demo, we'll manually add some settlements to test the system
-    # (Note: in real use, you'd call place_settlement with validation)
     
     # Alice's settlements (early game, balanced strategy)
-    game_state.players["alice"].settlements = [16, 25]
+    game_state.place_settlement_enhanced(0, 16)
+    game_state.place_settlement_enhanced(0, 25)
     
     # Bob's settlements (development focused)
-    game_state.players["bob"].settlements = [42, 51]
-    game_state.players["bob"].cities = [42]  # Upgraded settlement
+    game_state.place_settlement_enhanced(1, 42)
+    game_state.place_settlement_enhanced(1, 51)
+    game_state.add_city(42, 1)  # Upgraded settlement
     
     # Charlie's settlements (road building focus)
-    game_state.players["charlie"].settlements = [7, 18]
+    game_state.place_settlement_enhanced(2, 7)
+    game_state.place_settlement_enhanced(2, 18)
     
-    for player_id, player in game_state.players.items():
-        print(f"   {player_id}: {len(player.settlements)} settlements, {len(player.cities)} cities")
+    for player_id, name in enumerate(player_names):
+        structures = game_state.get_player_structures(player_id)
+        print(f"   {name}: {len(structures['settlements'])} settlements, {len(structures['cities'])} cities")
     
     # Create recommendation system
     print("\n🔧 Setting up recommendation system...")
@@ -81,34 +71,38 @@ def main():
     print("-" * 40)
     
     comparison = recommender.compare_players(game_state)
+    lines = []
     for player_id, analysis in comparison["players"].items():
-        print(f"\n{player_id.upper()}:")
-        print(f"  Turn Position: #{analysis['turn_position']} ({analysis['turn_advantage']} player)")
-        print(f"  Settlements: {analysis['settlements']}, Cities: {analysis['cities']}")
-        print(f"  Total Production: {analysis['total_production']:.1f}")
-        print(f"  Harbors: {analysis['harbor_count']}")
-        print(f"  Recommended Strategy: {analysis['recommended_strategy']}")
-    
-    print(f"\nLeaders:")
-    for category, leader in comparison["leaders"].items():
-        print(f"  {category.replace('_', ' ').title()}: {leader}")
+        lines.extend([
+            f"\n{player_names[player_id].upper()}:",
+            f"  Turn Position: #{analysis['turn_position']} ({analysis['turn_advantage']} player)",
+            f"  Settlements: {analysis['settlements']}, Cities: {analysis['cities']}",
+            f"  Total Production: {analysis['total_production']:.1f}",
+            f"  Harbors: {analysis['harbor_count']}",
+            f"  Recommended Strategy: {analysis['recommended_strategy'][0]}"  # (name, explanation, details)
+        ])
+    
+    lines.append(f"\nLeaders:")
+    lines.extend(f"  {category.replace('_', ' ').title()}: {player_names[leader]}"
+                 for category, leader in comparison["leaders"].items())
+    print("\n".join(lines))
     
     # Generate recommendations for each player
     print("\n🎯 Settlement Recommendations")
     print("-" * 40)
     
-    for player_id in game_state.players.keys():
-        print(f"\n{player_id.upper()} - Next Settlement Recommendations:")
-        recommendations = recommender.recommend_best_settlements(
-            game_state, player_id, top_k=3
-        )
+    all_recommendations = recommender.recommend_for_players(
+        game_state, list(range(game_state.num_players)), top_k=3
+    )
+    for player_id, recommendations in all_recommendations.items():
+        print(f"\n{player_names[player_id].upper()} - Next Settlement Recommendations:")
         
         if recommendations:
             for i, rec in enumerate(recommendations, 1):
                 # Get some context about this vertex
                 vertex_info = vertex_manager.get_vertex_info(rec.vertex_id)
                 harbor = board.get_harbor_at_vertex(rec.vertex_id)
-                harbor_text = f" (Harbor: {harbor.type.value})" if harbor else ""
+                harbor_text = f" (Harbor: {HARBOR_TYPE_STR[harbor.type]})" if harbor else ""
                 
                 print(f"  #{i} Vertex {rec.vertex_id}: Score {rec.total_score:.1f}{harbor_text}")
                 print(f"      Production: {rec.production_score:.1f}, "
@@ -126,10 +120,10 @@ def main():
     if game_state.is_legal_settlement_placement(test_vertex, vertex_manager):
         print(f"Analyzing vertex {test_vertex} for Alice across different strategies:")
         
-        for strategy in ['balanced', 'road_focused', 'dev_focused', 'city_focused']:
-            score_breakdown = recommender.scorer.score_vertex(
-                test_vertex, game_state, "alice", strategy
-            )
+        strategy_scores = recommender.scorer.score_vertex_strategies(
+            test_vertex, game_state, alice
+        )
+        for strategy, score_breakdown in strategy_scores.items():
             print(f"  {strategy:15}: {score_breakdown.total_score:5.1f} "
                   f"(Prod: {score_breakdown.production_score:.1f}, "
                   f"Harbor: {score_breakdown.harbor_score:.1f})")
@@ -142,11 +136,14 @@ def main():
     test_vertices = [15, 17, 24, 26]  # Should be near Alice's settlement at 16
     print("Testing vertices near Alice's settlement at vertex 16:")
     
-    for vertex_id in test_vertices:
-        is_legal = game_state.is_settlement_legal(vertex_id)
-        distance_ok = game_state._check_distance_rule(vertex_id)
-        occupied = vertex_id in game_state.get_all_occupied_vertices()
-        
+    occupied_mask = vertex_manager.occupied_mask(game_state.occupied_vertices)
+    distance_mask = vertex_manager.distance_rule_mask(game_state.occupied_vertices)
+    legal_mask = ~occupied_mask & distance_mask
+    
+    for vertex_id, is_legal, distance_ok, occupied in zip(
+        test_vertices, legal_mask[test_vertices],
+        distance_mask[test_vertices], occupied_mask[test_vertices]
+    ):
         status = "✅ LEGAL" if is_legal else "❌ ILLEGAL"
         reasons = []
         if occupied:
@@ -161,7 +158,7 @@ def main():
     print("\n📋 Detailed Player Report")
     print("-" * 40)
     
-    report = recommender.generate_recommendation_report(game_state, "alice", top_k=3)
+    report = recommender.generate_recommendation_report(game_state, alice, top_k=3)
     print(report)
     
     print("\n✅ Demo completed! The system now supports:")
@@ -11,8 +11,8 @@ import os
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
 
 from catan import (
-    CatanBoard, VertexManager, SettlementScorer, 
-    SettlementRecommender, GameState
+    SettlementScorer, SettlementRecommender, GameState,
+    standard_board_with_vertices
 )
 
 
@@ -24,10 +24,7 @@ def demo_settlement_progression():
     print()
     
     # Create a standard board
-    board = CatanBoard(seed=42)
-    board.create_standard_board(randomize=False)
-    
-    vertex_manager = VertexManager(board)
+    board, vertex_manager = standard_board_with_vertices(seed=42, randomize=False)
     scorer = SettlementScorer(board, vertex_manager)
     recommender = SettlementRecommender(board, vertex_manager, scorer)
     
@@ -42,10 +39,10 @@ def demo_settlement_progression():
         game_state, strategy='balanced', player_id=0, top_k=3, settlement_number=1
     )
     
-    for i, rec in enumerate(first_recs, 1):
-        print(f"#{i} | Vertex {rec.vertex_id:2d} | Score: {rec.score:5.1f}")
-        print(f"    {rec.justification}")
-        print()
+    rec_lines = [f"#{i} | Vertex {rec.vertex_id:2d} | Score: {rec.score:5.1f}\n    {rec.justification}\n"
+                 for i, rec in enumerate(first_recs, 1)]
+    if rec_lines:
+        print("\n".join(rec_lines))
     
     # Place the first settlement
     if first_recs:
@@ -64,10 +61,10 @@ def demo_settlement_progression():
         game_state, strategy='balanced', player_id=0, top_k=3, settlement_number=2
     )
     
-    for i, rec in enumerate(second_recs, 1):
-        print(f"#{i} | Vertex {rec.vertex_id:2d} | Score: {rec.score:5.1f}")
-        print(f"    {rec.justification}")
-        print()
+    rec_lines = [f"#{i} | Vertex {rec.vertex_id:2d} | Score: {rec.score:5.1f}\n    {rec.justification}\n"
+                 for i, rec in enumerate(second_recs, 1)]
+    if rec_lines:
+        print("\n".join(rec_lines))
     
     # Show game state info
     print("📊 GAME STATE SUMMARY:")
@@ -17,8 +17,18 @@ from dataclasses import dataclass
 
 from catan import (
     CatanBoard, VertexManager, CatanVisualizer, 
-    SettlementRecommender, SettlementScorer, GameState, ResourceType
+    SettlementRecommender, SettlementScorer, GameState, ResourceType,
+    PRETTY_STRATEGY, HARBOR_TYPE_STR
 )
+from catan.board import Tile
+from catan.hex_coords import HexCoord
+from catan.io_utils import save_board_json, save_recommendations_csv
+
+# Resolve the optional strategy analyzer once instead of on every analysis
+try:
+    from catan.board_analyzer import BoardStrategyAnalyzer
+except ImportError:
+    BoardStrategyAnalyzer = None
 
 # Tile layout mapping for intuitive input
 # Maps user-friendly position numbers to hex coordinates
@@ -68,6 +78,17 @@ STANDARD_RESOURCES = {
 
 STANDARD_NUMBERS = [2, 3, 3, 4, 4, 5, 5, 6, 6, 8, 8, 9, 9, 10, 10, 11, 11, 12]
 
+
+def parse_int(text: str, default: Optional[int] = None) -> Optional[int]:
+    """Parse an integer typed by the user, returning default if it is not one."""
+    text = text.strip()
+    digits = text[1:] if text[:1] in ('+', '-') else text
+    # Cheap ASCII check first so bad input never goes through int()'s ValueError
+    if not (digits.isascii() and digits.isdigit()):
+        return default
+    return int(text)
+
+
 @dataclass
 class TileSetup:
     """Configuration for a single tile."""
@@ -85,6 +106,7 @@ class InteractiveCatanSetup:
         self.tiles: Dict[int, TileSetup] = {}
         self.board: Optional[CatanBoard] = None
         self.vertex_manager: Optional[VertexManager] = None
+        self._scorer: Optional[SettlementScorer] = None
         
     def print_banner(self):
         """Print welcome banner."""
@@ -167,16 +189,15 @@ class InteractiveCatanSetup:
         while True:
             print(f"🎲 Tile [{position}] - Enter number token (2-12, no 7):")
             
-            try:
-                number = int(input("   Number: ").strip())
-                if 2 <= number <= 12 and number != 7:
-                    return number
-                else:
-                    print("   ❌ Invalid number. Use 2-6 or 8-12 (no 7)")
-                    print()
-            except ValueError:
+            number = parse_int(input("   Number: "))
+            if number is None:
                 print("   ❌ Please enter a valid number")
                 print()
+            elif 2 <= number <= 12 and number != 7:
+                return number
+            else:
+                print("   ❌ Invalid number. Use 2-6 or 8-12 (no 7)")
+                print()
     
     def validate_setup(self) -> Tuple[bool, List[str]]:
         """Validate the tile setup meets Catan rules."""
@@ -266,7 +287,6 @@ class InteractiveCatanSetup:
             
             # Map board tiles to our layout
             for position, coord_tuple in TILE_LAYOUT_MAP.items():
-                from catan.hex_coords import HexCoord
                 coord = HexCoord(coord_tuple[0], coord_tuple[1])
                 
                 if coord in self.board.tiles:
@@ -285,8 +305,6 @@ class InteractiveCatanSetup:
     
     def create_board_from_setup(self):
         """Create CatanBoard from user setup."""
-        from catan.hex_coords import HexCoord
-        
         self.board = CatanBoard()
         
         # Clear existing tiles
@@ -296,7 +314,6 @@ class InteractiveCatanSetup:
         for tile_setup in self.tiles.values():
             coord = HexCoord(tile_setup.coord[0], tile_setup.coord[1])
             
-            from catan.board import Tile
             tile = Tile(
                 coord=coord,
                 resource=tile_setup.resource,
@@ -333,11 +350,10 @@ class InteractiveCatanSetup:
         harbors = self.board.get_all_harbors()
         print(f"⚓ Harbor count: {len(harbors)}")
         
-        harbor_vertices = []
-        for vertex_id in range(54):
-            if self.board.is_harbor_vertex(vertex_id):
-                harbor = self.board.get_harbor_at_vertex(vertex_id)
-                harbor_vertices.append((vertex_id, harbor.type.value))
+        vertex_harbors = self.board.harbors.vertex_harbors
+        harbor_vertices = [(vertex_id, HARBOR_TYPE_STR[vertex_harbors[vertex_id].type])
+                           for vertex_id in range(len(self.vertex_manager.vertices))
+                           if vertex_id in vertex_harbors]
         
         print(f"🏴 Harbor-accessible vertices: {len(harbor_vertices)}")
         
@@ -350,28 +366,33 @@ class InteractiveCatanSetup:
         print("\n🧠 INTELLIGENT STRATEGY ANALYSIS")
         print("=" * 35)
         
-        try:
-            from src.catan.board_analyzer import BoardStrategyAnalyzer
+        if BoardStrategyAnalyzer is not None:
             analyzer = BoardStrategyAnalyzer(self.board, self.vertex_manager)
             strategy, explanation, details = analyzer.recommend_strategy()
             
-            print(f"🎯 RECOMMENDED STRATEGY: {strategy.upper().replace('_', ' ')}")
+            print(f"🎯 RECOMMENDED STRATEGY: {PRETTY_STRATEGY[strategy].upper()}")
             print(f"📝 {explanation}")
             print()
             print("📊 Strategy Scores:")
             for strat, score in details['scores'].items():
                 indicator = "👑" if strat == strategy else "  "
-                print(f"   {indicator} {strat.replace('_', ' ').title()}: {score}")
+                print(f"   {indicator} {PRETTY_STRATEGY[strat]}: {score}")
             
             # Store recommended strategy
             self.recommended_strategy = strategy
-            
-        except ImportError:
+        else:
             print("⚠️  Strategy analyzer not available, using balanced as default")
             self.recommended_strategy = "balanced"
         
         print()
     
+    def _get_scorer(self) -> SettlementScorer:
+        """Get the scorer for the current board, reused across menu actions."""
+        if (self._scorer is None or self._scorer.board is not self.board
+                or self._scorer.vertex_manager is not self.vertex_manager):
+            self._scorer = SettlementScorer.for_board(self.board, self.vertex_manager)
+        return self._scorer
+    
     def get_recommendations(self, strategy: str = "balanced", top_k: int = 5, settlement_number: int = 1):
         """Get settlement recommendations."""
         if not self.board or not self.vertex_manager:
@@ -382,9 +403,8 @@ class InteractiveCatanSetup:
         print(f"   Settlement #{settlement_number} placement")
         print("=" * 50)
         
-        # Create scorer and recommender
-        scorer = SettlementScorer(self.board, self.vertex_manager)
-        recommender = SettlementRecommender(self.board, self.vertex_manager, scorer)
+        # Reuse the board's scorer so repeated strategy trials hit its ranking cache
+        recommender = SettlementRecommender(self.board, self.vertex_manager, self._get_scorer())
         game_state = GameState()
         
         # Get recommendations
@@ -395,15 +415,17 @@ class InteractiveCatanSetup:
         print(f"🏆 TOP {len(recommendations)} SETTLEMENTS:")
         print("-" * 40)
         
+        get_harbor = self.board.harbors.vertex_harbors.get
         for i, rec in enumerate(recommendations, 1):
+            breakdown = rec.score_breakdown
             print(f"#{i} | Vertex {rec.vertex_id:2d} | Score: {rec.score:5.1f}")
-            print(f"    Harbor: {rec.score_breakdown.harbor_score:4.1f} | Production: {rec.score_breakdown.production_score:5.1f}")
+            print(f"    Harbor: {breakdown.harbor_score:4.1f} | Production: {breakdown.production_score:5.1f}")
             print(f"    {rec.justification}")
             
             # Show harbor info if applicable
-            if self.board.harbors.is_harbor_vertex(rec.vertex_id):
-                harbor = self.board.harbors.get_harbor_at_vertex(rec.vertex_id)
-                print(f"    ⚓ Harbor: {harbor.type.value}")
+            harbor = get_harbor(rec.vertex_id)
+            if harbor:
+                print(f"    ⚓ Harbor: {HARBOR_TYPE_STR[harbor.type]}")
             print()
         
         return recommendations
@@ -419,9 +441,8 @@ class InteractiveCatanSetup:
         print("See how recommendations change with each settlement placement!")
         print()
         
-        # Create scorer and recommender
-        scorer = SettlementScorer(self.board, self.vertex_manager)
-        recommender = SettlementRecommender(self.board, self.vertex_manager, scorer)
+        # Reuse the board's scorer so repeated strategy trials hit its ranking cache
+        recommender = SettlementRecommender(self.board, self.vertex_manager, self._get_scorer())
         game_state = GameState()
         
         # Get initial recommendations for 1st settlement
@@ -468,7 +489,6 @@ class InteractiveCatanSetup:
             print("❌ Board analysis required first")
             return
             
-        import os
         os.makedirs(output_dir, exist_ok=True)
         
         print(f"🎨 GENERATING ARTIFACTS in {output_dir}/")
@@ -483,16 +503,14 @@ class InteractiveCatanSetup:
         print(f"✅ Board visualization: {board_path}")
         
         # Save board data
-        from catan.io_utils import save_board_json
         board_data_path = os.path.join(output_dir, "board_data.json")
-        save_board_json(self.board, board_data_path)
+        save_board_json(self.board, board_data_path, pretty=True)
         print(f"✅ Board data: {board_data_path}")
         
         # Generate recommendations
         recommendations = self.get_recommendations("balanced", 10)
         if recommendations:
             # Save recommendations
-            from catan.io_utils import save_recommendations_csv
             rec_path = os.path.join(output_dir, "recommendations.csv")
             save_recommendations_csv(recommendations, rec_path)
             print(f"✅ Recommendations: {rec_path}")
@@ -544,7 +562,7 @@ class InteractiveCatanSetup:
                 # Use intelligent strategy if available, otherwise show instruction
                 if hasattr(self, 'recommended_strategy'):
                     strategy = self.recommended_strategy
-                    print(f"🧠 Using intelligent strategy: {strategy.upper().replace('_', ' ')}")
+                    print(f"🧠 Using intelligent strategy: {PRETTY_STRATEGY[strategy].upper()}")
                 else:
                     print("ℹ️  No strategy recommendation available.")
                     print("💡 Tip: Run 'Analyze current board' (option 5) first to get intelligent strategy recommendation!")
@@ -553,15 +571,8 @@ class InteractiveCatanSetup:
                         strategy = "balanced"
                         print(f"🎯 Using default strategy: {strategy}")
                 
-                try:
-                    top_k = int(input("Number of recommendations (5): ").strip() or "5")
-                except ValueError:
-                    top_k = 5
-                
-                try:
-                    settlement_num = int(input("Settlement number (1 for first, 2 for second, etc.) [1]: ").strip() or "1")
-                except ValueError:
-                    settlement_num = 1
+                top_k = parse_int(input("Number of recommendations (5): "), default=5)
+                settlement_num = parse_int(input("Settlement number (1 for first, 2 for second, etc.) [1]: "), default=1)
                 
                 self.get_recommendations(strategy, top_k, settlement_num)
             elif choice == "7":
@@ -573,10 +584,7 @@ class InteractiveCatanSetup:
                 if not strategy:
                     strategy = "balanced"
                 
-                try:
-                    player_id = int(input("Player ID (0-3) [0]: ").strip() or "0")
-                except ValueError:
-                    player_id = 0
+                player_id = parse_int(input("Player ID (0-3) [0]: "), default=0)
                 
                 self.demonstrate_settlement_progression(strategy, player_id)
             elif choice == "8":
@@ -94,7 +94,7 @@ def main():
     
     # Save board data
     board_path = get_artifact_path("board.json", args.output_dir)
-    save_board_json(board, board_path)
+    save_board_json(board, board_path, pretty=True)
     print(f"💾 Board data saved: {board_path}")
     
     # Save vertex data
@@ -0,0 +1,35 @@
+"""
+Optional native build for the Catan optimizer.
+
+Project metadata lives in pyproject.toml; this file only adds compiled
+extensions. When Cython is available at build time, the pure-scalar
+``catan.hex_coords`` module is compiled ahead of time and the resulting
+extension is installed next to the ``.py`` source, which Python prefers on
+import. Without Cython (or a C compiler) the package installs as pure Python.
+
+    pip install cython
+    pip install --no-build-isolation -e .
+"""
+
+from setuptools import setup
+
+# Modules that are plain scalar arithmetic and compile cleanly as-is
+COMPILED_MODULES = ["src/catan/hex_coords.py"]
+
+
+def _ext_modules():
+    try:
+        from Cython.Build import cythonize
+    except ImportError:
+        return []
+    extensions = cythonize(
+        COMPILED_MODULES,
+        compiler_directives={"language_level": 3},
+        quiet=True,
+    )
+    for extension in extensions:
+        extension.optional = True  # a failed compile falls back to the pure-Python module
+    return extensions
+
+
+setup(ext_modules=_ext_modules())
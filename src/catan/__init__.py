@@ -7,12 +7,11 @@ A comprehensive toolkit for optimal settlement placement in Settlers of Catan.
 
 from .hex_coords import HexCoord, generate_radius_2_board
 from .board import CatanBoard, ResourceType, Tile
-from .harbors import HarborManager, Harbor, HarborType
-from .vertices import VertexManager, Vertex
-from .scoring import SettlementScorer, ScoreBreakdown
+from .harbors import HarborManager, Harbor, HarborType, HARBOR_TYPE_STR
+from .vertices import VertexManager, Vertex, standard_board_with_vertices
+from .scoring import SettlementScorer, ScoreBreakdown, STRATEGIES, PRETTY_STRATEGY
 from .state import GameState
 from .recommend import SettlementRecommender, RecommendationResult
-from .visualize import CatanVisualizer
 from .io_utils import save_board_json, load_board_json, save_recommendations_csv
 
 __version__ = "1.0.0"
@@ -27,10 +26,14 @@ __all__ = [
     'HarborManager',
     'Harbor', 
     'HarborType',
+    'HARBOR_TYPE_STR',
     'VertexManager',
     'Vertex',
+    'standard_board_with_vertices',
     'SettlementScorer',
     'ScoreBreakdown',
+    'STRATEGIES',
+    'PRETTY_STRATEGY',
     'GameState',
     'SettlementRecommender',
     'RecommendationResult',
@@ -40,4 +43,13 @@ __all__ = [
     'save_recommendations_csv'
 ]
 
+
+def __getattr__(name):
+    """Import CatanVisualizer on first use so the package loads without matplotlib."""
+    if name == 'CatanVisualizer':
+        from .visualize import CatanVisualizer
+        return CatanVisualizer
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
 __version__ = "1.0.0"
@@ -7,11 +7,23 @@ tile distributions, number tokens, harbors, and validation.
 """
 
 import random
-from typing import List, Dict, Optional, Tuple, Set
+import sys
+from functools import lru_cache
+from operator import attrgetter
+from typing import AbstractSet, List, Dict, FrozenSet, NamedTuple, Optional, Tuple
 from dataclasses import dataclass
 from enum import Enum
 
-from .hex_coords import HexCoord, generate_radius_2_board
+import numpy as np
+
+try:
+    import numba
+    _NUMBA_AVAILABLE = True
+except ImportError:  # numba is optional; fall back to NumPy
+    numba = None
+    _NUMBA_AVAILABLE = False
+
+from .hex_coords import HexCoord, generate_radius_2_board, _neighbors_qr
 from .harbors import HarborManager
 
 
@@ -23,9 +35,145 @@ class ResourceType(Enum):
     WHEAT = "wheat"
     ORE = "ore"
     DESERT = "desert"
+    
+    @property
+    def code(self) -> int:
+        """Integer code for indexing NumPy arrays (see RESOURCE_ORDER)."""
+        return RESOURCE_CODE[self]
+
+
+# Pips (dots) on each number token, indexed by number 0-12
+_PIPS_BY_NUMBER = tuple(0 if n == 0 else 6 - abs(7 - n) for n in range(13))
+
+# Ways to roll each number with two dice (no production on 7), indexed by number 0-12
+_WAYS_BY_NUMBER = (0, 0, 1, 2, 3, 4, 5, 0, 5, 4, 3, 2, 1)
+_PROBABILITY_BY_NUMBER = tuple(ways / 36.0 for ways in _WAYS_BY_NUMBER)
+
+# Integer codes for resources in TileArrays, in ResourceType declaration order
+RESOURCE_ORDER: Tuple[ResourceType, ...] = tuple(ResourceType)
+RESOURCE_CODE: Dict[ResourceType, int] = {resource: code for code, resource in enumerate(RESOURCE_ORDER)}
+
+# Official counts, as arrays indexed by resource code and by number token
+_EXPECTED_RESOURCE_COUNTS = np.array([4, 3, 4, 4, 3, 1])  # wood, brick, sheep, wheat, ore, desert
+_EXPECTED_NUMBER_COUNTS = np.array([0, 0, 1, 2, 2, 2, 2, 0, 2, 2, 2, 2, 1])
+
+# Official base game tile distribution as resource codes:
+# 4 wood (forest), 3 brick (hills), 4 sheep (pasture), 4 wheat (fields), 3 ore (mountains), 1 desert
+TILE_TYPE_POOL = np.array([0, 0, 0, 0, 1, 1, 1, 2, 2, 2, 2, 3, 3, 3, 3, 4, 4, 4, 5], dtype=np.int8)
+
+# Official number token distribution (no 7)
+NUMBER_POOL = np.array([2, 3, 3, 4, 4, 5, 5, 6, 6, 8, 8, 9, 9, 10, 10, 11, 11, 12], dtype=np.int8)
+
+# The standard 19-hex layout, sorted by (r, q) for deterministic tile placement
+_ROW_MAJOR_KEY = attrgetter('r', 'q')  # sort key giving (r, q) order
+_SORTED_HEX_COORDS: Tuple[HexCoord, ...] = tuple(sorted(generate_radius_2_board(), key=_ROW_MAJOR_KEY))
+_HEX_SET: FrozenSet[HexCoord] = frozenset(_SORTED_HEX_COORDS)
+
+
+def _distribution_is_standard_loop(resources: np.ndarray, numbers: np.ndarray,
+                                   expected_resources: np.ndarray, expected_numbers: np.ndarray) -> bool:
+    """
+    Check tile resource and number counts with fixed-size counters.
+    
+    Written as plain loops over integer arrays so numba can compile it.
+    """
+    resource_counts = np.zeros(expected_resources.shape[0], dtype=np.int64)
+    number_counts = np.zeros(expected_numbers.shape[0], dtype=np.int64)
+    deserts = 0
+    
+    for i in range(resources.shape[0]):
+        resource_counts[resources[i]] += 1
+        number = numbers[i]
+        if number > 0:
+            if number >= expected_numbers.shape[0]:
+                return False
+            number_counts[number] += 1
+        else:
+            deserts += 1
+    
+    for k in range(expected_resources.shape[0]):
+        if resource_counts[k] != expected_resources[k]:
+            return False
+    for k in range(expected_numbers.shape[0]):
+        if number_counts[k] != expected_numbers[k]:
+            return False
+    
+    # Exactly one tile (the desert) carries no number
+    return deserts == 1
+
+
+def _distribution_is_standard_numpy(resources: np.ndarray, numbers: np.ndarray,
+                                    expected_resources: np.ndarray, expected_numbers: np.ndarray) -> bool:
+    """Check tile resource and number counts with np.bincount."""
+    resource_counts = np.bincount(resources, minlength=expected_resources.shape[0])
+    if not np.array_equal(resource_counts, expected_resources):
+        return False
+    
+    # Tiles without a positive number are deserts
+    numbered = numbers > 0
+    number_counts = np.bincount(numbers[numbered], minlength=expected_numbers.shape[0])
+    if not np.array_equal(number_counts, expected_numbers):
+        return False
+    
+    return np.count_nonzero(~numbered) == 1
+
+
+if _NUMBA_AVAILABLE:
+    _distribution_is_standard = numba.njit(cache=True)(_distribution_is_standard_loop)
+else:
+    _distribution_is_standard = _distribution_is_standard_numpy
+
+
+@lru_cache(maxsize=8)
+def _adjacent_tile_edges(coords: Tuple[HexCoord, ...]) -> np.ndarray:
+    """
+    Get each pair of adjacent tiles once, as (i, j) indices into coords with i < j.
+    
+    The layout rarely changes, so the edge list is built once per coordinate set.
+    """
+    # Work on plain (q, r) tuples so no neighbor HexCoord objects are allocated
+    index = {(coord.q, coord.r): i for i, coord in enumerate(coords)}
+    edges = [
+        (i, j)
+        for i, coord in enumerate(coords)
+        for j in [index.get(neighbor, -1) for neighbor in _neighbors_qr(coord.q, coord.r)]
+        if j > i
+    ]
+    return np.array(edges, dtype=np.intp).reshape(-1, 2)
+
+
+@lru_cache(maxsize=8)
+def _adjacent_tile_edges_qr(coords: Tuple[HexCoord, ...]) -> np.ndarray:
+    """
+    Get the adjacent tile pairs with each pair oriented by (q, r) coordinate order.
+    
+    Same pairs as _adjacent_tile_edges, so callers can emit canonical
+    coordinate pairs without sorting each one.
+    """
+    edges = _adjacent_tile_edges(coords).copy()
+    swap = np.array([(coords[i].q, coords[i].r) > (coords[j].q, coords[j].r) for i, j in edges.tolist()],
+                    dtype=bool)
+    edges[swap] = edges[swap][:, ::-1]
+    return edges
 
 
-@dataclass
+class TileArrays(NamedTuple):
+    """Struct-of-arrays view of the board tiles, one entry per tile."""
+    coords: Tuple[HexCoord, ...]
+    index: Dict[HexCoord, int]  # coord -> position in the arrays
+    q: np.ndarray               # int8
+    r: np.ndarray               # int8
+    resource: np.ndarray        # int8 code into RESOURCE_ORDER
+    number: np.ndarray          # int8, 0 for desert
+    probability: np.ndarray     # float64, 0.0 under the robber
+    has_robber: np.ndarray      # bool
+
+
+# dataclass(slots=True) needs Python 3.10; older interpreters keep a per-instance __dict__
+_DATACLASS_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+
+@dataclass(**_DATACLASS_SLOTS)
 class Tile:
     """A hex tile on the Catan board."""
     coord: HexCoord
@@ -36,18 +184,15 @@ class Tile:
     @property
     def probability(self) -> float:
         """Dice roll probability for this tile."""
-        if self.number == 0 or self.has_robber:
+        if self.has_robber or not 0 <= self.number <= 12:
             return 0.0
-        
-        # Probability of rolling each number (2-12, excluding 7)
-        probs = {2: 1, 3: 2, 4: 3, 5: 4, 6: 5, 8: 5, 9: 4, 10: 3, 11: 2, 12: 1}
-        return probs.get(self.number, 0) / 36.0
+        return _PROBABILITY_BY_NUMBER[self.number]
     
     @property
     def pips(self) -> int:
         """Number of pips (dots) on the number token."""
-        if self.number == 0:
-            return 0
+        if 0 <= self.number <= 12:
+            return _PIPS_BY_NUMBER[self.number]
         return 6 - abs(7 - self.number)
     
     @property
@@ -63,75 +208,48 @@ class CatanBoard:
         """
         Initialize a Catan board.
         
+        Each board owns its random generator, so generating boards never
+        touches the global random state and separate instances can be
+        shuffled concurrently.
+        
         Args:
             seed: Random seed for deterministic board generation
         """
         self.seed = seed
-        if seed is not None:
-            random.seed(seed)
+        self._rng = random.Random(seed)
         
-        self.hexes: Set[HexCoord] = generate_radius_2_board()
+        self.hexes: AbstractSet[HexCoord] = _HEX_SET  # shared; replace rather than mutate
         self.tiles: Dict[HexCoord, Tile] = {}
         self.harbors = HarborManager()
         self.robber_position: Optional[HexCoord] = None
+        self._summary_cache: Optional[Tuple[Tuple, Dict]] = None  # (fingerprint, summary)
+        self._arrays_cache: Optional[Tuple[Tuple, TileArrays]] = None  # (tile state key, arrays)
+        self._histogram_cache: Optional[Tuple[TileArrays, Tuple[np.ndarray, np.ndarray]]] = None  # (arrays, hists)
         
-    def create_standard_board(self, randomize: bool = False) -> None:
+    def create_standard_board(self, randomize: bool = False,
+                              rng: Optional[np.random.Generator] = None) -> None:
         """
         Create a standard Catan board with official tile and number distribution.
         
         Args:
             randomize: If True, shuffle tiles and numbers randomly. If False, use deterministic layout.
+            rng: NumPy generator to shuffle with instead of the board's own generator;
+                 implies randomize. Faster when sampling many boards.
         """
-        # Official base game tile distribution
-        tile_types = [
-            ResourceType.WOOD,    # 4 forest tiles
-            ResourceType.WOOD,
-            ResourceType.WOOD,
-            ResourceType.WOOD,
-            ResourceType.BRICK,   # 3 hills tiles
-            ResourceType.BRICK,
-            ResourceType.BRICK,
-            ResourceType.SHEEP,   # 4 pasture tiles
-            ResourceType.SHEEP,
-            ResourceType.SHEEP,
-            ResourceType.SHEEP,
-            ResourceType.WHEAT,   # 4 fields tiles
-            ResourceType.WHEAT,
-            ResourceType.WHEAT,
-            ResourceType.WHEAT,
-            ResourceType.ORE,     # 3 mountains tiles
-            ResourceType.ORE,
-            ResourceType.ORE,
-            ResourceType.DESERT,  # 1 desert tile
-        ]
-        
-        # Official number token distribution (no 7)
-        numbers = [
-            2,           # 1 token
-            3, 3,        # 2 tokens
-            4, 4,        # 2 tokens
-            5, 5,        # 2 tokens
-            6, 6,        # 2 tokens
-            8, 8,        # 2 tokens
-            9, 9,        # 2 tokens
-            10, 10,      # 2 tokens
-            11, 11,      # 2 tokens
-            12,          # 1 token
-        ]
-        
-        assert len(tile_types) == 19, f"Expected 19 tiles, got {len(tile_types)}"
-        assert len(numbers) == 18, f"Expected 18 numbers, got {len(numbers)}"
-        
-        if randomize:
-            random.shuffle(tile_types)
-            random.shuffle(numbers)
-        
-        # Convert hex coordinates to a sorted list for deterministic placement
-        hex_coords = sorted(self.hexes, key=lambda h: (h.r, h.q))
+        if rng is not None:
+            # Vectorized shuffle of the code pools for bulk board sampling
+            tile_types = [RESOURCE_ORDER[code] for code in rng.permutation(TILE_TYPE_POOL).tolist()]
+            numbers = rng.permutation(NUMBER_POOL).tolist()
+        else:
+            tile_types = [RESOURCE_ORDER[code] for code in TILE_TYPE_POOL.tolist()]
+            numbers = NUMBER_POOL.tolist()
+            if randomize:
+                self._rng.shuffle(tile_types)
+                self._rng.shuffle(numbers)
         
-        # Assign tiles to hex coordinates
+        # Assign tiles to the presorted hex coordinates for deterministic placement
         number_idx = 0
-        for i, coord in enumerate(hex_coords):
+        for i, coord in enumerate(_SORTED_HEX_COORDS):
             resource = tile_types[i]
             
             if resource == ResourceType.DESERT:
@@ -154,7 +272,12 @@ class CatanBoard:
     
     def is_harbor_vertex(self, vertex_id: int) -> bool:
         """Check if vertex has harbor access."""
-        return self.harbors.is_harbor_vertex(vertex_id)
+        return vertex_id in self.harbors.harbor_vertex_set
+    
+    @property
+    def harbor_vertex_set(self) -> FrozenSet[int]:
+        """All vertex IDs with harbor access."""
+        return self.harbors.harbor_vertex_set
     
     def get_harbor_bonus(self, vertex_id: int, resource: ResourceType) -> float:
         """Get harbor trading bonus for vertex and resource."""
@@ -164,56 +287,102 @@ class CatanBoard:
         """Get all harbors on the board."""
         return self.harbors.get_all_harbors()
     
-    def validate_board(self) -> bool:
+    def fingerprint(self) -> Tuple:
         """
-        Validate that the board follows official Catan rules.
+        Get a hashable snapshot of the board layout.
+        
+        Two boards with the same tiles, robber position and harbors share a
+        fingerprint, so it can be used as a cache key for board analyses.
         
         Returns:
-            True if board is valid, False otherwise
+            Tuple of (tiles, robber_position, harbors)
         """
-        # Check hex count
-        if len(self.tiles) != 19:
-            return False
+        tiles = tuple(sorted(
+            (coord.q, coord.r, tile.resource.value, tile.number, tile.has_robber)
+            for coord, tile in self.tiles.items()
+        ))
+        robber = (self.robber_position.q, self.robber_position.r) if self.robber_position else None
+        harbors = tuple(sorted(
+            (harbor.type.value, tuple(harbor.vertices))
+            for harbor in self.harbors.harbors.values()
+        ))
+        return (tiles, robber, harbors)
+    
+    def tile_state_key(self) -> Tuple:
+        """
+        Get a cheap snapshot of the tile state for validating caches.
         
-        # Check resource distribution
-        resource_counts = {}
-        number_counts = {}
-        desert_count = 0
+        Unlike fingerprint() it skips harbors and sorting, so it is several
+        times faster to build and compare. It only suits caches of data derived
+        from the tiles alone, and boards with equal tiles inserted in a
+        different order get different keys.
         
-        for tile in self.tiles.values():
-            # Count resources
-            resource_counts[tile.resource] = resource_counts.get(tile.resource, 0) + 1
-            
-            # Count numbers
-            if tile.number > 0:
-                number_counts[tile.number] = number_counts.get(tile.number, 0) + 1
-            else:
-                desert_count += 1
+        Returns:
+            Tuple of (coord, resource, number, has_robber) in tile dict order
+        """
+        return tuple([(coord, tile.resource, tile.number, tile.has_robber)
+                      for coord, tile in self.tiles.items()])
+    
+    def tile_arrays(self) -> TileArrays:
+        """
+        Get the tiles as parallel NumPy arrays for vectorized queries.
         
-        # Validate resource distribution
-        expected_resources = {
-            ResourceType.WOOD: 4,
-            ResourceType.BRICK: 3,
-            ResourceType.SHEEP: 4,
-            ResourceType.WHEAT: 4,
-            ResourceType.ORE: 3,
-            ResourceType.DESERT: 1
-        }
+        Tiles are ordered by (r, q). The arrays are cached against
+        tile_state_key() and must be treated as read-only.
         
-        if resource_counts != expected_resources:
-            return False
+        Returns:
+            TileArrays view of the current tiles
+        """
+        key = self.tile_state_key()
+        if self._arrays_cache is None or self._arrays_cache[0] != key:
+            coords = tuple(sorted(self.tiles, key=_ROW_MAJOR_KEY))
+            tiles = [self.tiles[coord] for coord in coords]
+            arrays = TileArrays(
+                coords=coords,
+                index={coord: i for i, coord in enumerate(coords)},
+                q=np.array([coord.q for coord in coords], dtype=np.int8),
+                r=np.array([coord.r for coord in coords], dtype=np.int8),
+                resource=np.array([tile.resource.code for tile in tiles], dtype=np.int8),
+                number=np.array([tile.number for tile in tiles], dtype=np.int8),
+                probability=np.array([tile.probability for tile in tiles], dtype=np.float64),
+                has_robber=np.array([tile.has_robber for tile in tiles], dtype=bool)
+            )
+            self._arrays_cache = (key, arrays)
+        return self._arrays_cache[1]
+    
+    def tile_histograms(self) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Get tile counts per resource code and per number token.
         
-        # Validate number distribution
-        expected_numbers = {
-            2: 1, 3: 2, 4: 2, 5: 2, 6: 2,
-            8: 2, 9: 2, 10: 2, 11: 2, 12: 1
-        }
+        Cached alongside the tile_arrays() they are counted from, so they are
+        rebuilt exactly when the arrays are; treat them as read-only.
+        
+        Returns:
+            Tuple of (resource_hist indexed by resource code,
+            number_hist indexed by number 0-12, desert tiles excluded)
+        """
+        arrays = self.tile_arrays()
+        if self._histogram_cache is None or self._histogram_cache[0] is not arrays:
+            resource_hist = np.bincount(arrays.resource, minlength=len(RESOURCE_ORDER))
+            number_hist = np.bincount(arrays.number[arrays.number > 0], minlength=13)
+            self._histogram_cache = (arrays, (resource_hist, number_hist))
+        return self._histogram_cache[1]
+    
+    def validate_board(self) -> bool:
+        """
+        Validate that the board follows official Catan rules.
         
-        if number_counts != expected_numbers:
+        Returns:
+            True if board is valid, False otherwise
+        """
+        # Check hex count
+        if len(self.tiles) != 19:
             return False
         
-        # Validate desert has no number
-        if desert_count != 1:
+        # Validate resource and number distribution, and that only the desert has no number
+        arrays = self.tile_arrays()
+        if not _distribution_is_standard(arrays.resource, arrays.number,
+                                         _EXPECTED_RESOURCE_COUNTS, _EXPECTED_NUMBER_COUNTS):
             return False
         
         # Check that robber is on desert
@@ -233,32 +402,38 @@ class CatanBoard:
         Returns:
             List of (coord1, coord2) pairs where adjacent tiles both have 6 or 8
         """
-        from .hex_coords import hex_neighbors
+        arrays = self.tile_arrays()
+        edges = _adjacent_tile_edges_qr(arrays.coords)
         
-        adjacent_pairs = []
+        # Each adjacent pair appears once, already in (q, r) order, so no dedup or sorting is needed
+        high = np.isin(arrays.number, (6, 8))
+        high_edges = edges[high[edges[:, 0]] & high[edges[:, 1]]]
         
-        for coord, tile in self.tiles.items():
-            if tile.number in (6, 8):
-                for neighbor_coord in hex_neighbors(coord):
-                    if neighbor_coord in self.tiles:
-                        neighbor_tile = self.tiles[neighbor_coord]
-                        if neighbor_tile.number in (6, 8):
-                            # Sort to avoid duplicates
-                            pair = tuple(sorted([coord, neighbor_coord], key=lambda h: (h.q, h.r)))
-                            if pair not in adjacent_pairs:
-                                adjacent_pairs.append(pair)
-        
-        return adjacent_pairs
+        coords = arrays.coords
+        return [(coords[i], coords[j]) for i, j in high_edges.tolist()]
     
     def get_board_summary(self) -> Dict:
-        """Get a summary of the board configuration."""
-        resource_counts = {}
-        number_counts = {}
+        """
+        Get a summary of the board configuration.
+        
+        The summary is cached against the board fingerprint, so it is only
+        recomputed after tiles, the robber or harbors change.
+        """
+        fingerprint = self.fingerprint()
+        if self._summary_cache is None or self._summary_cache[0] != fingerprint:
+            self._summary_cache = (fingerprint, self._compute_board_summary())
+        return dict(self._summary_cache[1])
+    
+    def _compute_board_summary(self) -> Dict:
+        """Build the board summary from scratch."""
+        arrays = self.tile_arrays()
+        resource_hist, number_hist = self.tile_histograms()
         
-        for tile in self.tiles.values():
-            resource_counts[tile.resource.value] = resource_counts.get(tile.resource.value, 0) + 1
-            if tile.number > 0:
-                number_counts[tile.number] = number_counts.get(tile.number, 0) + 1
+        # Keys follow first appearance in board order, as the old per-tile loop did
+        resource_order = dict.fromkeys(arrays.resource.tolist())
+        number_order = dict.fromkeys(arrays.number[arrays.number > 0].tolist())
+        resource_counts = {RESOURCE_ORDER[code].value: int(resource_hist[code]) for code in resource_order}
+        number_counts = {number: int(number_hist[number]) for number in number_order}
         
         harbor_summary = self.harbors.get_harbor_summary()
         
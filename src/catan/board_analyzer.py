@@ -5,12 +5,115 @@ Board Strategy Analyzer
 Analyzes board characteristics to recommend optimal strategies.
 """
 
-from typing import Dict, List, Tuple
-from collections import Counter
+from typing import Callable, Dict, FrozenSet, List, NamedTuple, Optional, Tuple
+
+import numpy as np
 
 from .board import CatanBoard, ResourceType
+from .harbors import HARBOR_TYPE_STR, ResourceType as HarborResourceType
+from .scoring import STRATEGIES
 from .vertices import VertexManager
 
+# Resource names used as characteristics keys, precomputed to skip Enum .value lookups in the scan
+_RESOURCE_NAME: Dict[ResourceType, str] = {resource: resource.value for resource in ResourceType}
+_HARBOR_RESOURCE_NAME: Dict[HarborResourceType, str] = {resource: resource.value for resource in HarborResourceType}
+
+# Strategy bonus for each resource sitting on a 6 or 8
+_HIGH_NUMBER_BONUS: Dict[str, Tuple[str, int]] = {
+    'wood': ('road_focused', 8),
+    'brick': ('road_focused', 8),
+    'ore': ('city_focused', 8),
+    'wheat': ('city_focused', 8),
+    'sheep': ('dev_focused', 6),
+}
+
+
+class _ScoringInputs(NamedTuple):
+    """Board characteristics flattened for the strategy scoring rules."""
+    production: Dict[str, float]  # resource -> total production
+    resource_harbors: FrozenSet[str]
+    generic_harbors: int
+    high_number_resources: List[str]
+
+
+def _high_number_bonus(inputs: _ScoringInputs, strategy: str) -> int:
+    """Sum the 6/8 bonuses that go to one strategy."""
+    total = 0
+    for resource in inputs.high_number_resources:
+        bonus = _HIGH_NUMBER_BONUS.get(resource)
+        if bonus is not None and bonus[0] == strategy:
+            total += bonus[1]
+    return total
+
+
+# Strategy scoring rules as (points_fn, strategy); every rule is evaluated once per board
+_SCORING_RULES: Tuple[Tuple[Callable[[_ScoringInputs], int], str], ...] = (
+    # 1. Wood/brick availability and harbors (road strategy)
+    (lambda b: 30 if b.production.get('wood', 0) + b.production.get('brick', 0) > 60 else 0, 'road_focused'),
+    (lambda b: 15 if 'wood' in b.resource_harbors else 0, 'road_focused'),
+    (lambda b: 15 if 'brick' in b.resource_harbors else 0, 'road_focused'),
+    # 2. Ore/wheat/sheep availability and harbors (dev strategy)
+    (lambda b: 30 if (b.production.get('ore', 0) + b.production.get('wheat', 0)
+                      + b.production.get('sheep', 0)) > 80 else 0, 'dev_focused'),
+    (lambda b: 10 * len(b.resource_harbors.intersection(('ore', 'wheat', 'sheep'))), 'dev_focused'),
+    # 3. Ore/wheat for cities and their harbors (city strategy)
+    (lambda b: 25 if b.production.get('ore', 0) + b.production.get('wheat', 0) > 50 else 0, 'city_focused'),
+    (lambda b: 20 if 'ore' in b.resource_harbors else 0, 'city_focused'),
+    (lambda b: 15 if 'wheat' in b.resource_harbors else 0, 'city_focused'),
+    # 4. Overall distribution and generic harbors (balanced strategy)
+    (lambda b: 8 * sum(1 for quality in b.production.values() if quality > 30), 'balanced'),
+    (lambda b: 5 * b.generic_harbors, 'balanced'),
+    # 5. Resources on a 6 or 8
+    (lambda b: _high_number_bonus(b, 'road_focused'), 'road_focused'),
+    (lambda b: _high_number_bonus(b, 'dev_focused'), 'dev_focused'),
+    (lambda b: _high_number_bonus(b, 'city_focused'), 'city_focused'),
+)
+_STRATEGY_INDEX: Dict[str, int] = {strategy: i for i, strategy in enumerate(STRATEGIES)}
+
+
+class _ExplanationTemplate(NamedTuple):
+    """Wording and thresholds used to explain a resource-focused strategy."""
+    headline: str
+    production_rules: Tuple[Tuple[str, float, str], ...]  # (resource, threshold, reason template)
+    harbor_resources: Tuple[str, ...]
+    harbor_reason: str
+    fallback: str
+
+
+_EXPLANATIONS: Dict[str, _ExplanationTemplate] = {
+    'road_focused': _ExplanationTemplate(
+        headline="This board favors road building strategy.",
+        production_rules=(
+            ('wood', 30, "Excellent wood production ({:.1f})"),
+            ('brick', 25, "Strong brick production ({:.1f})"),
+        ),
+        harbor_resources=('wood', 'brick'),
+        harbor_reason="{} harbor(s) boost road building",
+        fallback="Wood and brick availability supports road expansion",
+    ),
+    'dev_focused': _ExplanationTemplate(
+        headline="This board supports development card strategy.",
+        production_rules=(
+            ('ore', 25, "Strong ore production ({:.1f})"),
+            ('wheat', 30, "Excellent wheat production ({:.1f})"),
+            ('sheep', 25, "Good sheep production ({:.1f})"),
+        ),
+        harbor_resources=('ore', 'wheat', 'sheep'),
+        harbor_reason="{} harbor(s) support development cards",
+        fallback="Development card resources are well-positioned",
+    ),
+    'city_focused': _ExplanationTemplate(
+        headline="This board rewards city building strategy.",
+        production_rules=(
+            ('ore', 30, "Excellent ore production ({:.1f})"),
+            ('wheat', 30, "Strong wheat production ({:.1f})"),
+        ),
+        harbor_resources=('ore', 'wheat'),
+        harbor_reason="{} harbor(s) facilitate city upgrades",
+        fallback="Ore and wheat positioning favors city development",
+    ),
+}
+
 
 class BoardStrategyAnalyzer:
     """Analyzes board layout to recommend optimal strategies."""
@@ -19,21 +122,30 @@ class BoardStrategyAnalyzer:
         """Initialize the analyzer."""
         self.board = board
         self.vertex_manager = vertex_manager
+        self._strategy_cache: Optional[Tuple[Tuple, Tuple[str, str, Dict]]] = None  # (fingerprint, result)
+        self._characteristics_cache: Optional[Tuple[Tuple, Dict]] = None  # (fingerprint, characteristics)
     
     def analyze_board_characteristics(self) -> Dict:
-        """Analyze key board characteristics for strategy recommendation."""
+        """
+        Analyze key board characteristics for strategy recommendation.
+        
+        The analysis is cached against the board fingerprint, so it is only
+        redone after tiles, the robber or harbors change. The returned dict is
+        shared and must be treated as read-only.
+        """
+        fingerprint = self.board.fingerprint()
+        if self._characteristics_cache is None or self._characteristics_cache[0] != fingerprint:
+            self._characteristics_cache = (fingerprint, self._compute_board_characteristics())
+        return self._characteristics_cache[1]
+    
+    def _compute_board_characteristics(self) -> Dict:
+        """Analyze the board characteristics from scratch."""
         characteristics = {}
         
-        # 1. Resource abundance analysis
-        resource_distribution = self._analyze_resource_distribution()
+        # 1-3. Resource abundance, number distribution and harbors in one scan
+        resource_distribution, number_quality, harbor_analysis = self._scan_board()
         characteristics['resources'] = resource_distribution
-        
-        # 2. Number distribution analysis
-        number_quality = self._analyze_number_distribution()
         characteristics['numbers'] = number_quality
-        
-        # 3. Harbor analysis
-        harbor_analysis = self._analyze_harbors()
         characteristics['harbors'] = harbor_analysis
         
         # 4. High-value positions analysis
@@ -42,75 +154,80 @@ class BoardStrategyAnalyzer:
         
         return characteristics
     
-    def _analyze_resource_distribution(self) -> Dict:
-        """Analyze resource tile distribution and quality."""
-        resource_scores = {}
+    def _scan_board(self) -> Tuple[Dict, Dict, Dict]:
+        """
+        Analyze resources, numbers and harbors in a single pass over tiles and harbors.
+        
+        Returns:
+            Tuple of (resource quality, number distribution, harbor analysis)
+        """
+        resource_scores = {}  # resource -> [count, total quality, has a 6 or 8]
+        number_counts: Dict[int, int] = {}
+        high_number_resources = []
         
         for tile in self.board.tiles.values():
-            if tile.resource == ResourceType.DESERT:
+            resource = _RESOURCE_NAME[tile.resource]
+            number = tile.number
+            if number > 0:
+                number_counts[number] = number_counts.get(number, 0) + 1
+                if number in (6, 8):
+                    high_number_resources.append(resource)
+            
+            if tile.resource is ResourceType.DESERT:
                 continue
-                
-            resource = tile.resource.value
+            
             quality_score = tile.probability * 100  # Convert to percentage
             
-            if resource not in resource_scores:
-                resource_scores[resource] = []
-            resource_scores[resource].append(quality_score)
+            accumulator = resource_scores.get(resource)
+            if accumulator is None:
+                accumulator = resource_scores[resource] = [0, 0.0, False]
+            accumulator[0] += 1
+            accumulator[1] += quality_score
+            if quality_score >= 13.9:  # 6 or 8
+                accumulator[2] = True
         
         # Calculate average quality per resource
-        resource_quality = {}
-        for resource, scores in resource_scores.items():
-            resource_quality[resource] = {
-                'count': len(scores),
-                'avg_quality': sum(scores) / len(scores),
-                'total_production': sum(scores),
-                'has_high_numbers': any(score >= 13.9 for score in scores)  # 6 or 8
+        resource_quality = {
+            resource: {
+                'count': count,
+                'avg_quality': total / count,
+                'total_production': total,
+                'has_high_numbers': has_high
             }
+            for resource, (count, total, has_high) in resource_scores.items()
+        }
         
-        return resource_quality
-    
-    def _analyze_number_distribution(self) -> Dict:
-        """Analyze number token distribution."""
-        number_counts = Counter()
-        high_number_tiles = []
-        
-        for tile in self.board.tiles.values():
-            if tile.number > 0:
-                number_counts[tile.number] += 1
-                if tile.number in (6, 8):
-                    high_number_tiles.append(tile)
-        
-        return {
-            'distribution': dict(number_counts),
-            'high_number_count': len(high_number_tiles),
-            'high_number_resources': [tile.resource.value for tile in high_number_tiles]
+        number_quality = {
+            'distribution': number_counts,
+            'high_number_count': len(high_number_resources),
+            'high_number_resources': high_number_resources
         }
-    
-    def _analyze_harbors(self) -> Dict:
-        """Analyze harbor placement and types."""
-        harbors = self.board.get_all_harbors()
-        harbor_types = Counter()
+        
+        harbor_manager = self.board.harbors
+        harbor_types: Dict[str, int] = {}
         resource_harbors = []
         
-        for harbor in harbors.values():
-            harbor_types[harbor.type.value] += 1
+        for harbor in harbor_manager.iter_harbors():
+            harbor_type = HARBOR_TYPE_STR[harbor.type]
+            harbor_types[harbor_type] = harbor_types.get(harbor_type, 0) + 1
             if harbor.resource:
-                resource_harbors.append(harbor.resource.value)
+                resource_harbors.append(_HARBOR_RESOURCE_NAME[harbor.resource])
         
-        return {
-            'total_harbors': len(harbors),
-            'types': dict(harbor_types),
+        harbor_analysis = {
+            'total_harbors': len(harbor_manager.harbors),
+            'types': harbor_types,
             'resource_harbors': resource_harbors,
             'generic_harbors': harbor_types.get('3:1', 0)
         }
+        
+        return resource_quality, number_quality, harbor_analysis
     
     def _analyze_vertex_positions(self) -> Dict:
         """Analyze vertex quality and clustering."""
         # This would analyze vertex positions, adjacencies, etc.
         # For now, return basic info
         total_vertices = len(self.vertex_manager.vertices)
-        harbor_vertices = sum(1 for vid in range(total_vertices) 
-                            if self.board.is_harbor_vertex(vid))
+        harbor_vertices = len(self.board.harbors.harbor_vertex_set.intersection(range(total_vertices)))
         
         return {
             'total_vertices': total_vertices,
@@ -122,92 +239,64 @@ class BoardStrategyAnalyzer:
         """
         Recommend the best strategy based on board analysis.
         
+        The result for the current board is memoized against its fingerprint,
+        so repeated calls on an unchanged board skip the tile, harbor and
+        vertex scans. The analysis details are shared and must be treated as
+        read-only.
+        
         Returns:
             Tuple of (strategy_name, explanation, analysis_details)
         """
-        characteristics = self.analyze_board_characteristics()
+        fingerprint = self.board.fingerprint()
+        if self._strategy_cache is None or self._strategy_cache[0] != fingerprint:
+            self._strategy_cache = (fingerprint, self._compute_strategy())
+        return self._strategy_cache[1]
+    
+    def recommend_strategy_fast(self) -> Tuple[str, Dict[str, int]]:
+        """
+        Recommend the best strategy without building the text explanation.
         
-        # Strategy scoring system
-        strategy_scores = {
-            'balanced': 0,
-            'road_focused': 0,
-            'dev_focused': 0,
-            'city_focused': 0
-        }
+        Meant for simulation sweeps that only need the pick and the scores;
+        a memoized recommend_strategy result is reused when available.
         
+        Returns:
+            Tuple of (strategy_name, strategy_scores)
+        """
+        if self._strategy_cache is not None and self._strategy_cache[0] == self.board.fingerprint():
+            strategy, _, details = self._strategy_cache[1]
+            return strategy, dict(details['scores'])
+        return self._score_strategies(self.analyze_board_characteristics())
+    
+    def _score_strategies(self, characteristics: Dict) -> Tuple[str, Dict[str, int]]:
+        """Score every strategy against the board characteristics and pick the best."""
         resources = characteristics['resources']
         harbors = characteristics['harbors']
-        numbers = characteristics['numbers']
-        
-        # 1. Analyze wood/brick availability (road strategy)
-        wood_quality = resources.get('wood', {}).get('total_production', 0)
-        brick_quality = resources.get('brick', {}).get('total_production', 0)
-        road_resources = wood_quality + brick_quality
-        
-        if road_resources > 60:  # High wood/brick production
-            strategy_scores['road_focused'] += 30
-        
-        # Check for wood/brick harbors
-        if 'wood' in harbors['resource_harbors']:
-            strategy_scores['road_focused'] += 15
-        if 'brick' in harbors['resource_harbors']:
-            strategy_scores['road_focused'] += 15
-        
-        # 2. Analyze ore/wheat/sheep availability (dev strategy)
-        ore_quality = resources.get('ore', {}).get('total_production', 0)
-        wheat_quality = resources.get('wheat', {}).get('total_production', 0)
-        sheep_quality = resources.get('sheep', {}).get('total_production', 0)
-        dev_resources = ore_quality + wheat_quality + sheep_quality
-        
-        if dev_resources > 80:  # High dev card resources
-            strategy_scores['dev_focused'] += 30
-        
-        # Check for dev-friendly harbors
-        dev_harbors = sum(1 for r in ['ore', 'wheat', 'sheep'] if r in harbors['resource_harbors'])
-        strategy_scores['dev_focused'] += dev_harbors * 10
-        
-        # 3. Analyze ore/wheat for cities (city strategy)
-        city_resources = ore_quality + wheat_quality
-        
-        if city_resources > 50:  # Good city resources
-            strategy_scores['city_focused'] += 25
-            
-        # Bonus for ore/wheat harbors
-        if 'ore' in harbors['resource_harbors']:
-            strategy_scores['city_focused'] += 20
-        if 'wheat' in harbors['resource_harbors']:
-            strategy_scores['city_focused'] += 15
-        
-        # 4. Balanced strategy gets points for overall distribution
-        resource_balance = len([r for r in resources.values() if r.get('total_production', 0) > 30])
-        strategy_scores['balanced'] += resource_balance * 8
-        
-        # Bonus for generic harbors (good for balanced)
-        strategy_scores['balanced'] += harbors['generic_harbors'] * 5
-        
-        # 5. High numbers bonus
-        high_number_resources = numbers['high_number_resources']
-        for resource in high_number_resources:
-            if resource in ['wood', 'brick']:
-                strategy_scores['road_focused'] += 8
-            elif resource in ['ore', 'wheat']:
-                strategy_scores['city_focused'] += 8
-            elif resource in ['ore', 'wheat', 'sheep']:
-                strategy_scores['dev_focused'] += 6
-        
-        # Find best strategy
-        best_strategy = max(strategy_scores.items(), key=lambda x: x[1])
-        strategy_name = best_strategy[0]
-        
-        # Generate explanation
-        explanations = {
-            'balanced': self._explain_balanced(characteristics),
-            'road_focused': self._explain_road_focused(characteristics),
-            'dev_focused': self._explain_dev_focused(characteristics),
-            'city_focused': self._explain_city_focused(characteristics)
-        }
+        inputs = _ScoringInputs(
+            production={resource: data.get('total_production', 0) for resource, data in resources.items()},
+            resource_harbors=frozenset(harbors['resource_harbors']),
+            generic_harbors=harbors['generic_harbors'],
+            high_number_resources=characteristics['numbers']['high_number_resources'],
+        )
+        
+        # Strategy scoring system: one pass over the rule table
+        scores = np.zeros(len(STRATEGIES), dtype=np.int64)
+        for points_fn, strategy in _SCORING_RULES:
+            scores[_STRATEGY_INDEX[strategy]] += points_fn(inputs)
+        strategy_scores = dict(zip(STRATEGIES, scores.tolist()))
+        
+        # Find best strategy (argmax keeps the first strategy on ties)
+        return STRATEGIES[int(np.argmax(scores))], strategy_scores
+    
+    def _compute_strategy(self) -> Tuple[str, str, Dict]:
+        """Score all strategies from a fresh board analysis."""
+        characteristics = self.analyze_board_characteristics()
+        strategy_name, strategy_scores = self._score_strategies(characteristics)
         
-        explanation = explanations[strategy_name]
+        # Generate the explanation for the chosen strategy only
+        if strategy_name == 'balanced':
+            explanation = self._explain_balanced(characteristics)
+        else:
+            explanation = self._explain_focused(characteristics, _EXPLANATIONS[strategy_name])
         
         return strategy_name, explanation, {
             'scores': strategy_scores,
@@ -240,77 +329,23 @@ class BoardStrategyAnalyzer:
         
         return f"This board rewards a balanced strategy. {'. '.join(reasons)}."
     
-    def _explain_road_focused(self, characteristics: Dict) -> str:
-        """Generate explanation for road-focused strategy."""
-        resources = characteristics['resources']
-        harbors = characteristics['harbors']
-        
-        reasons = []
-        
-        wood_prod = resources.get('wood', {}).get('total_production', 0)
-        brick_prod = resources.get('brick', {}).get('total_production', 0)
-        
-        if wood_prod > 30:
-            reasons.append(f"Excellent wood production ({wood_prod:.1f})")
-        if brick_prod > 25:
-            reasons.append(f"Strong brick production ({brick_prod:.1f})")
-        
-        road_harbors = [h for h in harbors['resource_harbors'] if h in ['wood', 'brick']]
-        if road_harbors:
-            reasons.append(f"{', '.join(road_harbors)} harbor(s) boost road building")
-        
-        if not reasons:
-            reasons.append("Wood and brick availability supports road expansion")
-        
-        return f"This board favors road building strategy. {'. '.join(reasons)}."
-    
-    def _explain_dev_focused(self, characteristics: Dict) -> str:
-        """Generate explanation for development-focused strategy."""
+    def _explain_focused(self, characteristics: Dict, template: '_ExplanationTemplate') -> str:
+        """Generate explanation for a resource-focused strategy from its template."""
         resources = characteristics['resources']
-        harbors = characteristics['harbors']
         
         reasons = []
         
-        ore_prod = resources.get('ore', {}).get('total_production', 0)
-        wheat_prod = resources.get('wheat', {}).get('total_production', 0)
-        sheep_prod = resources.get('sheep', {}).get('total_production', 0)
-        
-        if ore_prod > 25:
-            reasons.append(f"Strong ore production ({ore_prod:.1f})")
-        if wheat_prod > 30:
-            reasons.append(f"Excellent wheat production ({wheat_prod:.1f})")
-        if sheep_prod > 25:
-            reasons.append(f"Good sheep production ({sheep_prod:.1f})")
-        
-        dev_harbors = [h for h in harbors['resource_harbors'] if h in ['ore', 'wheat', 'sheep']]
-        if dev_harbors:
-            reasons.append(f"{', '.join(dev_harbors)} harbor(s) support development cards")
-        
-        if not reasons:
-            reasons.append("Development card resources are well-positioned")
-        
-        return f"This board supports development card strategy. {'. '.join(reasons)}."
-    
-    def _explain_city_focused(self, characteristics: Dict) -> str:
-        """Generate explanation for city-focused strategy."""
-        resources = characteristics['resources']
-        harbors = characteristics['harbors']
-        
-        reasons = []
-        
-        ore_prod = resources.get('ore', {}).get('total_production', 0)
-        wheat_prod = resources.get('wheat', {}).get('total_production', 0)
-        
-        if ore_prod > 30:
-            reasons.append(f"Excellent ore production ({ore_prod:.1f})")
-        if wheat_prod > 30:
-            reasons.append(f"Strong wheat production ({wheat_prod:.1f})")
+        for resource, threshold, reason in template.production_rules:
+            production = resources.get(resource, {}).get('total_production', 0)
+            if production > threshold:
+                reasons.append(reason.format(production))
         
-        city_harbors = [h for h in harbors['resource_harbors'] if h in ['ore', 'wheat']]
-        if city_harbors:
-            reasons.append(f"{', '.join(city_harbors)} harbor(s) facilitate city upgrades")
+        strategy_harbors = [h for h in characteristics['harbors']['resource_harbors']
+                            if h in template.harbor_resources]
+        if strategy_harbors:
+            reasons.append(template.harbor_reason.format(', '.join(strategy_harbors)))
         
         if not reasons:
-            reasons.append("Ore and wheat positioning favors city development")
+            reasons.append(template.fallback)
         
-        return f"This board rewards city building strategy. {'. '.join(reasons)}."
+        return f"{template.headline} {'. '.join(reasons)}."
@@ -5,7 +5,7 @@ Harbor System for Catan
 Manages harbor placement, types, and trading bonuses.
 """
 
-from typing import Dict, List, Set, Tuple, Optional
+from typing import Dict, FrozenSet, List, Sequence, Set, Tuple, Optional, ValuesView
 from dataclasses import dataclass
 from enum import Enum
 
@@ -32,6 +32,41 @@ class HarborType(Enum):
     ORE = "2:1_ore"     # 2:1 ore harbor
 
 
+# Display strings for harbor types, precomputed to skip Enum lookups in loops
+HARBOR_TYPE_STR: Dict[HarborType, str] = {harbor_type: harbor_type.value for harbor_type in HarborType}
+
+# Traded resource and trading ratio for each harbor type
+_HARBOR_META: Dict[HarborType, Tuple[Optional[ResourceType], int]] = {
+    HarborType.GENERIC: (None, 3),
+    HarborType.WOOD: (ResourceType.WOOD, 2),
+    HarborType.BRICK: (ResourceType.BRICK, 2),
+    HarborType.SHEEP: (ResourceType.SHEEP, 2),
+    HarborType.WHEAT: (ResourceType.WHEAT, 2),
+    HarborType.ORE: (ResourceType.ORE, 2),
+}
+
+# 2:1 harbor resources that earn a strategy bonus in get_harbor_score
+_STRATEGY_HARBOR_RESOURCES: Dict[str, Tuple[ResourceType, ...]] = {
+    'road_focused': (ResourceType.WOOD, ResourceType.BRICK),
+    'dev_focused': (ResourceType.ORE, ResourceType.WHEAT, ResourceType.SHEEP),
+    'city_focused': (ResourceType.ORE, ResourceType.WHEAT),
+}
+
+# Standard harbor layout as (harbor_type, vertex_ids); positions are calculated dynamically
+# Using the ORIGINAL correct vertex pairs (reverting the "fix")
+_STANDARD_HARBOR_CONFIGS: Tuple[Tuple[HarborType, Tuple[int, int]], ...] = (
+    (HarborType.BRICK, (39, 52)),     # ✅ Already correct
+    (HarborType.WOOD, (41, 36)),      # ✅ Already correct
+    (HarborType.SHEEP, (21, 22)),     # � Back to original
+    (HarborType.WHEAT, (49, 0)),      # � Back to original
+    (HarborType.ORE, (3, 53)),        # � Back to original
+    (HarborType.GENERIC, (50, 51)),   # � Back to original
+    (HarborType.GENERIC, (46, 47)),   # � Back to original
+    (HarborType.GENERIC, (33, 34)),   # � Back to original
+    (HarborType.GENERIC, (15, 16)),   # � Back to original
+)
+
+
 @dataclass
 class Harbor:
     """A harbor on the Catan board."""
@@ -43,14 +78,7 @@ class Harbor:
     
     def __post_init__(self):
         """Set resource and ratio based on harbor type."""
-        if self.type == HarborType.GENERIC:
-            self.resource = None
-            self.ratio = 3
-        else:
-            # Extract resource from 2:1 harbor type
-            resource_name = self.type.value.split('_')[1]
-            self.resource = ResourceType(resource_name)
-            self.ratio = 2
+        self.resource, self.ratio = _HARBOR_META[self.type]
 
 
 class HarborManager:
@@ -60,32 +88,23 @@ class HarborManager:
         """Initialize harbor manager with standard Catan harbor configuration."""
         self.harbors: Dict[int, Harbor] = {}  # harbor_id -> Harbor
         self.vertex_to_harbor: Dict[int, int] = {}  # vertex_id -> harbor_id
+        self.harbor_vertex_set: FrozenSet[int] = frozenset()
+        self.vertex_harbors: Dict[int, Harbor] = {}  # vertex_id -> Harbor
+        self._bonus_table: Dict[Tuple[int, ResourceType], float] = {}  # (vertex_id, resource) -> 2:1 bonus
+        self._default_bonus: Dict[int, float] = {}  # vertex_id -> bonus for any other resource
+        self._score_table: Dict[Tuple[int, str], float] = {}  # (vertex_id, strategy) -> score
+        self._base_score: Dict[int, float] = {}  # vertex_id -> score without strategy bonus
         self._setup_standard_harbors()
     
     def _setup_standard_harbors(self) -> None:
         """Set up the standard 9 harbors for a Catan board with correct positions."""
-        # Harbor configurations with vertices - positions will be calculated dynamically
-        # Using the ORIGINAL correct vertex pairs (reverting the "fix")
-        harbor_configs = [
-            # (harbor_type, vertex_ids)
-            (HarborType.BRICK, [39, 52]),     # ✅ Already correct
-            (HarborType.WOOD, [41, 36]),      # ✅ Already correct
-            (HarborType.SHEEP, [21, 22]),     # � Back to original
-            (HarborType.WHEAT, [49, 0]),      # � Back to original
-            (HarborType.ORE, [3, 53]),        # � Back to original
-            (HarborType.GENERIC, [50, 51]),   # � Back to original
-            (HarborType.GENERIC, [46, 47]),   # � Back to original
-            (HarborType.GENERIC, [33, 34]),   # � Back to original
-            (HarborType.GENERIC, [15, 16]),   # � Back to original
-        ]
-        
-        for harbor_id, (harbor_type, vertex_ids) in enumerate(harbor_configs):
+        for harbor_id, (harbor_type, vertex_ids) in enumerate(_STANDARD_HARBOR_CONFIGS):
             # Calculate position dynamically based on vertex locations
             position = self._calculate_harbor_position(vertex_ids)
             
             harbor = Harbor(
                 type=harbor_type,
-                vertices=vertex_ids,
+                vertices=list(vertex_ids),  # each harbor owns a mutable copy
                 position=position
             )
             
@@ -94,8 +113,39 @@ class HarborManager:
             # Map vertices to harbor
             for vertex_id in vertex_ids:
                 self.vertex_to_harbor[vertex_id] = harbor_id
+        
+        self._build_vertex_index()
+    
+    def _build_vertex_index(self) -> None:
+        """Build the vertex lookup tables derived from vertex_to_harbor."""
+        self.harbor_vertex_set = frozenset(self.vertex_to_harbor)
+        self.vertex_harbors = {
+            vertex_id: self.harbors[harbor_id]
+            for vertex_id, harbor_id in self.vertex_to_harbor.items()
+        }
+        self._build_lookup_tables()
     
-    def _calculate_harbor_position(self, vertex_ids: List[int]) -> Tuple[float, float]:
+    def _build_lookup_tables(self) -> None:
+        """Precompute harbor bonuses and scores per vertex for get_harbor_bonus/get_harbor_score."""
+        self._bonus_table = {}
+        self._default_bonus = {}
+        self._score_table = {}
+        self._base_score = {}
+        
+        for vertex_id, harbor in self.vertex_harbors.items():
+            if harbor.type == HarborType.GENERIC:
+                self._default_bonus[vertex_id] = 1.33  # 3:1 generic harbor (33% bonus)
+                self._base_score[vertex_id] = 15.0  # 3:1 harbors are generally useful
+                continue
+            
+            self._default_bonus[vertex_id] = 1.0  # Harbor doesn't match resource
+            self._bonus_table[(vertex_id, harbor.resource)] = 1.5  # 2:1 specific resource harbor (50% bonus)
+            self._base_score[vertex_id] = 25.0  # 2:1 harbors are more valuable
+            for strategy, resources in _STRATEGY_HARBOR_RESOURCES.items():
+                if harbor.resource in resources:
+                    self._score_table[(vertex_id, strategy)] = 30.0
+    
+    def _calculate_harbor_position(self, vertex_ids: Sequence[int]) -> Tuple[float, float]:
         """Calculate harbor position based on vertex locations."""
         # For now, return a placeholder - this will be overridden by vertex manager
         # The actual calculation will happen in the visualization layer
@@ -111,14 +161,11 @@ class HarborManager:
         Returns:
             Harbor object if vertex has harbor access, None otherwise
         """
-        harbor_id = self.vertex_to_harbor.get(vertex_id)
-        if harbor_id is not None:
-            return self.harbors[harbor_id]
-        return None
+        return self.vertex_harbors.get(vertex_id)
     
     def is_harbor_vertex(self, vertex_id: int) -> bool:
         """Check if a vertex has harbor access."""
-        return vertex_id in self.vertex_to_harbor
+        return vertex_id in self.harbor_vertex_set
     
     def get_harbor_bonus(self, vertex_id: int, resource: ResourceType) -> float:
         """
@@ -131,16 +178,10 @@ class HarborManager:
         Returns:
             Trading bonus multiplier (1.0 = no bonus, 1.5 = 2:1 harbor, 1.33 = 3:1 harbor)
         """
-        harbor = self.get_harbor_at_vertex(vertex_id)
-        if not harbor:
-            return 1.0  # No harbor bonus
-        
-        if harbor.type == HarborType.GENERIC:
-            return 1.33  # 3:1 generic harbor (33% bonus)
-        elif harbor.resource == resource:
-            return 1.5   # 2:1 specific resource harbor (50% bonus)
-        else:
-            return 1.0   # Harbor doesn't match resource
+        bonus = self._bonus_table.get((vertex_id, resource))
+        if bonus is None:
+            bonus = self._default_bonus.get(vertex_id, 1.0)  # 1.0 when the vertex has no harbor
+        return bonus
     
     def get_harbor_score(self, vertex_id: int, strategy: str = 'balanced') -> float:
         """
@@ -153,29 +194,19 @@ class HarborManager:
         Returns:
             Harbor score (0-30 points)
         """
-        harbor = self.get_harbor_at_vertex(vertex_id)
-        if not harbor:
-            return 0.0
-        
-        if harbor.type == HarborType.GENERIC:
-            base_score = 15.0  # 3:1 harbors are generally useful
-        else:
-            base_score = 25.0  # 2:1 harbors are more valuable
-            
-            # Strategy-specific bonuses
-            if strategy == 'road_focused' and harbor.resource in (ResourceType.WOOD, ResourceType.BRICK):
-                base_score += 5.0
-            elif strategy == 'dev_focused' and harbor.resource in (ResourceType.ORE, ResourceType.WHEAT, ResourceType.SHEEP):
-                base_score += 5.0
-            elif strategy == 'city_focused' and harbor.resource in (ResourceType.ORE, ResourceType.WHEAT):
-                base_score += 5.0
-        
-        return base_score
+        score = self._score_table.get((vertex_id, strategy))
+        if score is None:
+            score = self._base_score.get(vertex_id, 0.0)  # 0.0 when the vertex has no harbor
+        return score
     
     def get_all_harbors(self) -> Dict[int, Harbor]:
         """Get all harbors on the board."""
         return self.harbors.copy()
     
+    def iter_harbors(self) -> ValuesView[Harbor]:
+        """Get a read-only view of all harbors, without copying the harbor dict."""
+        return self.harbors.values()
+    
     def get_harbor_summary(self) -> Dict:
         """Get summary information about harbors."""
         harbor_types = {}
@@ -223,7 +254,7 @@ class HarborManager:
             
             harbor = Harbor(
                 type=harbor_type,
-                vertices=harbor_data['vertices'],
+                vertices=list(harbor_data['vertices']),  # don't alias the caller's list
                 position=tuple(harbor_data['position']),
                 resource=resource,
                 ratio=harbor_data['ratio']
@@ -234,4 +265,5 @@ class HarborManager:
             for vertex_id in harbor.vertices:
                 manager.vertex_to_harbor[vertex_id] = harbor_id
         
+        manager._build_vertex_index()
         return manager
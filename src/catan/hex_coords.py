@@ -6,16 +6,24 @@ Handles axial coordinate math, neighbor calculations, and axial <-> pixel transf
 """
 
 import math
-from typing import Tuple, List, Set
+from typing import FrozenSet, Optional, Sequence, Tuple, List, Set
 from dataclasses import dataclass
 
+import numpy as np
+
 
 @dataclass(frozen=True)
 class HexCoord:
     """Axial coordinates for a hexagon (q, r)."""
+    __slots__ = ('q', 'r')
+    
     q: int
     r: int
     
+    def __reduce__(self):
+        # Frozen slotted instances cannot restore state through setattr, so pickle via the constructor
+        return (HexCoord, (self.q, self.r))
+    
     @property
     def s(self) -> int:
         """Third coordinate s = -q - r (for cube coordinates)."""
@@ -31,6 +39,19 @@ class HexCoord:
         return HexCoord(self.q * scalar, self.r * scalar)
 
 
+# Constants for axial <-> pixel conversion (flat-top orientation)
+_SQRT3 = math.sqrt(3.0)
+_HALF_SQRT3 = _SQRT3 / 2.0
+_THIRD_SQRT3 = _SQRT3 / 3.0
+
+# Unit (cos, sin) offsets of the 6 hex corners, starting from 0° (rightmost point), going clockwise
+_CORNER_OFFSETS: Tuple[Tuple[float, float], ...] = tuple(
+    (math.cos(math.radians(60 * i)), math.sin(math.radians(60 * i))) for i in range(6)
+)
+_CORNER_COS = np.array([cos for cos, _ in _CORNER_OFFSETS])
+_CORNER_SIN = np.array([sin for _, sin in _CORNER_OFFSETS])
+
+
 # Direction vectors for hexagon neighbors (flat-top orientation)
 HEX_DIRECTIONS = [
     HexCoord(1, 0),   # Right
@@ -41,22 +62,30 @@ HEX_DIRECTIONS = [
     HexCoord(0, 1),   # Bottom-right
 ]
 
+# The same directions as raw (dq, dr) offsets, for hot paths that work on plain ints
+_DIRS_QR: Tuple[Tuple[int, int], ...] = tuple((d.q, d.r) for d in HEX_DIRECTIONS)
 
-def generate_radius_2_board() -> Set[HexCoord]:
+
+# The radius-2 hex set, built on first use by generate_radius_2_board
+_BOARD_HEXES: Optional[FrozenSet[HexCoord]] = None
+
+
+def generate_radius_2_board() -> FrozenSet[HexCoord]:
     """
     Generate all hex coordinates for a radius-2 board (19 hexes).
     
+    The set never changes, so it is built once and shared by every caller.
+    
     Returns:
-        Set of HexCoord representing the 19-hex Catan board
+        Frozen set of HexCoord representing the 19-hex Catan board
     """
-    hexes = set()
-    
-    for q in range(-2, 3):  # q from -2 to 2
-        for r in range(-2, 3):  # r from -2 to 2
-            if abs(q + r) <= 2:  # |q + r| <= 2 constraint
-                hexes.add(HexCoord(q, r))
-    
-    return hexes
+    global _BOARD_HEXES
+    if _BOARD_HEXES is None:
+        # q and r from -2 to 2, row-major in q, keeping |q + r| <= 2
+        qs, rs = np.mgrid[-2:3, -2:3]
+        mask = np.abs(qs + rs) <= 2
+        _BOARD_HEXES = frozenset(HexCoord(q, r) for q, r in zip(qs[mask].tolist(), rs[mask].tolist()))
+    return _BOARD_HEXES
 
 
 def hex_neighbors(hex_coord: HexCoord) -> List[HexCoord]:
@@ -64,9 +93,36 @@ def hex_neighbors(hex_coord: HexCoord) -> List[HexCoord]:
     return [hex_coord + direction for direction in HEX_DIRECTIONS]
 
 
+def _neighbors_qr(q: int, r: int) -> List[Tuple[int, int]]:
+    """Get all 6 neighbors of (q, r) as plain tuples, in HEX_DIRECTIONS order."""
+    return [(q + dq, r + dr) for dq, dr in _DIRS_QR]
+
+
 def hex_distance(a: HexCoord, b: HexCoord) -> int:
     """Calculate distance between two hex coordinates."""
-    return (abs(a.q - b.q) + abs(a.q + a.r - b.q - b.r) + abs(a.r - b.r)) // 2
+    # Cube distance is the largest of the three coordinate deltas; no halving needed
+    dq = a.q - b.q
+    dr = a.r - b.r
+    return max(abs(dq), abs(dr), abs(dq + dr))
+
+
+def hex_distance_batch(a: np.ndarray, b: np.ndarray) -> np.ndarray:
+    """
+    Calculate distances between many pairs of hex coordinates at once.
+    
+    Args:
+        a: Integer array of shape (N, 2) with (q, r) per row
+        b: Integer array of shape (N, 2), or (2,) to measure every row against one hex
+    
+    Returns:
+        Array of shape (N,) with the hex distance for each pair
+    """
+    delta = np.subtract(a, b)
+    distance = np.abs(delta[:, 0])
+    np.maximum(distance, np.abs(delta[:, 1]), out=distance)
+    np.add(delta[:, 0], delta[:, 1], out=delta[:, 0])
+    np.maximum(distance, np.abs(delta[:, 0]), out=distance)
+    return distance
 
 
 def axial_to_pixel(hex_coord: HexCoord, size: float = 1.0) -> Tuple[float, float]:
@@ -80,11 +136,39 @@ def axial_to_pixel(hex_coord: HexCoord, size: float = 1.0) -> Tuple[float, float
     Returns:
         (x, y) pixel coordinates
     """
-    x = size * (3.0/2.0 * hex_coord.q)
-    y = size * (math.sqrt(3.0)/2.0 * hex_coord.q + math.sqrt(3.0) * hex_coord.r)
+    q = hex_coord.q
+    x = size * (1.5 * q)
+    y = size * (_HALF_SQRT3 * q + _SQRT3 * hex_coord.r)
     return (x, y)
 
 
+def axial_to_pixel_batch(qr: np.ndarray, size: float = 1.0) -> np.ndarray:
+    """
+    Convert many axial coordinates to pixel coordinates (flat-top orientation).
+    
+    Vectorized counterpart of axial_to_pixel, with identical floating-point results.
+    
+    Args:
+        qr: Array of shape (N, 2) with (q, r) per row
+        size: Hex size (radius from center to vertex)
+    
+    Returns:
+        Array of shape (N, 2) with (x, y) pixel coordinates
+    """
+    q = np.asarray(qr[:, 0], dtype=float)
+    r = np.asarray(qr[:, 1], dtype=float)
+    
+    pixels = np.empty((len(q), 2))
+    x = pixels[:, 0]
+    np.multiply(q, 1.5, out=x)
+    np.multiply(x, size, out=x)
+    y = pixels[:, 1]
+    np.multiply(q, _HALF_SQRT3, out=y)
+    y += _SQRT3 * r
+    np.multiply(y, size, out=y)
+    return pixels
+
+
 def pixel_to_axial(x: float, y: float, size: float = 1.0) -> HexCoord:
     """
     Convert pixel coordinates to axial coordinates (flat-top orientation).
@@ -97,7 +181,7 @@ def pixel_to_axial(x: float, y: float, size: float = 1.0) -> HexCoord:
         HexCoord (rounded to nearest hex)
     """
     q = (2.0/3.0 * x) / size
-    r = (-1.0/3.0 * x + math.sqrt(3.0)/3.0 * y) / size
+    r = (-1.0/3.0 * x + _THIRD_SQRT3 * y) / size
     
     return axial_round(q, r)
 
@@ -134,15 +218,29 @@ def hex_corners(hex_coord: HexCoord, size: float = 1.0) -> List[Tuple[float, flo
         List of (x, y) corner positions, starting from rightmost and going clockwise
     """
     center_x, center_y = axial_to_pixel(hex_coord, size)
-    corners = []
+    return [(center_x + size * cos, center_y + size * sin) for cos, sin in _CORNER_OFFSETS]
+
+
+def hex_corners_array(hex_coords: Sequence[HexCoord], size: float = 1.0) -> np.ndarray:
+    """
+    Get the corner positions of many hexagons at once.
+    
+    Vectorized counterpart of hex_corners, with identical floating-point
+    results; prefer hex_corners for a single hex.
     
-    for i in range(6):
-        angle_deg = 60 * i  # Starting from 0° (rightmost point), going clockwise
-        angle_rad = math.radians(angle_deg)
-        corner_x = center_x + size * math.cos(angle_rad)
-        corner_y = center_y + size * math.sin(angle_rad)
-        corners.append((corner_x, corner_y))
+    Args:
+        hex_coords: Axial coordinates of the hexes
+        size: Hex size (radius from center to vertex)
+    
+    Returns:
+        Array of shape (len(hex_coords), 6, 2) with (x, y) corners in hex_corners order
+    """
+    qr = np.array([(h.q, h.r) for h in hex_coords], dtype=float).reshape(-1, 2)
+    centers = axial_to_pixel_batch(qr, size)
     
+    corners = np.empty((len(hex_coords), 6, 2))
+    corners[:, :, 0] = centers[:, 0, None] + size * _CORNER_COS
+    corners[:, :, 1] = centers[:, 1, None] + size * _CORNER_SIN
     return corners
 
 
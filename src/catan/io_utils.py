@@ -7,7 +7,13 @@ Load and save JSON/CSV artifacts for board data and analysis results.
 
 import json
 import csv
-from typing import Dict, List, Any, Optional, Tuple
+import os
+import threading
+import time
+from contextlib import contextmanager
+from functools import lru_cache
+from operator import methodcaller
+from typing import Any, BinaryIO, Callable, Dict, Iterable, Iterator, List, NamedTuple, Optional, Tuple
 from pathlib import Path
 
 from .board import CatanBoard, ResourceType, Tile
@@ -15,66 +21,232 @@ from .hex_coords import HexCoord
 from .state import GameState
 from .recommend import RecommendationResult
 
+try:
+    import orjson
+    _loads = orjson.loads
+    _ORJSON_COMPACT_OPTIONS = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+    _ORJSON_OPTIONS = _ORJSON_COMPACT_OPTIONS | orjson.OPT_INDENT_2
+except ImportError:  # orjson is optional; fall back to the standard library
+    orjson = None
+    _loads = json.loads
 
-def save_board_json(board: CatanBoard, filepath: str) -> None:
+# Userspace buffer for JSON writers, so streamed files reach the OS in large chunks
+_WRITE_BUFFER_SIZE = 1 << 20
+
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pacsv
+except ImportError:  # pyarrow is optional; fall back to csv.DictReader
+    pa = None
+    pacsv = None
+
+
+def loads_json(data) -> Any:
+    """
+    Parse JSON text, using orjson when it is installed.
+    
+    Args:
+        data: JSON document as str or bytes
+    
+    Returns:
+        Parsed Python object
+    
+    Raises:
+        json.JSONDecodeError: If the document is not valid JSON
+    """
+    return _loads(data)
+
+
+def dump_json(data: Any, filepath: str, pretty: bool = True) -> None:
+    """
+    Write data to a JSON file, using orjson when it is installed.
+    
+    orjson writes UTF-8 bytes directly and stringifies non-string dict keys,
+    so files are not byte-identical to the json fallback but load the same.
+    
+    Args:
+        data: JSON-serializable object
+        filepath: Path to save the JSON file
+        pretty: Indent by two spaces for people; False writes compact JSON
+    """
+    with open(filepath, 'wb', buffering=_WRITE_BUFFER_SIZE) as f:
+        f.write(_dumps(data, pretty=pretty))
+
+
+def _dumps(data: Any, depth: int = 0, pretty: bool = True) -> bytes:
+    """Encode data as JSON, two-space indented as if nested ``depth`` levels deep unless compact."""
+    if not pretty:
+        if orjson is not None:
+            return orjson.dumps(data, option=_ORJSON_COMPACT_OPTIONS)
+        return json.dumps(data, separators=(',', ':')).encode()
+    
+    if orjson is not None:
+        encoded = orjson.dumps(data, option=_ORJSON_OPTIONS)
+    else:
+        encoded = json.dumps(data, indent=2).encode()
+    if depth:
+        # JSON strings never contain raw newlines, so every newline starts a new line of structure
+        encoded = encoded.replace(b"\n", b"\n" + b"  " * depth)
+    return encoded
+
+
+class _StreamedArray(NamedTuple):
+    """Array field whose items are encoded and written one at a time."""
+    items: Iterable[Any]
+    encode_item: Callable[[Any], Any]  # item -> JSON-serializable object
+
+
+def stream_json_array(f: BinaryIO, items: Iterable[Any], encode_item: Callable[[Any], Any],
+                      depth: int = 0, pretty: bool = True) -> None:
+    """
+    Write a JSON array item by item, without building the full list first.
+    
+    Args:
+        f: File opened in binary mode
+        items: Items to write
+        encode_item: Converts one item into a JSON-serializable object
+        depth: Nesting depth of the array, for indentation
+        pretty: Indent by two spaces; False writes compact JSON
+    """
+    item_indent = b"\n" + b"  " * (depth + 1) if pretty else b""
+    separator = b"[" + item_indent
+    for item in items:
+        f.write(separator)
+        f.write(_dumps(encode_item(item), depth + 1, pretty))
+        separator = b"," + item_indent
+    if separator.startswith(b"["):
+        f.write(b"[]")
+    else:
+        f.write(b"\n" + b"  " * depth + b"]" if pretty else b"]")
+
+
+@contextmanager
+def _atomic_binary_writer(filepath: str) -> Iterator[BinaryIO]:
+    """
+    Open a temporary file next to filepath and move it into place on success.
+    
+    If writing fails part way, the temporary file is removed and any existing
+    file at filepath is left untouched instead of being truncated.
+    """
+    # Unique per writing thread; created like open() would, so the umask sets its permissions
+    temp_path = f"{filepath}.{os.getpid()}.{threading.get_ident()}.tmp"
+    fd = os.open(temp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, 'O_BINARY', 0), 0o666)
+    try:
+        with os.fdopen(fd, 'wb', buffering=_WRITE_BUFFER_SIZE) as f:
+            yield f
+        os.replace(temp_path, filepath)
+    except BaseException:
+        try:
+            os.unlink(temp_path)
+        except OSError:
+            pass
+        raise
+
+
+def _stream_json_object(filepath: str, fields: Iterable[Tuple[str, Any]], pretty: bool = True) -> None:
+    """
+    Write a top-level JSON object, streaming any _StreamedArray fields.
+    
+    The layout matches dump_json, so streamed and dumped files are interchangeable.
+    Items are encoded while writing, so the object goes to a temporary file that
+    only replaces filepath once it is complete.
+    """
+    opening, key_separator = (b"{\n  ", b": ") if pretty else (b"{", b":")
+    field_separator = b",\n  " if pretty else b","
+    
+    with _atomic_binary_writer(filepath) as f:
+        separator = opening
+        for key, value in fields:
+            f.write(separator)
+            f.write(_dumps(key) + key_separator)
+            if isinstance(value, _StreamedArray):
+                stream_json_array(f, value.items, value.encode_item, depth=1, pretty=pretty)
+            else:
+                f.write(_dumps(value, 1, pretty))
+            separator = field_separator
+        if separator is opening:
+            f.write(b"{}")
+        else:
+            f.write(b"\n}" if pretty else b"}")
+
+
+def _tile_to_dict(item: Tuple[HexCoord, Tile]) -> Dict:
+    """Encode one (coord, tile) board entry for save_board_json."""
+    hex_coord, tile = item
+    return {
+        'q': hex_coord.q,
+        'r': hex_coord.r,
+        'resource': tile.resource.value,
+        'number': tile.number,
+        'has_robber': tile.has_robber,
+        'probability': tile.probability,
+        'pips': tile.pips,
+        'is_high_probability': tile.is_high_probability
+    }
+
+
+def save_board_json(board: CatanBoard, filepath: str, pretty: bool = False) -> None:
     """
     Save board configuration to JSON file.
     
     Args:
         board: The Catan board to save
         filepath: Path to save the JSON file
+        pretty: Indent the JSON for people; the default compact form is faster to write
     """
-    data = {
-        'metadata': {
+    fields = [
+        ('metadata', {
             'seed': board.seed,
             'total_tiles': len(board.tiles),
             'is_valid': board.validate_board()
-        },
-        'tiles': []
-    }
-    
-    for hex_coord, tile in board.tiles.items():
-        tile_data = {
-            'q': hex_coord.q,
-            'r': hex_coord.r,
-            'resource': tile.resource.value,
-            'number': tile.number,
-            'has_robber': tile.has_robber,
-            'probability': tile.probability,
-            'pips': tile.pips,
-            'is_high_probability': tile.is_high_probability
-        }
-        data['tiles'].append(tile_data)
+        }),
+        ('tiles', _StreamedArray(board.tiles.items(), _tile_to_dict))
+    ]
     
     # Add robber position
     if board.robber_position:
-        data['robber_position'] = {
+        fields.append(('robber_position', {
             'q': board.robber_position.q,
             'r': board.robber_position.r
-        }
+        }))
     
     # Add harbor data
-    data['harbors'] = board.harbors.export_harbors_to_dict()
+    fields.append(('harbors', board.harbors.export_harbors_to_dict()))
     
     # Add board summary
-    data['summary'] = board.get_board_summary()
+    fields.append(('summary', board.get_board_summary()))
+    
+    _stream_json_object(filepath, fields, pretty)
+
+
+@lru_cache(maxsize=32)
+def _load_board_data(filepath: str, mtime_ns: int, size: int) -> Dict:
+    """
+    Parse a board JSON file, memoized per file version.
     
-    with open(filepath, 'w') as f:
-        json.dump(data, f, indent=2)
+    The modification time and size are part of the key, so rewriting the
+    file invalidates the entry. The returned dict is shared and must be
+    treated as read-only.
+    """
+    with open(filepath, 'rb') as f:
+        return _loads(f.read())
 
 
 def load_board_json(filepath: str) -> CatanBoard:
     """
     Load board configuration from JSON file.
     
+    Repeated loads of an unchanged file reuse the parsed JSON and skip the
+    read and parse; every call still returns a new, independent board.
+    
     Args:
         filepath: Path to the JSON file
     
     Returns:
         CatanBoard instance
     """
-    with open(filepath, 'r') as f:
-        data = json.load(f)
+    stat = os.stat(filepath)
+    data = _load_board_data(os.path.abspath(filepath), stat.st_mtime_ns, stat.st_size)
     
     # Create board
     seed = data['metadata'].get('seed')
@@ -136,6 +308,19 @@ def load_vertices_csv(filepath: str) -> List[Dict]:
     Returns:
         List of vertex data dictionaries
     """
+    if pacsv is not None:
+        # Columnar parse and type conversion in C++, then one conversion to row dicts
+        table = pacsv.read_csv(filepath, convert_options=pacsv.ConvertOptions(column_types={
+            'vertex_id': pa.int64(),
+            'x': pa.float64(),
+            'y': pa.float64(),
+            'incident_hexes': pa.string(),
+            'hex_count': pa.int64(),
+            'is_boundary': pa.bool_(),
+            'legal_flag': pa.bool_()
+        }))
+        return table.to_pylist()
+    
     vertices = []
     
     with open(filepath, 'r') as f:
@@ -153,18 +338,18 @@ def load_vertices_csv(filepath: str) -> List[Dict]:
     return vertices
 
 
-def save_game_state_json(game_state: GameState, filepath: str) -> None:
+def save_game_state_json(game_state: GameState, filepath: str, pretty: bool = False) -> None:
     """
     Save game state to JSON file.
     
     Args:
         game_state: GameState instance
         filepath: Path to save the JSON file
+        pretty: Indent the JSON for people; the default compact form is faster to write
     """
     data = game_state.to_dict()
     
-    with open(filepath, 'w') as f:
-        json.dump(data, f, indent=2)
+    dump_json(data, filepath, pretty)
 
 
 def load_game_state_json(filepath: str) -> GameState:
@@ -177,8 +362,8 @@ def load_game_state_json(filepath: str) -> GameState:
     Returns:
         GameState instance
     """
-    with open(filepath, 'r') as f:
-        data = json.load(f)
+    with open(filepath, 'rb') as f:
+        data = _loads(f.read())
     
     return GameState.from_dict(data)
 
@@ -193,13 +378,11 @@ def save_recommendations_json(recommendations: List[RecommendationResult], filep
         filepath: Path to save the JSON file
         metadata: Optional metadata to include
     """
-    data = {
-        'recommendations': [rec.to_dict() for rec in recommendations],
-        'metadata': metadata or {}
-    }
-    
-    with open(filepath, 'w') as f:
-        json.dump(data, f, indent=2)
+    _stream_json_object(filepath, [
+        # methodcaller, not RecommendationResult.to_dict, so ScoreBreakdown lists still serialize
+        ('recommendations', _StreamedArray(recommendations, methodcaller('to_dict'))),
+        ('metadata', metadata or {})
+    ])
 
 
 def load_recommendations_json(filepath: str) -> Tuple[List[Dict], Dict]:
@@ -212,8 +395,8 @@ def load_recommendations_json(filepath: str) -> Tuple[List[Dict], Dict]:
     Returns:
         Tuple of (recommendations list, metadata dict)
     """
-    with open(filepath, 'r') as f:
-        data = json.load(f)
+    with open(filepath, 'rb') as f:
+        data = _loads(f.read())
     
     return data['recommendations'], data.get('metadata', {})
 
@@ -233,24 +416,29 @@ def save_recommendations_csv(recommendations: List[RecommendationResult], filepa
         'justification'
     ]
     
-    with open(filepath, 'w', newline='') as f:
-        writer = csv.DictWriter(f, fieldnames=fieldnames)
-        writer.writeheader()
-        
-        for rec in recommendations:
-            sb = rec.score_breakdown
-            writer.writerow({
-                'rank': rec.rank,
-                'vertex_id': rec.vertex_id,
-                'total_score': f"{rec.score:.2f}",
-                'production_score': f"{sb.production_score:.2f}",
-                'balance_score': f"{sb.balance_score:.2f}",
-                'road_score': f"{sb.road_score:.2f}",
-                'dev_score': f"{sb.dev_score:.2f}",
-                'robber_penalty': f"{sb.robber_penalty:.2f}",
-                'blocking_score': f"{sb.blocking_score:.2f}",
-                'justification': rec.justification
-            })
+    # Rows accumulate in the 1 MiB buffer and reach the file in a few large writes
+    with open(filepath, 'w', newline='', buffering=_WRITE_BUFFER_SIZE) as f:
+        writer = csv.writer(f)
+        writer.writerow(fieldnames)
+        # Tuples in fieldnames order skip DictWriter's per-row dict and key lookups
+        writer.writerows(map(_recommendation_csv_row, recommendations))
+
+
+def _recommendation_csv_row(rec: RecommendationResult) -> Tuple:
+    """Build one save_recommendations_csv row, with scores to two decimals."""
+    sb = rec.score_breakdown
+    return (
+        rec.rank,
+        rec.vertex_id,
+        format(rec.score, '.2f'),
+        format(sb.production_score, '.2f'),
+        format(sb.balance_score, '.2f'),
+        format(sb.road_score, '.2f'),
+        format(sb.dev_score, '.2f'),
+        format(sb.robber_penalty, '.2f'),
+        format(sb.blocking_score, '.2f'),
+        rec.justification
+    )
 
 
 def create_example_state_file(filepath: str, num_players: int = 4) -> None:
@@ -275,7 +463,7 @@ def create_example_state_file(filepath: str, num_players: int = 4) -> None:
     state.add_road(3, 7, 0)      # Player 0 road
     state.add_road(15, 20, 1)    # Player 1 road
     
-    save_game_state_json(state, filepath)
+    save_game_state_json(state, filepath, pretty=True)
 
 
 def ensure_artifacts_directory(base_path: str = "artifacts") -> Path:
@@ -320,22 +508,24 @@ def save_analysis_summary(board: CatanBoard, vertex_manager, recommendations: Li
         strategy: Strategy used for analysis
         filepath: Path to save the summary
     """
+    csv_data = vertex_manager.get_vertices_csv_data()
+    boundary_vertices = sum(1 for v in csv_data if v['is_boundary'])
+    
     summary = {
         'analysis_metadata': {
             'strategy': strategy,
-            'timestamp': str(Path(__file__).stat().st_mtime),  # Simple timestamp
+            'timestamp': str(time.time()),  # Seconds since the epoch when the summary was saved
             'board_valid': board.validate_board(),
-            'total_vertices': vertex_manager.get_vertex_count(),
+            'total_vertices': vertex_manager.total_count,
             'total_recommendations': len(recommendations)
         },
         'board_summary': board.get_board_summary(),
         'top_recommendations': [rec.to_dict() for rec in recommendations[:10]],
         'vertex_statistics': {
             'total_vertices': len(vertex_manager.vertices),
-            'boundary_vertices': len([v for v in vertex_manager.get_vertices_csv_data() if v['is_boundary']]),
-            'interior_vertices': len([v for v in vertex_manager.get_vertices_csv_data() if not v['is_boundary']])
+            'boundary_vertices': boundary_vertices,
+            'interior_vertices': len(csv_data) - boundary_vertices
         }
     }
     
-    with open(filepath, 'w') as f:
-        json.dump(summary, f, indent=2)
+    dump_json(summary, filepath)
@@ -5,19 +5,36 @@ Settlement Recommendation Engine
 Main ranking pipeline for optimal settlement placement.
 """
 
-import json
 from typing import Dict, List, Set, Optional, Tuple
 from dataclasses import dataclass
+from operator import attrgetter
 
 from .board import CatanBoard
 from .vertices import VertexManager 
 from .state import GameState
-from .scoring import SettlementScorer, ScoreBreakdown
+from .scoring import SettlementScorer, ScoreBreakdown, STRATEGIES
+
+# Justification fragments, built once instead of per recommendation
+_SETTLEMENT_MSG: Dict[int, str] = {
+    1: "1st settlement: Focus on production and diversity",
+    2: "2nd settlement: Complement existing resources",
+}
+_ADVANCED_SETTLEMENT_MSG = "{}th settlement: Advanced strategy".format
+_PRODUCTION_ITEM = "{} ({:.1f}%)".format
+_DIVERSITY_MSG: Tuple[Optional[str], ...] = (None, None, "Good resource diversity", "Excellent resource diversity")
+# strategy -> (score component, threshold, message); city_focused is checked against ore/wheat production
+_STRATEGY_MSG: Dict[str, Tuple[attrgetter, float, str]] = {
+    'road_focused': (attrgetter('road_score'), 10, "Good for road building (wood/brick access)"),
+    'dev_focused': (attrgetter('dev_score'), 15, "Excellent for development cards (ore/wheat/sheep)"),
+}
 
 
 @dataclass
 class RecommendationResult:
     """Result of settlement recommendation analysis."""
+    # _dict is not a field: it holds the serialized form once to_dict() has built it
+    __slots__ = ('vertex_id', 'rank', 'score', 'score_breakdown', 'justification', '_dict')
+    
     vertex_id: int
     rank: int
     score: float
@@ -25,14 +42,26 @@ class RecommendationResult:
     justification: str
     
     def to_dict(self) -> Dict:
-        """Convert to dictionary for JSON serialization."""
-        return {
-            'vertex_id': self.vertex_id,
-            'rank': self.rank,
-            'score': self.score,
-            'score_breakdown': self.score_breakdown.to_dict(),
-            'justification': self.justification
-        }
+        """
+        Convert to dictionary for JSON serialization.
+        
+        Results are not modified after creation, so the dictionary is built on
+        the first call and a copy of it, including the nested score breakdown,
+        is returned afterwards. Callers may modify what they get back.
+        """
+        try:
+            cached = self._dict
+        except AttributeError:
+            cached = self._dict = {
+                'vertex_id': self.vertex_id,
+                'rank': self.rank,
+                'score': self.score,
+                'score_breakdown': self.score_breakdown.to_dict(),
+                'justification': self.justification
+            }
+        result = dict(cached)
+        result['score_breakdown'] = dict(cached['score_breakdown'])
+        return result
 
 
 class SettlementRecommender:
@@ -52,7 +81,8 @@ class SettlementRecommender:
         self.scorer = scorer
     
     def recommend_settlements(self, game_state: GameState, strategy: str = 'balanced',
-                            player_id: int = 0, top_k: int = 10, settlement_number: int = None) -> List[RecommendationResult]:
+                            player_id: int = 0, top_k: int = 10, settlement_number: int = None,
+                            max_workers: Optional[int] = None) -> List[RecommendationResult]:
         """
         Generate top-K settlement recommendations.
         
@@ -62,6 +92,7 @@ class SettlementRecommender:
             player_id: ID of the player making the placement
             top_k: Number of recommendations to return
             settlement_number: Which settlement number this is for the player (1st, 2nd, etc.)
+            max_workers: Worker processes for vertex scoring (see SettlementScorer.rank_vertices)
         
         Returns:
             List of RecommendationResult objects, ranked by score
@@ -71,23 +102,21 @@ class SettlementRecommender:
             settlement_number = game_state.get_settlement_count(player_id) + 1
         
         # Get scored vertices
-        scored_vertices = self.scorer.rank_vertices(game_state, strategy, player_id, top_k, settlement_number)
+        scored_vertices = self.scorer.rank_vertices(game_state, strategy, player_id, top_k, settlement_number,
+                                                    max_workers=max_workers)
         
         # Convert to recommendation results with justifications
-        results = []
-        for rank, score_breakdown in enumerate(scored_vertices, 1):
-            justification = self._generate_justification(score_breakdown, strategy, settlement_number)
-            
-            result = RecommendationResult(
+        generate_justification = self._generate_justification
+        return [
+            RecommendationResult(
                 vertex_id=score_breakdown.vertex_id,
                 rank=rank,
                 score=score_breakdown.total_score,
                 score_breakdown=score_breakdown,
-                justification=justification
+                justification=generate_justification(score_breakdown, strategy, settlement_number)
             )
-            results.append(result)
-        
-        return results
+            for rank, score_breakdown in enumerate(scored_vertices, 1)
+        ]
     
     def analyze_placement(self, vertex_id: int, game_state: GameState, 
                          strategy: str = 'balanced', player_id: int = 0, settlement_number: int = None) -> RecommendationResult:
@@ -108,7 +137,7 @@ class SettlementRecommender:
         if settlement_number is None:
             settlement_number = game_state.get_settlement_count(player_id) + 1
         
-        score_breakdown = self.scorer.score_vertex(vertex_id, game_state, strategy, settlement_number)
+        score_breakdown = self.scorer.score_vertex(vertex_id, game_state, player_id, strategy, settlement_number)
         justification = self._generate_justification(score_breakdown, strategy, settlement_number)
         
         return RecommendationResult(
@@ -121,14 +150,27 @@ class SettlementRecommender:
     
     def compare_strategies_for_vertex(self, vertex_id: int, game_state: GameState, 
                                    player_id: int = 0, settlement_number: int = None) -> Dict[str, RecommendationResult]:
-        """Compare how different strategies evaluate the same vertex."""
-        strategies = ['balanced', 'road_focused', 'dev_focused', 'city_focused']
-        results = {}
+        """
+        Compare how different strategies evaluate the same vertex.
         
-        for strategy in strategies:
-            results[strategy] = self.analyze_placement(vertex_id, game_state, strategy, player_id, settlement_number)
+        The strategy-independent score components are computed once and
+        recombined per strategy by score_vertex_strategies.
+        """
+        if settlement_number is None:
+            settlement_number = game_state.get_settlement_count(player_id) + 1
         
-        return results
+        breakdowns = self.scorer.score_vertex_strategies(vertex_id, game_state, player_id, STRATEGIES,
+                                                         settlement_number)
+        return {
+            strategy: RecommendationResult(
+                vertex_id=vertex_id,
+                rank=0,  # Not ranked in this context
+                score=score_breakdown.total_score,
+                score_breakdown=score_breakdown,
+                justification=self._generate_justification(score_breakdown, strategy, settlement_number)
+            )
+            for strategy, score_breakdown in breakdowns.items()
+        }
     
     def _generate_justification(self, score_breakdown: ScoreBreakdown, strategy: str, settlement_number: int = 1) -> str:
         """Generate human-readable justification for a recommendation."""
@@ -139,36 +181,34 @@ class SettlementRecommender:
         justifications = []
         
         # Settlement-specific considerations
-        if settlement_number == 1:
-            justifications.append("1st settlement: Focus on production and diversity")
-        elif settlement_number == 2:
-            justifications.append("2nd settlement: Complement existing resources")
+        settlement_msg = _SETTLEMENT_MSG.get(settlement_number)
+        if settlement_msg is not None:
+            justifications.append(settlement_msg)
         elif settlement_number > 2:
-            justifications.append(f"{settlement_number}th settlement: Advanced strategy")
+            justifications.append(_ADVANCED_SETTLEMENT_MSG(settlement_number))
         
         # Production analysis
         if score_breakdown.production_score > 15:
             resources = []
             for resource_name, resource_data in vertex_info['resources'].items():
                 if resource_name != 'desert' and resource_data['probability'] > 0.08:
-                    prob_pct = resource_data['probability'] * 100
-                    resources.append(f"{resource_name} ({prob_pct:.1f}%)")
+                    resources.append(_PRODUCTION_ITEM(resource_name, resource_data['probability'] * 100))
             
             if resources:
-                justifications.append(f"Strong production: {', '.join(resources)}")
+                justifications.append("Strong production: " + ", ".join(resources))
         
         # Resource diversity
         resource_count = len([r for r in vertex_info['resources'].keys() if r != 'desert'])
-        if resource_count >= 3:
-            justifications.append("Excellent resource diversity")
-        elif resource_count == 2:
-            justifications.append("Good resource diversity")
+        diversity_msg = _DIVERSITY_MSG[min(resource_count, 3)]
+        if diversity_msg is not None:
+            justifications.append(diversity_msg)
         
         # Strategy-specific analysis
-        if strategy == 'road_focused' and score_breakdown.road_score > 10:
-            justifications.append("Good for road building (wood/brick access)")
-        elif strategy == 'dev_focused' and score_breakdown.dev_score > 15:
-            justifications.append("Excellent for development cards (ore/wheat/sheep)")
+        strategy_msg = _STRATEGY_MSG.get(strategy)
+        if strategy_msg is not None:
+            component, threshold, message = strategy_msg
+            if component(score_breakdown) > threshold:
+                justifications.append(message)
         elif strategy == 'city_focused':
             ore_wheat = 0
             for resource in ['ore', 'wheat']:
@@ -185,7 +225,7 @@ class SettlementRecommender:
                     high_prob_numbers.append(str(number))
         
         if high_prob_numbers:
-            justifications.append(f"High-probability numbers: {', '.join(high_prob_numbers)}")
+            justifications.append("High-probability numbers: " + ", ".join(high_prob_numbers))
         
         # Robber risk
         if score_breakdown.robber_penalty > 10:
@@ -211,12 +251,12 @@ class SettlementRecommender:
             'metadata': {
                 'total_recommendations': len(recommendations),
                 'board_valid': self.board.validate_board(),
-                'total_vertices': self.vertex_manager.get_vertex_count()
+                'total_vertices': self.vertex_manager.total_count
             }
         }
         
-        with open(filepath, 'w') as f:
-            json.dump(data, f, indent=2)
+        from .io_utils import dump_json  # io_utils imports this module
+        dump_json(data, filepath)
     
     def export_recommendations_csv(self, recommendations: List[RecommendationResult], 
                                  filepath: str) -> None:
@@ -265,8 +305,8 @@ class SettlementRecommender:
         lines.extend([
             f"Strategy: {strategy_explanation}",
             f"Board validated: {self.board.validate_board()}",
-            f"Total vertices analyzed: {self.vertex_manager.get_vertex_count()}",
-            f"Legal placements found: {len(self.vertex_manager.get_legal_vertices())}",
+            f"Total vertices analyzed: {self.vertex_manager.total_count}",
+            f"Legal placements found: {self.vertex_manager.legal_count}",
             "",
             "Top Recommendations:",
             "-" * 30
@@ -6,31 +6,90 @@ Provides intelligent settlement recommendations based on board state,
 game state, turn order, and strategy preferences.
 """
 
+import heapq
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from operator import attrgetter
 from typing import List, Dict, Tuple, Optional
 import json
 
-from .board import CatanBoard
+import numpy as np
+
+from .board import CatanBoard, RESOURCE_ORDER
 from .vertices import VertexManager
 from .scoring import SettlementScorer, ScoreBreakdown
 from .state import GameState
 from .board_analyzer import BoardStrategyAnalyzer
 
+# C-level sort key for ranking score breakdowns
+_TOTAL_SCORE_KEY = attrgetter('total_score')
+
+# Maximum number of memoized recommendation results per recommender
+RECOMMENDATION_CACHE_SIZE = 256
+
+# compare_players leader category -> analyze_player_position metric
+_LEADER_METRICS: Dict[str, str] = {
+    "most_settlements": "settlements",
+    "most_cities": "cities",
+    "most_production": "total_production",
+    "most_harbors": "harbor_count",
+}
+
+# Recommender copy held by each worker process in recommend_for_players
+_worker_recommender = None
+
+
+def _init_recommendation_worker(recommender: 'SettlementRecommender') -> None:
+    """Install the recommender once per worker process."""
+    global _worker_recommender
+    _worker_recommender = recommender
+
+
+def _recommend_in_worker(game_state: GameState, player_id, strategy: Optional[str],
+                         top_k: int) -> List[ScoreBreakdown]:
+    """Run recommend_best_settlements on the worker's recommender."""
+    return _worker_recommender.recommend_best_settlements(
+        game_state, player_id, strategy=strategy, top_k=top_k
+    )
+
 
 class SettlementRecommender:
     """Intelligent settlement recommendation system."""
     
-    def __init__(self, board: CatanBoard, vertex_manager: VertexManager):
+    def __init__(self, board: CatanBoard, vertex_manager: VertexManager,
+                 scorer: Optional[SettlementScorer] = None):
         """
         Initialize the recommendation system.
         
         Args:
             board: The Catan board
             vertex_manager: Vertex manager for the board
+            scorer: Scorer to use, or None to share the board's scorer
         """
         self.board = board
         self.vertex_manager = vertex_manager
-        self.scorer = SettlementScorer(board, vertex_manager)
+        self.scorer = scorer or SettlementScorer.for_board(board, vertex_manager)
+        self._owns_scorer = scorer is not None  # a shared board scorer must not be modified
         self.strategy_analyzer = BoardStrategyAnalyzer(board, vertex_manager)
+        self._recommendation_cache: "OrderedDict[Tuple, List[ScoreBreakdown]]" = OrderedDict()
+        self._report_cache: "OrderedDict[Tuple, str]" = OrderedDict()
+    
+    def set_weights(self, weights: Dict[str, float]) -> None:
+        """
+        Apply custom scoring weights to this recommender's scorer.
+        
+        A scorer shared through SettlementScorer.for_board is first replaced
+        with a private copy, so the weights never reach other holders of it.
+        
+        Args:
+            weights: Weights to update, keyed like SettlementScorer.weights
+        """
+        if not self._owns_scorer:
+            scorer = SettlementScorer(self.board, self.vertex_manager)
+            scorer.weights = dict(self.scorer.weights)
+            self.scorer = scorer
+            self._owns_scorer = True
+        self.scorer.set_weights(weights)
     
     def recommend_best_settlements(self, game_state: GameState, player_id: str, 
                                  strategy: Optional[str] = None, 
@@ -51,18 +110,21 @@ class SettlementRecommender:
         """
         # Auto-select strategy if not provided
         if strategy is None:
-            strategy = self.strategy_analyzer.recommend_strategy()
+            strategy, _ = self.strategy_analyzer.recommend_strategy_fast()
         
         # Update scorer weights if provided
         if weights:
-            self.scorer.set_weights(weights)
+            self.set_weights(weights)
         
-        # Get all legal settlement locations
-        legal_vertices = []
-        # Filter out vertices that are not legally placeable
-        for vertex_id in self.vertex_manager.vertices:
-            if game_state.is_legal_settlement_placement(vertex_id, self.vertex_manager):
-                legal_vertices.add(vertex_id)
+        # Reuse the previous ranking if nothing that affects scoring has changed
+        cache_key = self._recommendation_cache_key(game_state, player_id, strategy, top_k)
+        cached = self._recommendation_cache.get(cache_key)
+        if cached is not None:
+            self._recommendation_cache.move_to_end(cache_key)
+            return list(cached)
+        
+        # Get all legal settlement locations in one mask query, in vertex ID order
+        legal_vertices = np.flatnonzero(self.vertex_manager.legal_mask(game_state.occupied_vertices)).tolist()
         
         # Score all legal vertices
         scored_vertices = []
@@ -71,9 +133,71 @@ class SettlementRecommender:
             if score_breakdown.total_score > 0:  # Only include positive scores
                 scored_vertices.append(score_breakdown)
         
-        # Sort by total score (highest first) and return top K
-        scored_vertices.sort(key=lambda x: x.total_score, reverse=True)
-        return scored_vertices[:top_k]
+        # Select the top K by total score (highest first) without sorting every vertex;
+        # ties keep scoring order, exactly as a stable descending sort would
+        top_vertices = heapq.nlargest(top_k, scored_vertices, key=_TOTAL_SCORE_KEY)
+        
+        self._recommendation_cache[cache_key] = top_vertices
+        if len(self._recommendation_cache) > RECOMMENDATION_CACHE_SIZE:
+            self._recommendation_cache.popitem(last=False)
+        return list(top_vertices)
+    
+    def recommend_for_players(self, game_state: GameState, player_ids: List[str],
+                              strategy: Optional[str] = None, top_k: int = 10,
+                              max_workers: Optional[int] = None) -> Dict[str, List[ScoreBreakdown]]:
+        """
+        Recommend settlements for several players in parallel.
+        
+        Each player's ranking is independent, so the players are spread over
+        worker processes. The board and vertex manager are shipped to each
+        worker once through the pool initializer rather than per task.
+        
+        Args:
+            game_state: Current game state including existing settlements
+            player_ids: Players to make recommendations for
+            strategy: Strategy preference, or None for automatic selection
+            top_k: Number of top recommendations per player
+            max_workers: Worker process count; defaults to one per player,
+                and 1 runs everything in this process
+            
+        Returns:
+            Dictionary mapping player ID to its recommendations, in player_ids order
+        """
+        if max_workers is None:
+            max_workers = len(player_ids)
+        
+        if max_workers <= 1 or len(player_ids) <= 1:
+            return {
+                player_id: self.recommend_best_settlements(game_state, player_id, strategy=strategy, top_k=top_k)
+                for player_id in player_ids
+            }
+        
+        results = {}
+        with ProcessPoolExecutor(max_workers=max_workers,
+                                 initializer=_init_recommendation_worker,
+                                 initargs=(self,)) as executor:
+            futures = {
+                executor.submit(_recommend_in_worker, game_state, player_id, strategy, top_k): player_id
+                for player_id in player_ids
+            }
+            for future in as_completed(futures):
+                results[futures[future]] = future.result()
+        
+        return {player_id: results[player_id] for player_id in player_ids}
+    
+    def _recommendation_cache_key(self, game_state: GameState, player_id: str,
+                                  strategy, top_k: int) -> Tuple:
+        """Build a hashable key from every input that affects vertex scoring."""
+        return (
+            self.board.fingerprint(),
+            frozenset(game_state.occupied_vertices),
+            player_id,
+            tuple(game_state.get_player_settlements(player_id)),
+            tuple(game_state.turn_order),
+            strategy,
+            top_k,
+            tuple(sorted(self.scorer.weights.items()))
+        )
     
     def analyze_player_position(self, game_state: GameState, player_id: str) -> Dict:
         """
@@ -86,64 +210,82 @@ class SettlementRecommender:
         Returns:
             Dictionary with analysis results
         """
-        if player_id not in game_state.players:
+        if player_id not in range(game_state.num_players):
             return {"error": f"Player {player_id} not found in game state"}
         
-        player = game_state.players[player_id]
-        
-        # Calculate current resource production
-        total_production = 0.0
-        resource_production = {}
-        
-        for settlement_id in player.settlements:
-            vertex_info = self.vertex_manager.get_vertex_info(settlement_id)
-            if vertex_info:
-                for hex_id in vertex_info.adjacent_hexes:
-                    hex_tile = self.board.get_hex(hex_id)
-                    if hex_tile and hex_tile.resource:
-                        prob = self.board.get_dice_probability(hex_tile.number)
-                        multiplier = 2 if settlement_id in player.cities else 1
-                        
-                        if hex_tile.resource not in resource_production:
-                            resource_production[hex_tile.resource] = 0.0
-                        resource_production[hex_tile.resource] += prob * multiplier
-                        total_production += prob * multiplier
-        
-        # Analyze turn order position
-        turn_position = None
-        turn_advantage = "unknown"
-        if game_state.turn_order and player_id in game_state.turn_order:
-            turn_position = game_state.turn_order.index(player_id) + 1
-            total_players = len(game_state.turn_order)
-            if turn_position <= total_players // 3:
-                turn_advantage = "early"
-            elif turn_position > 2 * total_players // 3:
-                turn_advantage = "late"
-            else:
-                turn_advantage = "middle"
-        
-        # Count harbor access
-        harbor_count = 0
-        harbor_types = []
-        for settlement_id in player.settlements:
-            harbor = self.board.get_harbor_at_vertex(settlement_id)
-            if harbor:
-                harbor_count += 1
-                harbor_types.append(harbor.type.value)
+        return self._analyze_players(game_state, [player_id])[player_id]
+    
+    def _analyze_players(self, game_state: GameState, player_ids: List[int]) -> Dict[int, Dict]:
+        """
+        Build analyze_player_position results for several existing players at once.
         
-        return {
-            "player_id": player_id,
-            "settlements": len(player.settlements),
-            "cities": len(player.cities),
-            "roads": len(player.roads),
-            "total_production": round(total_production, 2),
-            "resource_production": {str(k): round(v, 2) for k, v in resource_production.items()},
-            "harbor_count": harbor_count,
-            "harbor_types": harbor_types,
-            "turn_position": turn_position,
-            "turn_advantage": turn_advantage,
-            "recommended_strategy": self.strategy_analyzer.recommend_strategy()
-        }
+        Production for every player is one (players x vertices) incidence
+        matrix product with the per-vertex probability table, and the
+        board strategy is looked up once for all players.
+        """
+        vertices = self.vertex_manager.vertices
+        probability = self.vertex_manager.resource_arrays().probability
+        
+        # Incidence weights: settlements produce once, cities twice
+        player_structures = []
+        incidence = np.zeros((len(player_ids), probability.shape[0]))
+        for row, player_id in enumerate(player_ids):
+            structures = game_state.get_player_structures(player_id)
+            settlements = [v for v in structures['settlements'] if v in vertices]
+            cities = [v for v in structures['cities'] if v in vertices]
+            incidence[row, settlements] = 1
+            incidence[row, cities] = 2
+            player_structures.append((settlements, cities, len(structures['roads'])))
+        production = incidence @ probability
+        totals = production.sum(axis=1)
+        
+        recommended_strategy = self.strategy_analyzer.recommend_strategy()
+        
+        analyses = {}
+        for row, player_id in enumerate(player_ids):
+            settlements, cities, road_count = player_structures[row]
+            
+            # Analyze turn order position
+            turn_position = None
+            turn_advantage = "unknown"
+            if game_state.turn_order and player_id in game_state.turn_order:
+                turn_position = game_state.turn_order.index(player_id) + 1
+                total_players = len(game_state.turn_order)
+                if turn_position <= total_players // 3:
+                    turn_advantage = "early"
+                elif turn_position > 2 * total_players // 3:
+                    turn_advantage = "late"
+                else:
+                    turn_advantage = "middle"
+            
+            # Count harbor access
+            harbor_count = 0
+            harbor_types = []
+            for settlement_id in settlements + cities:
+                harbor = self.board.get_harbor_at_vertex(settlement_id)
+                if harbor:
+                    harbor_count += 1
+                    harbor_types.append(harbor.type.value)
+            
+            analyses[player_id] = {
+                "player_id": player_id,
+                "settlements": len(settlements),
+                "cities": len(cities),
+                "roads": road_count,
+                "total_production": round(float(totals[row]), 2),
+                "resource_production": {
+                    resource.value: round(float(production[row, code]), 2)
+                    for code, resource in enumerate(RESOURCE_ORDER)
+                    if production[row, code] > 0
+                },
+                "harbor_count": harbor_count,
+                "harbor_types": harbor_types,
+                "turn_position": turn_position,
+                "turn_advantage": turn_advantage,
+                "recommended_strategy": recommended_strategy
+            }
+        
+        return analyses
     
     def compare_players(self, game_state: GameState) -> Dict:
         """
@@ -155,26 +297,20 @@ class SettlementRecommender:
         Returns:
             Dictionary with comparative analysis
         """
-        player_analyses = {}
-        for player_id in game_state.players:
-            player_analyses[player_id] = self.analyze_player_position(game_state, player_id)
-        
-        # Find leaders in various categories
-        leaders = {
-            "most_settlements": max(player_analyses.keys(), 
-                                  key=lambda p: player_analyses[p]["settlements"]),
-            "most_cities": max(player_analyses.keys(), 
-                             key=lambda p: player_analyses[p]["cities"]),
-            "most_production": max(player_analyses.keys(), 
-                                 key=lambda p: player_analyses[p]["total_production"]),
-            "most_harbors": max(player_analyses.keys(), 
-                              key=lambda p: player_analyses[p]["harbor_count"])
-        }
+        player_analyses = self._analyze_players(game_state, list(range(game_state.num_players)))
+        
+        # Find leaders in every category in one pass; ties go to the earlier player
+        best = {category: (None, -1) for category in _LEADER_METRICS}
+        for player_id, analysis in player_analyses.items():
+            for category, metric in _LEADER_METRICS.items():
+                if analysis[metric] > best[category][1]:
+                    best[category] = (player_id, analysis[metric])
+        leaders = {category: leader for category, (leader, _) in best.items()}
         
         return {
             "players": player_analyses,
             "leaders": leaders,
-            "total_players": len(game_state.players),
+            "total_players": game_state.num_players,
             "turn_order": game_state.turn_order
         }
     
@@ -191,6 +327,28 @@ class SettlementRecommender:
         Returns:
             Formatted text report
         """
+        # Reports for an equivalent position are reused as-is
+        cache_key = (
+            self.board.fingerprint(),
+            game_state.canonical_key(),
+            player_id,
+            top_k,
+            tuple(sorted(self.scorer.weights.items()))
+        )
+        cached = self._report_cache.get(cache_key)
+        if cached is not None:
+            self._report_cache.move_to_end(cache_key)
+            return cached
+        
+        report = self._build_recommendation_report(game_state, player_id, top_k)
+        
+        self._report_cache[cache_key] = report
+        if len(self._report_cache) > RECOMMENDATION_CACHE_SIZE:
+            self._report_cache.popitem(last=False)
+        return report
+    
+    def _build_recommendation_report(self, game_state: GameState, player_id: str, top_k: int) -> str:
+        """Build the recommendation report text from scratch."""
         recommendations = self.recommend_best_settlements(game_state, player_id, top_k=top_k)
         analysis = self.analyze_player_position(game_state, player_id)
         
@@ -8,18 +8,153 @@ development focus, robber penalty, blocking strategy, and harbor access.
 """
 
 import math
-from typing import Dict, List, Set, Tuple, Optional
-from collections import defaultdict, Counter
+import weakref
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, NamedTuple, Set, Tuple, Optional
+from collections import defaultdict, Counter, OrderedDict
 from dataclasses import dataclass
 
-from .board import CatanBoard, ResourceType
+import numpy as np
+
+from .board import CatanBoard, ResourceType, RESOURCE_CODE, RESOURCE_ORDER, _NUMBA_AVAILABLE, numba
+from .harbors import HarborType
 from .vertices import VertexManager
 from .state import GameState
 
+# Strategies understood by the scoring system
+STRATEGIES = ('balanced', 'road_focused', 'dev_focused', 'city_focused')
+
+# Display names for strategies, e.g. 'road_focused' -> 'Road Focused'
+PRETTY_STRATEGY: Dict[str, str] = {strategy: strategy.replace('_', ' ').title() for strategy in STRATEGIES}
+
+# Producing resources by vertex_info name; desert and unknown names are absent
+_PRODUCING_RESOURCE_BY_NAME: Dict[str, ResourceType] = {
+    resource.value: resource for resource in ResourceType if resource is not ResourceType.DESERT
+}
+
+# Maximum number of memoized vertex rankings per scorer
+RANKING_CACHE_SIZE = 2048
+
+# Scorer copy held by each worker process in rank_vertices
+_worker_scorer = None
+
+
+def _init_scoring_worker(scorer: 'SettlementScorer') -> None:
+    """Install the scorer once per worker process."""
+    global _worker_scorer
+    _worker_scorer = scorer
+
+
+def _score_in_worker(vertex_ids: List[int], game_state: GameState, player_id: int, strategy: str,
+                     settlement_number: Optional[int]) -> List['ScoreBreakdown']:
+    """Score a chunk of vertices on the worker's scorer."""
+    score_vertex = _worker_scorer.score_vertex
+    return [score_vertex(vertex_id, game_state, player_id, strategy, settlement_number) for vertex_id in vertex_ids]
+
+
+class _VertexFeatures(NamedTuple):
+    """Strategy- and state-independent scoring inputs, one row per vertex ID."""
+    slot_probability: np.ndarray  # (V, S) non-desert resource probabilities in get_vertex_info order, 0.0 padded
+    slot_code: np.ndarray         # (V, S) resource code of each slot, 0 padded
+    balance: np.ndarray           # (V,) _calculate_balance_score
+    road: np.ndarray              # (V,) _calculate_road_score
+    dev: np.ndarray               # (V,) _calculate_dev_score
+    robber_hits: np.ndarray       # (V,) uint8 count of 6 and 8 tokens on incident hexes (0-3)
+
+
+# Order of the weights array passed to the batch scoring kernels
+_WEIGHT_ORDER = ('production', 'balance', 'road', 'dev', 'robber', 'blocking', 'harbor')
+
+
+def _combine_batch_scores_loop(ids, slot_probability, slot_code, balance, road, dev, robber_hits,
+                               adjacency_indptr, adjacency_indices, occupied, harbor, synergy,
+                               preferences, weights, turn_multiplier, settlement_multiplier):
+    """
+    Score a batch of vertices, one vertex at a time.
+    
+    Written as plain loops over arrays so numba can compile it. Operations
+    follow score_vertex's order, so results match it exactly; this is also
+    why the kernel is not compiled with fastmath.
+    
+    Returns:
+        (total, production, blocking) arrays aligned with ids
+    """
+    n = ids.shape[0]
+    total = np.empty(n)
+    production = np.empty(n)
+    blocking = np.empty(n)
+    
+    for i in range(n):
+        v = ids[i]
+        
+        p = 0.0
+        for slot in range(slot_probability.shape[1]):
+            p += slot_probability[v, slot] * preferences[slot_code[v, slot]] * 100
+        
+        neighbours = 0
+        for k in range(adjacency_indptr[v], adjacency_indptr[v + 1]):
+            if occupied[adjacency_indices[k]]:
+                neighbours += 1
+        b = neighbours * 5.0
+        
+        total[i] = (
+            weights[0] * p +
+            weights[1] * balance[v] +
+            weights[2] * road[v] +
+            weights[3] * dev[v] +
+            weights[4] * (robber_hits[v] * 5.0) +
+            weights[5] * b +
+            weights[6] * harbor[i] +
+            synergy[i]
+        ) * turn_multiplier * settlement_multiplier
+        production[i] = p
+        blocking[i] = b
+    
+    return total, production, blocking
+
+
+def _combine_batch_scores_numpy(ids, slot_probability, slot_code, balance, road, dev, robber_hits,
+                                adjacency_indptr, adjacency_indices, occupied, harbor, synergy,
+                                preferences, weights, turn_multiplier, settlement_multiplier):
+    """Score a batch of vertices with whole-array NumPy expressions."""
+    # Production: preference-weighted probabilities, accumulated in get_vertex_info order
+    slot_probability = slot_probability[ids]
+    slot_code = slot_code[ids]
+    production = np.zeros(len(ids))
+    for slot in range(slot_probability.shape[1]):
+        production += slot_probability[:, slot] * preferences[slot_code[:, slot]] * 100
+    
+    # Occupied neighbors per vertex: running count over the CSR edge list, differenced per row
+    occupied_edges = np.zeros(len(adjacency_indices) + 1, dtype=np.intp)
+    np.cumsum(occupied[adjacency_indices], out=occupied_edges[1:])
+    blocking = (occupied_edges[adjacency_indptr[ids + 1]] - occupied_edges[adjacency_indptr[ids]]) * 5.0
+    
+    total = (
+        weights[0] * production +
+        weights[1] * balance[ids] +
+        weights[2] * road[ids] +
+        weights[3] * dev[ids] +
+        weights[4] * (robber_hits[ids] * 5.0) +
+        weights[5] * blocking +
+        weights[6] * harbor +
+        synergy
+    ) * turn_multiplier * settlement_multiplier
+    
+    return total, production, blocking
+
+
+if _NUMBA_AVAILABLE:
+    _combine_batch_scores = numba.njit(cache=True)(_combine_batch_scores_loop)
+else:
+    _combine_batch_scores = _combine_batch_scores_numpy
+
 
 @dataclass
 class ScoreBreakdown:
     """Detailed breakdown of settlement scoring factors."""
+    __slots__ = ('vertex_id', 'total_score', 'production_score', 'balance_score', 'road_score',
+                 'dev_score', 'robber_penalty', 'blocking_score', 'harbor_score')
+    
     vertex_id: int
     total_score: float
     production_score: float
@@ -45,9 +180,39 @@ class ScoreBreakdown:
         }
 
 
+class _BatchScores(NamedTuple):
+    """Scores for a list of vertices, as arrays aligned with vertex_ids."""
+    vertex_ids: List[int]
+    total: np.ndarray
+    production: np.ndarray
+    balance: np.ndarray
+    road: np.ndarray
+    dev: np.ndarray
+    robber: np.ndarray
+    blocking: np.ndarray
+    harbor: np.ndarray
+    
+    def breakdown(self, i: int) -> ScoreBreakdown:
+        """Build the ScoreBreakdown for the i-th vertex."""
+        return ScoreBreakdown(
+            vertex_id=self.vertex_ids[i],
+            total_score=float(self.total[i]),
+            production_score=float(self.production[i]),
+            balance_score=float(self.balance[i]),
+            road_score=float(self.road[i]),
+            dev_score=float(self.dev[i]),
+            robber_penalty=float(self.robber[i]),
+            blocking_score=float(self.blocking[i]),
+            harbor_score=float(self.harbor[i])
+        )
+
+
 class SettlementScorer:
     """Advanced scoring system for settlement placement evaluation."""
     
+    # Shared scorers keyed on (id(board), id(vertex_manager)); see for_board
+    _shared: "weakref.WeakValueDictionary[Tuple[int, int], SettlementScorer]" = weakref.WeakValueDictionary()
+    
     def __init__(self, board: CatanBoard, vertex_manager: VertexManager):
         """
         Initialize the scoring system.
@@ -58,6 +223,8 @@ class SettlementScorer:
         """
         self.board = board
         self.vertex_manager = vertex_manager
+        self._ranking_cache: "OrderedDict[Tuple, List[ScoreBreakdown]]" = OrderedDict()
+        self._features_cache: Optional[Tuple[Tuple, _VertexFeatures]] = None  # (fingerprint, features)
         
         # Default scoring weights
         self.weights = {
@@ -102,6 +269,30 @@ class SettlementScorer:
             }
         }
     
+    @classmethod
+    def for_board(cls, board: CatanBoard, vertex_manager: VertexManager) -> 'SettlementScorer':
+        """
+        Get the shared scorer for a board and vertex manager.
+        
+        Recommenders built on the same board reuse one scorer instead of
+        constructing their own. The scorer is dropped once nothing else
+        references it. Weights set on it would be visible to every holder,
+        so callers that need custom weights should use a private scorer.
+        
+        Args:
+            board: The Catan board
+            vertex_manager: Vertex manager for the board
+        
+        Returns:
+            SettlementScorer for this board
+        """
+        key = (id(board), id(vertex_manager))
+        scorer = cls._shared.get(key)
+        if scorer is None or scorer.board is not board or scorer.vertex_manager is not vertex_manager:
+            scorer = cls(board, vertex_manager)
+            cls._shared[key] = scorer
+        return scorer
+    
     def set_weights(self, weights: Dict[str, float]) -> None:
         """Update scoring weights."""
         self.weights.update(weights)
@@ -121,12 +312,109 @@ class SettlementScorer:
         Returns:
             ScoreBreakdown with detailed scoring information
         """
-        if vertex_id not in self.vertex_manager.vertices:
+        components = self.score_vertex_components(vertex_id, game_state, player_id, settlement_number)
+        if components is None:
             return ScoreBreakdown(vertex_id, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0)
         
+        return self.combine_components(vertex_id, components, strategy)
+    
+    def score_vertex_strategies(self, vertex_id: int, game_state: GameState, player_id: int,
+                                strategies: Tuple[str, ...] = STRATEGIES,
+                                settlement_number: int = None) -> Dict[str, ScoreBreakdown]:
+        """
+        Score a vertex under several strategies at once.
+        
+        The strategy-independent components are computed a single time.
+        Production is then scored for every strategy at once against a
+        strategy x resource preference matrix, and totals are combined as
+        vectors over strategies.
+        
+        Args:
+            vertex_id: ID of the vertex to score
+            game_state: Current game state
+            player_id: ID of the player considering this placement
+            strategies: Strategies to evaluate
+            settlement_number: Which settlement (1, 2, etc.) - auto-detected if None
+        
+        Returns:
+            Dictionary mapping strategy name to ScoreBreakdown
+        """
+        components = self.score_vertex_components(vertex_id, game_state, player_id, settlement_number)
+        if components is None:
+            return {strategy: ScoreBreakdown(vertex_id, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0)
+                    for strategy in strategies}
+        
+        # Production per strategy: preference-weighted probabilities, accumulated
+        # in the same order as _calculate_production_score
+        preference_matrix = self._preference_matrix(strategies)
+        production = np.zeros(len(strategies))
+        for resource_name, resource_data in components['vertex_info']['resources'].items():
+            resource_type = _PRODUCING_RESOURCE_BY_NAME.get(resource_name)
+            if resource_type is None:
+                continue  # Skip desert and invalid resource types
+            production += resource_data['probability'] * preference_matrix[:, resource_type.code] * 100
+        
+        harbor = np.array([self._calculate_harbor_score(vertex_id, strategy) for strategy in strategies])
+        settlement_multiplier = np.array([
+            self._calculate_settlement_number_bias(components['settlement_number'], strategy)
+            for strategy in strategies
+        ])
+        
+        totals = (
+            self.weights['production'] * production +
+            self.weights['balance'] * components['balance'] +
+            self.weights['road'] * components['road'] +
+            self.weights['dev'] * components['dev'] +
+            self.weights['robber'] * components['robber'] +
+            self.weights['blocking'] * components['blocking'] +
+            self.weights['harbor'] * harbor +
+            components['synergy']  # Synergy is already weighted internally
+        ) * components['turn_order_multiplier'] * settlement_multiplier
+        
+        return {
+            strategy: ScoreBreakdown(
+                vertex_id=vertex_id,
+                total_score=float(totals[i]),
+                production_score=float(production[i]),
+                balance_score=components['balance'],
+                road_score=components['road'],
+                dev_score=components['dev'],
+                robber_penalty=components['robber'],
+                blocking_score=components['blocking'],
+                harbor_score=float(harbor[i])
+            )
+            for i, strategy in enumerate(strategies)
+        }
+    
+    def _preference_matrix(self, strategies: Tuple[str, ...]) -> np.ndarray:
+        """Build a strategies x resource-code matrix of resource preferences."""
+        matrix = np.ones((len(strategies), len(RESOURCE_ORDER)))
+        for row, strategy in enumerate(strategies):
+            preferences = self.resource_preferences.get(strategy, self.resource_preferences['balanced'])
+            for resource, preference in preferences.items():
+                matrix[row, resource.code] = preference
+        return matrix
+    
+    def score_vertex_components(self, vertex_id: int, game_state: GameState,
+                                player_id: int, settlement_number: int = None) -> Optional[Dict]:
+        """
+        Compute the strategy-independent scoring components for a vertex.
+        
+        Args:
+            vertex_id: ID of the vertex to score
+            game_state: Current game state
+            player_id: ID of the player considering this placement
+            settlement_number: Which settlement (1, 2, etc.) - auto-detected if None
+        
+        Returns:
+            Dictionary of raw components, or None if the vertex is unknown or illegal
+        """
+        if vertex_id not in self.vertex_manager.vertices:
+            return None
+        
         # Check if settlement placement is legal
         if not game_state.is_legal_settlement_placement(vertex_id, self.vertex_manager):
-            return ScoreBreakdown(vertex_id, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0)
+            return None
         
         # Auto-detect settlement number if not provided
         if settlement_number is None:
@@ -134,48 +422,61 @@ class SettlementScorer:
         
         vertex_info = self.vertex_manager.get_vertex_info(vertex_id)
         if not vertex_info:
-            return ScoreBreakdown(vertex_id, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0)
+            return None
         
         # Get player's existing settlements for synergy analysis
         existing_settlements = game_state.get_player_settlements(player_id)
         
-        # Calculate individual score components
-        production_score = self._calculate_production_score(vertex_info, strategy)
-        balance_score = self._calculate_balance_score(vertex_info)
-        road_score = self._calculate_road_score(vertex_id, game_state, vertex_info)
-        dev_score = self._calculate_dev_score(vertex_info)
-        robber_penalty = self._calculate_robber_penalty(vertex_info)
-        blocking_score = self._calculate_blocking_score(vertex_id, game_state)
-        harbor_score = self._calculate_harbor_score(vertex_id, strategy)
+        return {
+            'vertex_info': vertex_info,
+            'settlement_number': settlement_number,
+            'balance': self._calculate_balance_score(vertex_info),
+            'road': self._calculate_road_score(vertex_id, game_state, vertex_info),
+            'dev': self._calculate_dev_score(vertex_info),
+            'robber': self._calculate_robber_penalty(vertex_info),
+            'blocking': self._calculate_blocking_score(vertex_id, game_state),
+            # Calculate settlement synergy (for 2nd+ settlements)
+            'synergy': self._calculate_settlement_synergy(vertex_id, existing_settlements, settlement_number),
+            'turn_order_multiplier': self._calculate_turn_order_bias(player_id, game_state)
+        }
+    
+    def combine_components(self, vertex_id: int, components: Dict, strategy: str) -> ScoreBreakdown:
+        """
+        Combine precomputed components into a strategy-specific score.
         
-        # Calculate settlement synergy (for 2nd+ settlements)
-        synergy_score = self._calculate_settlement_synergy(vertex_id, existing_settlements, settlement_number)
+        Args:
+            vertex_id: ID of the scored vertex
+            components: Output of score_vertex_components
+            strategy: Strategy preference
         
-        # Apply settlement-specific and turn order biases
-        turn_order_multiplier = self._calculate_turn_order_bias(player_id, game_state)
-        settlement_multiplier = self._calculate_settlement_number_bias(settlement_number, strategy)
+        Returns:
+            ScoreBreakdown with detailed scoring information
+        """
+        production_score = self._calculate_production_score(components['vertex_info'], strategy)
+        harbor_score = self._calculate_harbor_score(vertex_id, strategy)
+        settlement_multiplier = self._calculate_settlement_number_bias(components['settlement_number'], strategy)
         
         # Combine scores with weights
         total_score = (
             self.weights['production'] * production_score +
-            self.weights['balance'] * balance_score +
-            self.weights['road'] * road_score +
-            self.weights['dev'] * dev_score +
-            self.weights['robber'] * robber_penalty +
-            self.weights['blocking'] * blocking_score +
+            self.weights['balance'] * components['balance'] +
+            self.weights['road'] * components['road'] +
+            self.weights['dev'] * components['dev'] +
+            self.weights['robber'] * components['robber'] +
+            self.weights['blocking'] * components['blocking'] +
             self.weights['harbor'] * harbor_score +
-            synergy_score  # Synergy is already weighted internally
-        ) * turn_order_multiplier * settlement_multiplier
+            components['synergy']  # Synergy is already weighted internally
+        ) * components['turn_order_multiplier'] * settlement_multiplier
         
         return ScoreBreakdown(
             vertex_id=vertex_id,
             total_score=total_score,
             production_score=production_score,
-            balance_score=balance_score,
-            road_score=road_score,
-            dev_score=dev_score,
-            robber_penalty=robber_penalty,
-            blocking_score=blocking_score,
+            balance_score=components['balance'],
+            road_score=components['road'],
+            dev_score=components['dev'],
+            robber_penalty=components['robber'],
+            blocking_score=components['blocking'],
             harbor_score=harbor_score
         )
     
@@ -186,19 +487,15 @@ class SettlementScorer:
         total_score = 0.0
         
         for resource_name, resource_data in vertex_info['resources'].items():
-            if resource_name == 'desert':
-                continue
+            resource_type = _PRODUCING_RESOURCE_BY_NAME.get(resource_name)
+            if resource_type is None:
+                continue  # Skip desert and invalid resource types
+            
+            preference = preferences.get(resource_type, 1.0)
+            probability = resource_data['probability']
             
-            try:
-                resource_type = ResourceType(resource_name)
-                preference = preferences.get(resource_type, 1.0)
-                probability = resource_data['probability']
-                
-                # Score = probability * preference, scaled to reasonable range
-                total_score += probability * preference * 100
-                
-            except ValueError:
-                continue  # Skip invalid resource types
+            # Score = probability * preference, scaled to reasonable range
+            total_score += probability * preference * 100
         
         return total_score
     
@@ -252,32 +549,28 @@ class SettlementScorer:
     
     def _calculate_robber_penalty(self, vertex_info: Dict) -> float:
         """Calculate penalty for being vulnerable to robber (6s and 8s)."""
-        penalty = 0.0
-        
+        # Count the 6 and 8 tokens with list.count instead of testing every number
+        hits = 0
         for resource_data in vertex_info['resources'].values():
-            for number in resource_data.get('numbers', []):
-                if number in (6, 8):
-                    penalty += 5.0  # Penalty for each 6 or 8
+            numbers = resource_data.get('numbers', [])
+            hits += numbers.count(6) + numbers.count(8)
         
-        return penalty
+        return hits * 5.0  # Penalty for each 6 or 8
     
     def _calculate_blocking_score(self, vertex_id: int, game_state: GameState) -> float:
         """Calculate score for blocking opponents."""
-        # Simple heuristic: higher score if this vertex is near opponent settlements
-        blocking_score = 0.0
-        
-        adjacent_vertices = self.vertex_manager.adjacency.get(vertex_id, set())
-        
-        # Check for nearby opponent structures
-        for adj_vertex in adjacent_vertices:
-            structure = game_state.get_structure_at_vertex(adj_vertex)
-            if structure:
-                blocking_score += 5.0  # Bonus for being near opponent structures
-        
-        return blocking_score
+        # Simple heuristic: higher score if this vertex is near opponent settlements.
+        # Every settlement or city vertex is in occupied_vertices, so membership
+        # replaces a structure lookup per neighbor
+        occupied = game_state.occupied_vertices
+        nearby_structures = sum(1 for adj_vertex in self.vertex_manager.adjacency.get(vertex_id, ())
+                                if adj_vertex in occupied)
+        
+        return nearby_structures * 5.0  # Bonus for being near opponent structures
     
     def rank_vertices(self, game_state: GameState, strategy: str = 'balanced',
-                     player_id: int = 0, top_k: int = 10, settlement_number: int = None) -> List[ScoreBreakdown]:
+                     player_id: int = 0, top_k: int = 10, settlement_number: int = None,
+                     max_workers: Optional[int] = None) -> List[ScoreBreakdown]:
         """
         Rank all legal vertices for settlement placement.
         
@@ -287,21 +580,189 @@ class SettlementScorer:
             player_id: ID of the player making the placement
             top_k: Number of top candidates to return
             settlement_number: Which settlement number this is for the player (1st, 2nd, etc.)
+            max_workers: Worker processes to spread vertex scoring over; None or 1
+                scores in this process, which is faster for a standard board
         
         Returns:
             List of ScoreBreakdown objects, sorted by score (highest first)
         """
-        legal_vertices = self.vertex_manager.get_legal_vertices(game_state.occupied_vertices)
+        # Equivalent game states (same structures and turn order) share a ranking
+        cache_key = (
+            self.board.fingerprint(),
+            game_state.canonical_key(),
+            strategy,
+            player_id,
+            top_k,
+            settlement_number,
+            tuple(sorted(self.weights.items()))
+        )
+        cached = self._ranking_cache.get(cache_key)
+        if cached is not None:
+            self._ranking_cache.move_to_end(cache_key)
+            return list(cached)
+        
+        legal_vertices = list(self.vertex_manager.get_legal_vertices(game_state.occupied_vertices))
+        
+        if max_workers is not None and max_workers > 1 and len(legal_vertices) > 1:
+            scores = self._score_in_parallel(legal_vertices, game_state, player_id, strategy,
+                                             settlement_number, max_workers)
+            totals = np.fromiter((s.total_score for s in scores), dtype=float, count=len(scores))
+            # Sort by total score (descending), only fully ordering the top-k candidates
+            ranked = [scores[i] for i in self._top_k_order(totals, top_k)]
+        else:
+            # Score every legal vertex as arrays and only build breakdowns for the top-k
+            batch = self._score_vertex_batch(legal_vertices, game_state, player_id, strategy, settlement_number,
+                                             fingerprint=cache_key[0])
+            ranked = [batch.breakdown(i) for i in self._top_k_order(batch.total, top_k)]
+        
+        self._ranking_cache[cache_key] = ranked
+        if len(self._ranking_cache) > RANKING_CACHE_SIZE:
+            self._ranking_cache.popitem(last=False)
+        return list(ranked)
+    
+    def _score_in_parallel(self, vertex_ids: List[int], game_state: GameState, player_id: int, strategy: str,
+                           settlement_number: Optional[int], max_workers: int) -> List[ScoreBreakdown]:
+        """
+        Score vertices in contiguous chunks across worker processes.
         
-        scores = []
-        for vertex_id in legal_vertices:
-            score = self.score_vertex(vertex_id, game_state, strategy, settlement_number)
-            scores.append(score)
+        The scorer is shipped to each worker once through the pool initializer,
+        and chunks are collected in order, so the result matches serial scoring.
+        """
+        max_workers = min(max_workers, len(vertex_ids))
+        chunk_size = -(-len(vertex_ids) // max_workers)  # ceiling division
+        chunks = [vertex_ids[i:i + chunk_size] for i in range(0, len(vertex_ids), chunk_size)]
+        
+        with ProcessPoolExecutor(max_workers=max_workers,
+                                 initializer=_init_scoring_worker,
+                                 initargs=(self,)) as executor:
+            chunk_scores = executor.map(_score_in_worker, chunks,
+                                        [game_state] * len(chunks),
+                                        [player_id] * len(chunks),
+                                        [strategy] * len(chunks),
+                                        [settlement_number] * len(chunks))
+            return [score for chunk in chunk_scores for score in chunk]
+    
+    def _score_vertex_batch(self, vertex_ids: List[int], game_state: GameState, player_id: int,
+                            strategy: str = 'balanced', settlement_number: int = None,
+                            fingerprint: Optional[Tuple] = None) -> _BatchScores:
+        """
+        Score many legal vertices at once, matching score_vertex for each.
+        
+        The board-only components come from the cached vertex feature table
+        and are combined by the batch kernel (numba when installed) in the
+        same operation order as score_vertex, so every score is bit-for-bit
+        identical to it.
+        
+        Args:
+            vertex_ids: Legal vertex IDs to score
+            game_state: Current game state
+            player_id: ID of the player considering this placement
+            strategy: Strategy preference
+            settlement_number: Which settlement (1, 2, etc.) - auto-detected if None
+            fingerprint: Board fingerprint, if the caller already has it
+        
+        Returns:
+            _BatchScores aligned with vertex_ids
+        """
+        features = self._vertex_features(fingerprint)
+        ids = np.array(vertex_ids, dtype=np.intp)
+        
+        if settlement_number is None:
+            settlement_number = game_state.get_next_settlement_number(player_id)
         
-        # Sort by total score (descending)
-        scores.sort(key=lambda x: x.total_score, reverse=True)
+        harbor_score = self._calculate_harbor_score
+        harbor = np.array([harbor_score(vertex_id, strategy) for vertex_id in vertex_ids], dtype=float)
         
-        return scores[:top_k]
+        existing_settlements = game_state.get_player_settlements(player_id)
+        if existing_settlements and settlement_number != 1:
+            vertex_infos = self.vertex_manager.vertex_infos()
+            synergy = np.array([
+                self._calculate_settlement_synergy(vertex_id, existing_settlements, settlement_number, vertex_infos)
+                for vertex_id in vertex_ids
+            ], dtype=float)
+        else:
+            synergy = np.zeros(len(ids))
+        
+        weights = np.array([self.weights[name] for name in _WEIGHT_ORDER], dtype=float)
+        total, production, blocking = _combine_batch_scores(
+            ids, features.slot_probability, features.slot_code,
+            features.balance, features.road, features.dev, features.robber_hits,
+            self.vertex_manager.adjacency_indptr, self.vertex_manager.adjacency_indices,
+            self.vertex_manager.occupied_mask(game_state.occupied_vertices),
+            harbor, synergy, self._preference_matrix((strategy,))[0], weights,
+            self._calculate_turn_order_bias(player_id, game_state),
+            self._calculate_settlement_number_bias(settlement_number, strategy)
+        )
+        
+        return _BatchScores(vertex_ids, total, production, features.balance[ids], features.road[ids],
+                            features.dev[ids], features.robber_hits[ids] * 5.0, blocking, harbor)
+    
+    def _vertex_features(self, fingerprint: Optional[Tuple] = None) -> _VertexFeatures:
+        """Get the vertex feature table, rebuilt whenever the board fingerprint changes."""
+        if fingerprint is None:
+            fingerprint = self.board.fingerprint()
+        if self._features_cache is None or self._features_cache[0] != fingerprint:
+            self._features_cache = (fingerprint, self._build_vertex_features())
+        return self._features_cache[1]
+    
+    def _build_vertex_features(self) -> _VertexFeatures:
+        """Precompute the board-only scoring components for every vertex."""
+        vertex_manager = self.vertex_manager
+        arrays = vertex_manager.resource_arrays()
+        probability = arrays.probability
+        present = arrays.present
+        n = len(vertex_manager.vertices)
+        
+        width = max((len(vertex.incident_hexes) for vertex in vertex_manager.vertices.values()), default=0)
+        slot_probability = np.zeros((n, width))
+        slot_code = np.zeros((n, width), dtype=np.intp)
+        robber_hits = np.zeros(n, dtype=np.uint8)
+        tiles = self.board.tiles
+        desert = RESOURCE_CODE[ResourceType.DESERT]
+        for vertex_id, vertex in vertex_manager.vertices.items():
+            seen = {desert}
+            for hex_coord in vertex.incident_hexes:
+                tile = tiles.get(hex_coord)
+                if tile is None:
+                    continue
+                if tile.number in (6, 8):
+                    robber_hits[vertex_id] += 1
+                code = RESOURCE_CODE[tile.resource]
+                if code not in seen:
+                    slot = len(seen) - 1
+                    slot_code[vertex_id, slot] = code
+                    slot_probability[vertex_id, slot] = probability[vertex_id, code]
+                    seen.add(code)
+        
+        num_resources = np.delete(present, desert, axis=1).sum(axis=1)
+        balance = np.select([num_resources >= 3, num_resources == 2, num_resources == 1], [20.0, 10.0, 2.0], 0.0)
+        
+        # Absent resources have probability 0.0, so they add exactly nothing
+        wood, brick, sheep, wheat, ore = (RESOURCE_CODE[r] for r in (
+            ResourceType.WOOD, ResourceType.BRICK, ResourceType.SHEEP, ResourceType.WHEAT, ResourceType.ORE))
+        adjacent_count = np.array([len(vertex_manager.adjacency[v]) for v in range(n)], dtype=float)
+        road = adjacent_count * 2.0 + (probability[:, wood] * 50 + probability[:, brick] * 50)
+        dev = probability[:, ore] * 30 + probability[:, wheat] * 30 + probability[:, sheep] * 30
+        
+        return _VertexFeatures(slot_probability, slot_code, balance, road, dev, robber_hits)
+    
+    @staticmethod
+    def _top_k_order(totals: np.ndarray, top_k: int) -> List[int]:
+        """
+        Get indices of the top-k scores, highest first.
+        
+        Equal scores keep their input order, matching a stable descending sort.
+        """
+        n = len(totals)
+        if 0 < top_k < n:
+            # Everything at or above the k-th largest score is a candidate
+            kth_largest = np.partition(totals, n - top_k)[n - top_k]
+            candidates = np.flatnonzero(totals >= kth_largest)
+        else:
+            candidates = np.arange(n)
+        
+        order = candidates[np.argsort(-totals[candidates], kind='stable')]
+        return order.tolist()[:top_k]
     
     def _calculate_harbor_score(self, vertex_id: int, strategy: str) -> float:
         """
@@ -319,7 +780,7 @@ class SettlementScorer:
             return 0.0
         
         # Base score depends on harbor type
-        if harbor.type.value == "3:1":
+        if harbor.type is HarborType.GENERIC:
             base_score = 15.0  # Generic harbors are generally useful
         else:
             base_score = 25.0  # Specific resource harbors are more valuable
@@ -346,15 +807,10 @@ class SettlementScorer:
     
     def compare_strategies(self, vertex_id: int, game_state: GameState, player_id: str) -> Dict[str, ScoreBreakdown]:
         """Compare how different strategies score the same vertex."""
-        strategies = ['balanced', 'road_focused', 'dev_focused', 'city_focused']
-        
-        results = {}
-        for strategy in strategies:
-            results[strategy] = self.score_vertex(vertex_id, game_state, player_id, strategy)
-        
-        return results
+        return self.score_vertex_strategies(vertex_id, game_state, player_id)
     
-    def _calculate_settlement_synergy(self, vertex_id: int, existing_settlements: List[int], settlement_number: int) -> float:
+    def _calculate_settlement_synergy(self, vertex_id: int, existing_settlements: List[int], settlement_number: int,
+                                      vertex_infos: Optional[Dict[int, Dict]] = None) -> float:
         """
         Calculate how well this settlement complements existing ones.
         
@@ -362,6 +818,8 @@ class SettlementScorer:
             vertex_id: The vertex being considered
             existing_settlements: List of player's existing settlement vertices
             settlement_number: Which settlement number this would be
+            vertex_infos: Prebuilt VertexManager.vertex_infos table, or None to
+                look each vertex up
             
         Returns:
             Synergy bonus score
@@ -369,25 +827,28 @@ class SettlementScorer:
         if not existing_settlements or settlement_number == 1:
             return 0.0
         
+        get_vertex_info = self.vertex_manager.get_vertex_info if vertex_infos is None else vertex_infos.get
         synergy_score = 0.0
-        vertex_info = self.vertex_manager.get_vertex_info(vertex_id)
+        vertex_info = get_vertex_info(vertex_id)
         
         if not vertex_info:
             return 0.0
         
-        # Get new vertex resources and numbers
+        # Get new vertex resources and numbers (vertex info lists numbers per resource)
         new_resources = set(vertex_info['resources'].keys())
-        new_numbers = set(vertex_info['numbers'])
+        new_numbers = {number for resource_data in vertex_info['resources'].values()
+                       for number in resource_data['numbers']}
         
         # Aggregate existing resources and numbers
         existing_resources = set()
         existing_numbers = set()
         
         for existing_vertex in existing_settlements:
-            existing_info = self.vertex_manager.get_vertex_info(existing_vertex)
+            existing_info = get_vertex_info(existing_vertex)
             if existing_info:
                 existing_resources.update(existing_info['resources'].keys())
-                existing_numbers.update(existing_info['numbers'])
+                for resource_data in existing_info['resources'].values():
+                    existing_numbers.update(resource_data['numbers'])
         
         # Resource diversification bonus
         unique_resources = new_resources - existing_resources
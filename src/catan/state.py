@@ -38,6 +38,7 @@ class GameState:
         """
         self.num_players = num_players
         self.occupied_vertices: Set[int] = set()
+        self.occupied_bits: int = 0  # Bitmask mirror of occupied_vertices
         self.settlements: Dict[int, int] = {}  # vertex_id -> player_id
         self.cities: Dict[int, int] = {}       # vertex_id -> player_id
         self.roads: Set[Tuple[int, int]] = set()  # Set of (vertex1_id, vertex2_id) edges
@@ -74,6 +75,7 @@ class GameState:
         
         self.settlements[vertex_id] = player_id
         self.occupied_vertices.add(vertex_id)
+        self.occupied_bits |= 1 << vertex_id
         return True
     
     def add_city(self, vertex_id: int, player_id: int) -> bool:
@@ -128,6 +130,7 @@ class GameState:
         if vertex_id in self.settlements:
             del self.settlements[vertex_id]
             self.occupied_vertices.discard(vertex_id)
+            self.occupied_bits &= ~(1 << vertex_id)
             return True
         return False
     
@@ -136,6 +139,7 @@ class GameState:
         if vertex_id in self.cities:
             del self.cities[vertex_id]
             self.occupied_vertices.discard(vertex_id)
+            self.occupied_bits &= ~(1 << vertex_id)
             return True
         return False
     
@@ -211,17 +215,12 @@ class GameState:
         Returns:
             True if placement is legal, False otherwise
         """
-        # Check if vertex is already occupied
-        if self.is_vertex_occupied(vertex_id):
-            return False
-            
-        # Check distance rule (no adjacent settlements)
+        # Check occupancy and distance rule (no adjacent settlements) in one mask test
         if vertex_id in vertex_manager.vertices:
-            for neighbor_id in vertex_manager.adjacency.get(vertex_id, set()):
-                if self.is_vertex_occupied(neighbor_id):
-                    return False
-                    
-        return True
+            blocked = (1 << vertex_id) | vertex_manager.adjacency_masks[vertex_id]
+            return not (self.occupied_bits & blocked)
+        
+        return not self.is_vertex_occupied(vertex_id)
     
     def place_settlement_enhanced(self, player_id: int, vertex_id: int, settlement_number: int = None) -> bool:
         """
@@ -270,7 +269,8 @@ class GameState:
     
     def get_settlement_phase_info(self, player_id: int) -> Dict:
         """Get comprehensive info about current settlement phase for player."""
-        settlement_count = self.get_settlement_count(player_id)
+        settlements = self.player_settlements.get(player_id, [])
+        settlement_count = len(settlements)
         
         return {
             'settlement_count': settlement_count,
@@ -279,9 +279,29 @@ class GameState:
             'is_second_settlement': settlement_count == 1,
             'phase': self.current_phase,
             'placement_round': self.placement_round,
-            'existing_settlements': self.get_player_settlements(player_id)
+            'existing_settlements': settlements
         }
     
+    def canonical_key(self) -> Tuple:
+        """
+        Get a hashable key describing the board occupancy of this state.
+        
+        Two states with the same structures, per-player placement order and
+        turn order produce the same key regardless of how they were built,
+        so it can be used to memoize scoring across separate game states.
+        
+        Returns:
+            Tuple of (settlements, cities, roads, player_settlements, turn_order)
+        """
+        return (
+            tuple(sorted(self.settlements.items())),
+            tuple(sorted(self.cities.items())),
+            tuple(sorted(self.roads)),
+            tuple(sorted((player_id, tuple(settlements))
+                         for player_id, settlements in self.player_settlements.items())),
+            tuple(self.turn_order)
+        )
+    
     def get_game_summary(self) -> Dict:
         """Get a summary of the current game state."""
         summary = {
@@ -328,6 +348,9 @@ class GameState:
         state.settlements = data['settlements']
         state.cities = data['cities']
         state.occupied_vertices = set(state.settlements.keys()) | set(state.cities.keys())
+        state.occupied_bits = 0
+        for vertex_id in state.occupied_vertices:
+            state.occupied_bits |= 1 << int(vertex_id)
         state.roads = set(tuple(road) for road in data['roads'])
         state.player_roads = {
             int(k): set(tuple(road) for road in v) 
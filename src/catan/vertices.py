@@ -6,11 +6,14 @@ Handles vertex enumeration, deduplication, distance rule checks, and settlement
 """
 
 import math
-from typing import Dict, List, Set, Tuple, Optional
+from functools import cached_property, lru_cache
+from typing import Dict, List, NamedTuple, Set, Tuple, Optional
 from dataclasses import dataclass
 
-from .hex_coords import HexCoord, hex_corners, axial_to_pixel
-from .board import CatanBoard
+import numpy as np
+
+from .hex_coords import HexCoord, hex_corners_array, axial_to_pixel
+from .board import CatanBoard, RESOURCE_CODE, RESOURCE_ORDER
 
 
 @dataclass(frozen=True)
@@ -24,6 +27,13 @@ class Vertex:
         return hash(self.id)
 
 
+class VertexResourceArrays(NamedTuple):
+    """Struct-of-arrays view of the resources around each vertex, one row per vertex ID."""
+    probability: np.ndarray     # (V, len(RESOURCE_ORDER)) float64, summed per resource as in get_vertex_info
+    present: np.ndarray         # (V, len(RESOURCE_ORDER)) bool, resource has an incident tile
+    has_high_prob: np.ndarray   # (V,) bool, an incident tile carries a 6 or 8
+
+
 class VertexManager:
     """Manages all vertices on the Catan board and settlement placement rules."""
     
@@ -40,22 +50,43 @@ class VertexManager:
         self.vertices: Dict[int, Vertex] = {}
         self.position_to_vertex: Dict[Tuple[float, float], int] = {}
         self.adjacency: Dict[int, Set[int]] = {}  # vertex_id -> set of adjacent vertex_ids
+        self.adjacency_matrix: np.ndarray = np.zeros((0, 0), dtype=bool)
+        self.adjacency_masks: List[int] = []  # vertex_id -> bitmask of adjacent vertex_ids
+        # CSR adjacency: neighbors of v are adjacency_indices[adjacency_indptr[v]:adjacency_indptr[v + 1]]
+        self.adjacency_indptr: np.ndarray = np.zeros(1, dtype=np.intp)
+        self.adjacency_indices: np.ndarray = np.zeros(0, dtype=np.intp)
+        self._resource_arrays_cache: Optional[Tuple[Tuple, VertexResourceArrays]] = None  # (tile state key, arrays)
+        self._vertex_info_cache: Optional[Tuple[Tuple, Dict[int, Dict]]] = None  # (tile state key, infos)
         
+        self._hex_corner_positions = self._rounded_hex_corners()
         self._discover_vertices()
         self._build_adjacency()
+        self._build_adjacency_matrix()
+        self._build_adjacency_masks()
+        self._build_adjacency_csr()
+    
+    def _rounded_hex_corners(self) -> List[Tuple[HexCoord, List[Tuple[float, float]]]]:
+        """
+        Compute every hex's corner positions in one vectorized pass.
+        
+        Corners are rounded to the tolerance grid to handle floating point
+        precision, so shared corners of neighboring hexes compare equal.
+        
+        Returns:
+            List of (hex_coord, rounded corner positions) in board.hexes order
+        """
+        hexes = list(self.board.hexes)
+        corners = hex_corners_array(hexes, size=1.0)
+        rounded = (np.round(corners / self.tolerance) * self.tolerance).tolist()
+        return [(hex_coord, [tuple(corner) for corner in hex_rounded])
+                for hex_coord, hex_rounded in zip(hexes, rounded)]
     
     def _discover_vertices(self) -> None:
         """Discover all unique vertices from hex corners."""
         vertex_id = 0
         
-        for hex_coord in self.board.hexes:
-            corners = hex_corners(hex_coord, size=1.0)
-            
-            for corner in corners:
-                # Round coordinates to handle floating point precision
-                rounded_pos = (round(corner[0] / self.tolerance) * self.tolerance,
-                             round(corner[1] / self.tolerance) * self.tolerance)
-                
+        for hex_coord, corners in self._hex_corner_positions:
+            for rounded_pos in corners:
                 if rounded_pos not in self.position_to_vertex:
                     # New vertex
                     self.position_to_vertex[rounded_pos] = vertex_id
@@ -84,15 +115,9 @@ class VertexManager:
             self.adjacency[vertex_id] = set()
         
         # Two vertices are adjacent if they share an edge of a hex
-        for hex_coord in self.board.hexes:
-            corners = hex_corners(hex_coord, size=1.0)
-            vertex_ids = []
-            
+        for hex_coord, corners in self._hex_corner_positions:
             # Find vertex IDs for this hex's corners
-            for corner in corners:
-                rounded_pos = (round(corner[0] / self.tolerance) * self.tolerance,
-                             round(corner[1] / self.tolerance) * self.tolerance)
-                vertex_ids.append(self.position_to_vertex[rounded_pos])
+            vertex_ids = [self.position_to_vertex[rounded_pos] for rounded_pos in corners]
             
             # Connect adjacent corners around the hex
             for i in range(6):
@@ -101,10 +126,117 @@ class VertexManager:
                 self.adjacency[v1].add(v2)
                 self.adjacency[v2].add(v1)
     
+    def _build_adjacency_matrix(self) -> None:
+        """Build a boolean adjacency matrix indexed by vertex ID."""
+        n = len(self.vertices)
+        self.adjacency_matrix = np.zeros((n, n), dtype=bool)
+        for vertex_id, neighbors in self.adjacency.items():
+            self.adjacency_matrix[vertex_id, list(neighbors)] = True
+    
+    def _build_adjacency_masks(self) -> None:
+        """Build per-vertex neighbor bitmasks for fast distance rule checks."""
+        self.adjacency_masks = [0] * len(self.vertices)
+        for vertex_id, neighbors in self.adjacency.items():
+            for neighbor_id in neighbors:
+                self.adjacency_masks[vertex_id] |= 1 << neighbor_id
+    
+    def _build_adjacency_csr(self) -> None:
+        """Build flat CSR neighbor arrays indexed by vertex ID, for array kernels."""
+        n = len(self.vertices)
+        neighbors = [sorted(self.adjacency[vertex_id]) for vertex_id in range(n)]
+        self.adjacency_indptr = np.zeros(n + 1, dtype=np.intp)
+        self.adjacency_indptr[1:] = np.cumsum([len(row) for row in neighbors])
+        self.adjacency_indices = np.array([v for row in neighbors for v in row], dtype=np.intp)
+    
+    def occupied_mask(self, occupied_vertices: Set[int] = None) -> np.ndarray:
+        """
+        Get a boolean mask of occupied vertices.
+        
+        Args:
+            occupied_vertices: Set of vertex IDs that already have settlements
+        
+        Returns:
+            Boolean array indexed by vertex ID
+        """
+        mask = np.zeros(len(self.vertices), dtype=bool)
+        if occupied_vertices:
+            ids = [v for v in occupied_vertices if v in self.vertices]
+            mask[ids] = True
+        return mask
+    
+    def distance_rule_mask(self, occupied_vertices: Set[int] = None) -> np.ndarray:
+        """
+        Get a boolean mask of vertices with no occupied neighbor.
+        
+        Args:
+            occupied_vertices: Set of vertex IDs that already have settlements
+        
+        Returns:
+            Boolean array indexed by vertex ID
+        """
+        occupied = self.occupied_mask(occupied_vertices)
+        return ~(self.adjacency_matrix @ occupied)
+    
+    def legal_mask(self, occupied_vertices: Set[int] = None) -> np.ndarray:
+        """
+        Get a boolean mask of legal settlement vertices for bulk queries.
+        
+        Args:
+            occupied_vertices: Set of vertex IDs that already have settlements
+        
+        Returns:
+            Boolean array indexed by vertex ID
+        """
+        occupied = self.occupied_mask(occupied_vertices)
+        return ~occupied & ~(self.adjacency_matrix @ occupied)
+    
+    def resource_arrays(self) -> VertexResourceArrays:
+        """
+        Get per-vertex resource probabilities and flags as arrays indexed by vertex ID.
+        
+        Columns follow RESOURCE_ORDER. The arrays are cached against the
+        board's tile_state_key() and must be treated as read-only.
+        
+        Returns:
+            VertexResourceArrays for the current board
+        """
+        key = self.board.tile_state_key()
+        if self._resource_arrays_cache is None or self._resource_arrays_cache[0] != key:
+            n = len(self.vertices)
+            probability = np.zeros((n, len(RESOURCE_ORDER)))
+            present = np.zeros((n, len(RESOURCE_ORDER)), dtype=bool)
+            has_high_prob = np.zeros(n, dtype=bool)
+            
+            tiles = self.board.tiles
+            for vertex_id, vertex in self.vertices.items():
+                for hex_coord in vertex.incident_hexes:
+                    tile = tiles.get(hex_coord)
+                    if tile is None:
+                        continue
+                    code = RESOURCE_CODE[tile.resource]
+                    probability[vertex_id, code] += tile.probability
+                    present[vertex_id, code] = True
+                    if tile.number in (6, 8):
+                        has_high_prob[vertex_id] = True
+            
+            self._resource_arrays_cache = (key, VertexResourceArrays(probability, present, has_high_prob))
+        return self._resource_arrays_cache[1]
+    
     def get_vertex_count(self) -> int:
         """Get total number of vertices."""
         return len(self.vertices)
     
+    # Vertices and adjacency are fixed once discovered, so these counts never go stale
+    @cached_property
+    def total_count(self) -> int:
+        """Total number of vertices on the board."""
+        return len(self.vertices)
+    
+    @cached_property
+    def legal_count(self) -> int:
+        """Number of legal settlement vertices on an empty board."""
+        return len(self.get_legal_vertices())
+    
     def get_legal_vertices(self, occupied_vertices: Set[int] = None) -> Set[int]:
         """
         Get all vertices where settlements can be legally placed.
@@ -183,23 +315,30 @@ class VertexManager:
         total_probability = 0.0
         total_pips = 0
         
+        tiles = self.board.tiles
         for hex_coord in vertex.incident_hexes:
-            if hex_coord in self.board.tiles:
-                tile = self.board.tiles[hex_coord]
-                if tile.resource.value not in resources:
-                    resources[tile.resource.value] = {
-                        'probability': 0.0,
-                        'pips': 0,
-                        'numbers': []
-                    }
-                
-                resources[tile.resource.value]['probability'] += tile.probability
-                resources[tile.resource.value]['pips'] += tile.pips
-                if tile.number > 0:
-                    resources[tile.resource.value]['numbers'].append(tile.number)
-                
-                total_probability += tile.probability
-                total_pips += tile.pips
+            # Single hash lookup per hex; off-board hexes have no tile
+            tile = tiles.get(hex_coord)
+            if tile is None:
+                continue
+            
+            entry = resources.get(tile.resource.value)
+            if entry is None:
+                entry = resources[tile.resource.value] = {
+                    'probability': 0.0,
+                    'pips': 0,
+                    'numbers': []
+                }
+            
+            probability = tile.probability
+            pips = tile.pips
+            entry['probability'] += probability
+            entry['pips'] += pips
+            if tile.number > 0:
+                entry['numbers'].append(tile.number)
+            
+            total_probability += probability
+            total_pips += pips
         
         return {
             'vertex_id': vertex_id,
@@ -211,6 +350,23 @@ class VertexManager:
             'adjacent_vertices': list(self.adjacency[vertex_id])
         }
     
+    def vertex_infos(self) -> Dict[int, Dict]:
+        """
+        Get get_vertex_info for every vertex at once.
+        
+        The table only depends on the tiles, so it is cached against the
+        board's tile_state_key(). Its dictionaries are shared and must be
+        treated as read-only; use get_vertex_info for a private copy.
+        
+        Returns:
+            Dictionary mapping vertex ID to vertex information
+        """
+        key = self.board.tile_state_key()
+        if self._vertex_info_cache is None or self._vertex_info_cache[0] != key:
+            infos = {vertex_id: self.get_vertex_info(vertex_id) for vertex_id in self.vertices}
+            self._vertex_info_cache = (key, infos)
+        return self._vertex_info_cache[1]
+    
     def get_vertices_csv_data(self) -> List[Dict]:
         """
         Get vertex data in format suitable for CSV export.
@@ -269,3 +425,42 @@ class VertexManager:
                     distances[(start_vertex, end_vertex)] = distance
         
         return distances
+
+
+def standard_board_with_vertices(seed: Optional[int] = None,
+                                 randomize: bool = False) -> Tuple[CatanBoard, VertexManager]:
+    """
+    Get a standard board together with its vertex manager.
+    
+    Reproducible layouts (fixed layout, or a seeded shuffle) are memoized, so
+    repeated callers share one board and skip vertex discovery. The returned
+    objects are shared and must be treated as read-only; keep per-game state
+    in a GameState instead.
+    
+    Args:
+        seed: Random seed for board generation; ignored for the fixed layout
+        randomize: If True, shuffle tiles and numbers
+    
+    Returns:
+        Tuple of (board, vertex_manager)
+    """
+    if not randomize:
+        # The fixed layout never draws from the seed, so every caller shares one board
+        seed = None
+    elif seed is None:
+        # Unseeded shuffles are not reproducible, so never cache them
+        return _build_standard_board(seed, randomize)
+    return _cached_standard_board(seed, randomize)
+
+
+def _build_standard_board(seed: Optional[int], randomize: bool) -> Tuple[CatanBoard, VertexManager]:
+    """Create a standard board and discover its vertices."""
+    board = CatanBoard(seed=seed)
+    board.create_standard_board(randomize=randomize)
+    return board, VertexManager(board)
+
+
+@lru_cache(maxsize=8)
+def _cached_standard_board(seed: Optional[int], randomize: bool) -> Tuple[CatanBoard, VertexManager]:
+    """Memoized wrapper around _build_standard_board."""
+    return _build_standard_board(seed, randomize)
@@ -16,6 +16,7 @@ from .board import CatanBoard, ResourceType
 from .vertices import VertexManager
 from .state import GameState
 from .recommend import RecommendationResult
+from .scoring import PRETTY_STRATEGY
 
 
 class CatanVisualizer:
@@ -150,12 +151,12 @@ class CatanVisualizer:
             ax.add_patch(circle)
             
             # Add score information
-            score_text = f"{strategy.replace('_', ' ').title()}\nScore: {result.score:.1f}"
+            score_text = f"{PRETTY_STRATEGY[strategy]}\nScore: {result.score:.1f}"
             ax.text(x, y - 0.4, score_text, ha='center', va='top', 
                    fontsize=10, weight='bold',
                    bbox=dict(boxstyle="round,pad=0.3", facecolor='white', alpha=0.8))
             
-            self._setup_plot(ax, f"{strategy.replace('_', ' ').title()} Strategy")
+            self._setup_plot(ax, f"{PRETTY_STRATEGY[strategy]} Strategy")
         
         plt.suptitle(f"Strategy Comparison for Vertex {vertex_id}", fontsize=16, weight='bold')
         plt.tight_layout()
@@ -5,14 +5,22 @@ Test Catan Board Generation and Validation
 Tests for board creation, tile distribution, and number token placement.
 """
 
+import pickle
+import random
 import sys
 from pathlib import Path
 
+import numpy as np
+
 # Add src to path
 sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
 
-from catan.board import CatanBoard, ResourceType
-from catan.hex_coords import generate_radius_2_board
+from catan.board import CatanBoard, ResourceType, RESOURCE_ORDER
+from catan import board as board_module
+from catan.hex_coords import (
+    HexCoord, generate_radius_2_board, hex_distance, hex_distance_batch,
+    axial_to_pixel, axial_to_pixel_batch
+)
 
 
 def test_radius_2_board_generation():
@@ -126,6 +134,158 @@ def test_randomized_generation():
     print("✅ Randomized generation: Different seeds produce different boards")
 
 
+def test_generation_leaves_global_random_alone():
+    """Test that seeded board generation does not reseed the global random module."""
+    random.seed(0)
+    expected = random.random()
+    
+    random.seed(0)
+    board = CatanBoard(seed=99)
+    board.create_standard_board(randomize=True)
+    
+    assert random.random() == expected, "Board generation should not touch the global random state"
+    print("✅ Board RNG: Global random state untouched")
+
+
+def test_numpy_rng_generation():
+    """Test that boards shuffled with a NumPy generator are valid and reproducible."""
+    board1 = CatanBoard()
+    board1.create_standard_board(rng=np.random.default_rng(7))
+    
+    board2 = CatanBoard()
+    board2.create_standard_board(rng=np.random.default_rng(7))
+    
+    assert board1.validate_board(), "NumPy-shuffled board should be valid"
+    assert board1.fingerprint() == board2.fingerprint(), "Same generator seed should produce identical boards"
+    
+    print("✅ NumPy rng generation: Valid and reproducible boards")
+
+
+def test_board_fingerprint():
+    """Test that the board fingerprint tracks layout, not identity."""
+    board1 = CatanBoard(seed=123)
+    board1.create_standard_board()
+    
+    board2 = CatanBoard(seed=123)
+    board2.create_standard_board()
+    
+    assert board1.fingerprint() == board2.fingerprint(), "Identical layouts should share a fingerprint"
+    hash(board1.fingerprint())
+    
+    board3 = CatanBoard(seed=222)
+    board3.create_standard_board(randomize=True)
+    
+    assert board1.fingerprint() != board3.fingerprint(), "Different layouts should differ"
+    print("✅ Board fingerprint: Matches identical layouts only")
+
+
+def test_board_summary_cache():
+    """Test that the cached board summary follows board changes."""
+    board = CatanBoard(seed=42)
+    board.create_standard_board()
+    
+    summary = board.get_board_summary()
+    assert board.get_board_summary() == summary, "Repeated summaries should match"
+    assert summary['resource_distribution'] == {'wood': 4, 'brick': 3, 'sheep': 4, 'wheat': 4, 'ore': 3, 'desert': 1}
+    assert sum(summary['number_distribution'].values()) == 18, "Expected 18 number tokens"
+    
+    # Moving the desert off the board invalidates the cached summary
+    board.tiles.pop(board.robber_position)
+    board.robber_position = None
+    changed = board.get_board_summary()
+    
+    assert changed['total_tiles'] == 18, f"Expected 18 tiles, got {changed['total_tiles']}"
+    assert not changed['is_valid'], "Board without a desert should be invalid"
+    print("✅ Board summary: Cache invalidated on board changes")
+
+
+def test_tile_pickle_roundtrip():
+    """Test that tiles (slotted on Python 3.10+) survive pickling for worker processes."""
+    board = CatanBoard(seed=42)
+    board.create_standard_board(randomize=True)
+    
+    tiles = pickle.loads(pickle.dumps(board.tiles))
+    assert tiles == board.tiles, "Unpickled tiles should equal the originals"
+    if sys.version_info >= (3, 10):
+        assert not hasattr(next(iter(tiles.values())), '__dict__'), "Tile should use __slots__"
+    
+    print("✅ Tile pickling: Round trip preserves tiles")
+
+
+def test_tile_arrays():
+    """Test that the struct-of-arrays tile view mirrors the tile dict."""
+    board = CatanBoard(seed=42)
+    board.create_standard_board(randomize=True)
+    
+    arrays = board.tile_arrays()
+    assert len(arrays.coords) == 19, f"Expected 19 tiles, got {len(arrays.coords)}"
+    
+    for coord, tile in board.tiles.items():
+        i = arrays.index[coord]
+        assert RESOURCE_ORDER[arrays.resource[i]] == tile.resource, f"Resource mismatch at {coord}"
+        assert arrays.number[i] == tile.number, f"Number mismatch at {coord}"
+        assert arrays.probability[i] == tile.probability, f"Probability mismatch at {coord}"
+        assert arrays.has_robber[i] == tile.has_robber, f"Robber mismatch at {coord}"
+    
+    for code, resource in enumerate(RESOURCE_ORDER):
+        assert resource.code == code, f"{resource} should have code {code}"
+    
+    # Changing a tile in place must refresh the cached arrays
+    coord, tile = next((c, t) for c, t in board.tiles.items() if t.number > 0)
+    tile.number = 12 if tile.number != 12 else 2
+    assert board.tile_arrays().number[arrays.index[coord]] == tile.number, "Stale tile arrays after a tile change"
+    
+    print("✅ Tile arrays: Match tile dictionary")
+
+
+def test_distribution_kernels_agree():
+    """Test that the loop (numba) and NumPy distribution checks agree."""
+    board = CatanBoard(seed=42)
+    board.create_standard_board(randomize=True)
+    
+    expected = (board_module._EXPECTED_RESOURCE_COUNTS, board_module._EXPECTED_NUMBER_COUNTS)
+    
+    def check():
+        arrays = board.tile_arrays()
+        loop_result = board_module._distribution_is_standard_loop(arrays.resource, arrays.number, *expected)
+        numpy_result = board_module._distribution_is_standard_numpy(arrays.resource, arrays.number, *expected)
+        assert bool(loop_result) == bool(numpy_result), "Distribution kernels disagree"
+        return bool(loop_result)
+    
+    assert check(), "Standard board should pass the distribution check"
+    
+    # Turn one numbered tile into a 7, which is never a valid token
+    tile = next(t for t in board.tiles.values() if t.number > 0)
+    tile.number = 7
+    assert not check(), "A 7 token should fail the distribution check"
+    assert not board.validate_board(), "Board with a 7 token should be invalid"
+    
+    print("✅ Distribution kernels: Loop and NumPy checks agree")
+
+
+def test_hex_batch_helpers():
+    """Test that the batched hex helpers match their scalar counterparts."""
+    hexes = sorted(generate_radius_2_board(), key=lambda h: (h.q, h.r))
+    qr = np.array([(h.q, h.r) for h in hexes])
+    
+    # All pairs of board hexes
+    a = np.repeat(qr, len(hexes), axis=0)
+    b = np.tile(qr, (len(hexes), 1))
+    expected = [hex_distance(h1, h2) for h1 in hexes for h2 in hexes]
+    assert hex_distance_batch(a, b).tolist() == expected, "Batched distances should match hex_distance"
+    
+    # Broadcasting against a single hex
+    center = [hex_distance(h, HexCoord(0, 0)) for h in hexes]
+    assert hex_distance_batch(qr, np.array([0, 0])).tolist() == center
+    
+    pixels = axial_to_pixel_batch(qr, 2.5)
+    assert pixels.shape == (len(hexes), 2)
+    assert pixels.tolist() == [list(axial_to_pixel(h, 2.5)) for h in hexes], \
+        "Batched pixels should match axial_to_pixel exactly"
+    
+    print("✅ Hex batch helpers: Distances and pixel positions match scalar versions")
+
+
 def run_all_tests():
     """Run all board tests."""
     print("🧪 Running Board Tests")
@@ -138,6 +298,14 @@ def run_all_tests():
     test_board_validation()
     test_deterministic_generation()
     test_randomized_generation()
+    test_generation_leaves_global_random_alone()
+    test_numpy_rng_generation()
+    test_board_fingerprint()
+    test_board_summary_cache()
+    test_tile_pickle_roundtrip()
+    test_tile_arrays()
+    test_distribution_kernels_agree()
+    test_hex_batch_helpers()
     
     print("\n🎉 All board tests passed!")
 
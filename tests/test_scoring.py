@@ -8,14 +8,18 @@ Tests for scoring model, strategy weights, and recommendation determinism.
 import sys
 from pathlib import Path
 
+import numpy as np
+
 # Add src to path
 sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
 
 from catan.board import CatanBoard
 from catan.vertices import VertexManager
 from catan.state import GameState
-from catan.scoring import SettlementScorer
+from catan.scoring import SettlementScorer, STRATEGIES
 from catan.recommend import SettlementRecommender
+from catan import recommendations as recommendations_module
+from catan import scoring as scoring_module
 
 
 def test_scoring_determinism():
@@ -211,6 +215,246 @@ def test_custom_weights():
     print("✅ Custom weights: Applied correctly")
 
 
+def test_shared_scorer_for_board():
+    """Test that for_board hands out one scorer per board and vertex manager."""
+    board = CatanBoard(seed=42)
+    board.create_standard_board()
+    vertex_manager = VertexManager(board)
+    
+    scorer = SettlementScorer.for_board(board, vertex_manager)
+    assert SettlementScorer.for_board(board, vertex_manager) is scorer, "Same board should share a scorer"
+    
+    other_board = CatanBoard(seed=7)
+    other_board.create_standard_board()
+    other_scorer = SettlementScorer.for_board(other_board, VertexManager(other_board))
+    assert other_scorer is not scorer, "Different boards should not share a scorer"
+    assert other_scorer.board is other_board
+    
+    print("✅ Shared scorer: One scorer per board")
+
+
+def test_custom_weights_stay_private():
+    """Test that custom recommender weights do not leak into the shared board scorer."""
+    board = CatanBoard(seed=42)
+    board.create_standard_board()
+    vertex_manager = VertexManager(board)
+    game_state = GameState()
+    
+    shared = SettlementScorer.for_board(board, vertex_manager)
+    default_production = shared.weights['production']
+    
+    recommender = recommendations_module.SettlementRecommender(board, vertex_manager)
+    recommender.recommend_best_settlements(game_state, 0, 'balanced', weights={'production': 99.0})
+    
+    assert recommender.scorer.weights['production'] == 99.0, "Recommender should use its custom weights"
+    assert SettlementScorer.for_board(board, vertex_manager) is shared
+    assert shared.weights['production'] == default_production, "Shared scorer weights should be unchanged"
+    assert recommendations_module.SettlementRecommender(board, vertex_manager).scorer.weights['production'] == default_production
+    
+    print("✅ Custom weights: Kept private to one recommender")
+
+
+def test_recommendations_follow_board_changes():
+    """Test that memoized recommendations are recomputed after the board changes."""
+    board = CatanBoard(seed=1)
+    board.create_standard_board(randomize=True)
+    vertex_manager = VertexManager(board)
+    game_state = GameState()
+    
+    recommender = recommendations_module.SettlementRecommender(board, vertex_manager)
+    before = recommender.recommend_best_settlements(game_state, 0, top_k=3)
+    
+    # Put the robber on every tile around the best vertex
+    for hex_coord in vertex_manager.vertices[before[0].vertex_id].incident_hexes:
+        if hex_coord in board.tiles:
+            board.tiles[hex_coord].has_robber = True
+    
+    after = recommender.recommend_best_settlements(game_state, 0, top_k=3)
+    fresh = recommendations_module.SettlementRecommender(board, vertex_manager).recommend_best_settlements(
+        game_state, 0, top_k=3)
+    
+    assert [s.to_dict() for s in after] == [s.to_dict() for s in fresh], "Stale recommendations after a board change"
+    assert [s.vertex_id for s in after] != [s.vertex_id for s in before], "Robber placement should change the ranking"
+    
+    print("✅ Recommendation cache: Invalidated by board changes")
+
+
+def test_batched_strategy_scores():
+    """Test that batched strategy scoring matches per-strategy scoring exactly."""
+    board = CatanBoard(seed=42)
+    board.create_standard_board(randomize=True)
+    vertex_manager = VertexManager(board)
+    scorer = SettlementScorer(board, vertex_manager)
+    game_state = GameState()
+    
+    for vertex_id in vertex_manager.vertices:
+        batched = scorer.score_vertex_strategies(vertex_id, game_state, 0, STRATEGIES)
+        for strategy in STRATEGIES:
+            single = scorer.score_vertex(vertex_id, game_state, 0, strategy)
+            assert batched[strategy].to_dict() == single.to_dict(), \
+                f"Vertex {vertex_id} {strategy}: batched score differs"
+    
+    print("✅ Batched strategies: Match per-strategy scores")
+
+
+def test_parallel_ranking_matches_serial():
+    """Test that spreading vertex scoring over worker processes keeps the ranking."""
+    board = CatanBoard(seed=42)
+    board.create_standard_board(randomize=True)
+    vertex_manager = VertexManager(board)
+    game_state = GameState()
+    game_state.add_settlement(10, 0)
+    
+    serial = SettlementScorer(board, vertex_manager).rank_vertices(game_state, 'city_focused', 0, 54)
+    parallel = SettlementScorer(board, vertex_manager).rank_vertices(game_state, 'city_focused', 0, 54,
+                                                                     max_workers=2)
+    
+    assert [s.to_dict() for s in parallel] == [s.to_dict() for s in serial], \
+        "Parallel ranking should match serial ranking"
+    print("✅ Parallel ranking: Matches serial scoring")
+
+
+def test_parallel_player_recommendations_match_serial():
+    """Test that recommending for players in worker processes matches doing it in process."""
+    board = CatanBoard(seed=42)
+    board.create_standard_board(randomize=True)
+    vertex_manager = VertexManager(board)
+    game_state = GameState()
+    game_state.place_settlement_enhanced(0, 10)
+    game_state.place_settlement_enhanced(1, 30)
+    
+    player_ids = [0, 1, 2]
+    serial = recommendations_module.SettlementRecommender(board, vertex_manager).recommend_for_players(
+        game_state, player_ids, top_k=5, max_workers=1)
+    parallel = recommendations_module.SettlementRecommender(board, vertex_manager).recommend_for_players(
+        game_state, player_ids, top_k=5, max_workers=2)
+    
+    assert list(parallel) == player_ids, "Results should follow player_ids order"
+    for player_id in player_ids:
+        assert [s.to_dict() for s in parallel[player_id]] == [s.to_dict() for s in serial[player_id]], \
+            f"Player {player_id}: parallel recommendations should match serial ones"
+    
+    print("✅ Parallel players: Match serial recommendations")
+
+
+def test_vectorized_scores_match_score_vertex():
+    """Test that array-based batch scoring reproduces score_vertex exactly."""
+    board = CatanBoard(seed=42)
+    board.create_standard_board(randomize=True)
+    vertex_manager = VertexManager(board)
+    scorer = SettlementScorer(board, vertex_manager)
+    game_state = GameState()
+    game_state.add_settlement(10, 0)
+    game_state.add_settlement(30, 1)
+    
+    legal_vertices = list(vertex_manager.get_legal_vertices(game_state.occupied_vertices))
+    for strategy in STRATEGIES:
+        batch = scorer._score_vertex_batch(legal_vertices, game_state, 0, strategy)
+        for i, vertex_id in enumerate(legal_vertices):
+            assert batch.breakdown(i) == scorer.score_vertex(vertex_id, game_state, 0, strategy), \
+                f"Batch score for vertex {vertex_id} ({strategy}) should match score_vertex"
+    
+    print("✅ Vectorized scoring: Matches per-vertex scores")
+
+
+def test_batch_kernels_agree():
+    """Test that the loop (numba) and NumPy batch scoring kernels agree exactly."""
+    board = CatanBoard(seed=42)
+    board.create_standard_board(randomize=True)
+    vertex_manager = VertexManager(board)
+    scorer = SettlementScorer(board, vertex_manager)
+    game_state = GameState()
+    game_state.add_settlement(10, 0)
+    
+    features = scorer._vertex_features()
+    ids = np.array(sorted(vertex_manager.get_legal_vertices(game_state.occupied_vertices)), dtype=np.intp)
+    rng = np.random.default_rng(0)
+    args = (
+        ids, features.slot_probability, features.slot_code,
+        features.balance, features.road, features.dev, features.robber_hits,
+        vertex_manager.adjacency_indptr, vertex_manager.adjacency_indices,
+        vertex_manager.occupied_mask(game_state.occupied_vertices),
+        rng.uniform(0, 30, len(ids)), rng.uniform(-2, 10, len(ids)),
+        scorer._preference_matrix(('city_focused',))[0],
+        np.array([scorer.weights[name] for name in scoring_module._WEIGHT_ORDER]), 1.1, 0.95
+    )
+    
+    loop_result = scoring_module._combine_batch_scores_loop(*args)
+    numpy_result = scoring_module._combine_batch_scores_numpy(*args)
+    for loop_array, numpy_array in zip(loop_result, numpy_result):
+        assert np.array_equal(loop_array, numpy_array), "Batch scoring kernels disagree"
+    
+    print("✅ Batch kernels: Loop and NumPy scoring agree")
+
+
+def test_placement_analysis_binds_player_and_strategy():
+    """Test that placement analysis scores for the given player and strategy."""
+    board = CatanBoard(seed=42)
+    board.create_standard_board(randomize=True)
+    vertex_manager = VertexManager(board)
+    scorer = SettlementScorer(board, vertex_manager)
+    recommender = SettlementRecommender(board, vertex_manager, scorer)
+    game_state = GameState()
+    game_state.place_settlement_enhanced(1, 10)  # player 1's second placement gets a synergy score
+    
+    for vertex_id in vertex_manager.get_legal_vertices(game_state.occupied_vertices):
+        compared = recommender.compare_strategies_for_vertex(vertex_id, game_state, player_id=1)
+        for strategy in STRATEGIES:
+            expected = scorer.score_vertex(vertex_id, game_state, 1, strategy, 2)
+            analyzed = recommender.analyze_placement(vertex_id, game_state, strategy, player_id=1)
+            assert analyzed.score_breakdown == expected, f"Vertex {vertex_id} {strategy}: analyze_placement mismatch"
+            assert compared[strategy].score_breakdown.to_dict() == expected.to_dict(), \
+                f"Vertex {vertex_id} {strategy}: compare_strategies_for_vertex mismatch"
+    
+    synergy = scorer._calculate_settlement_synergy(40, [10], 2)
+    assert synergy == scorer._calculate_settlement_synergy(40, [10], 2, vertex_manager.vertex_infos())
+    
+    print("✅ Placement analysis: Scores the given player and strategy")
+
+
+def test_recommendation_dict_copies():
+    """Test that cached recommendation dicts cannot be changed through returned copies."""
+    board = CatanBoard(seed=42)
+    board.create_standard_board(randomize=True)
+    vertex_manager = VertexManager(board)
+    recommender = SettlementRecommender(board, vertex_manager, SettlementScorer(board, vertex_manager))
+    result = recommender.recommend_settlements(GameState(), top_k=1)[0]
+    
+    first = result.to_dict()
+    assert first['score_breakdown'] == result.score_breakdown.to_dict()
+    first['score'] = -1.0
+    first['score_breakdown']['total_score'] = -1.0
+    
+    second = result.to_dict()
+    assert second['score'] == result.score, "Top-level edits should not reach the cache"
+    assert second['score_breakdown'] == result.score_breakdown.to_dict(), "Nested edits should not reach the cache"
+    
+    print("✅ Recommendation dicts: Copies are independent of the cache")
+
+
+def test_ranking_matches_placement_analysis():
+    """Test that ranked recommendations score vertices like analyze_placement does."""
+    board = CatanBoard(seed=42)
+    board.create_standard_board(randomize=True)
+    vertex_manager = VertexManager(board)
+    scorer = SettlementScorer(board, vertex_manager)
+    recommender = SettlementRecommender(board, vertex_manager, scorer)
+    game_state = GameState()
+    game_state.place_settlement_enhanced(1, 10)
+    game_state.place_settlement_enhanced(0, 30)
+    
+    for strategy in STRATEGIES:
+        for max_workers in (None, 2):
+            ranked = recommender.recommend_settlements(game_state, strategy, player_id=1, top_k=5,
+                                                       max_workers=max_workers)
+            for result in ranked:
+                analyzed = recommender.analyze_placement(result.vertex_id, game_state, strategy, player_id=1)
+                assert result.score_breakdown == analyzed.score_breakdown, \
+                    f"Vertex {result.vertex_id} {strategy}: ranking and analyze_placement disagree"
+    
+    print("✅ Ranking: Matches analyze_placement for the same player and strategy")
+
+
 def run_all_tests():
     """Run all scoring tests."""
     print("🧪 Running Scoring Tests")
@@ -222,6 +466,17 @@ def run_all_tests():
     test_resource_preferences()
     test_robber_penalty()
     test_custom_weights()
+    test_shared_scorer_for_board()
+    test_custom_weights_stay_private()
+    test_recommendations_follow_board_changes()
+    test_batched_strategy_scores()
+    test_parallel_ranking_matches_serial()
+    test_parallel_player_recommendations_match_serial()
+    test_vectorized_scores_match_score_vertex()
+    test_batch_kernels_agree()
+    test_placement_analysis_binds_player_and_strategy()
+    test_ranking_matches_placement_analysis()
+    test_recommendation_dict_copies()
     
     print("\n🎉 All scoring tests passed!")
 
@@ -233,3 +233,19 @@ class TestSettlementTracking:
             # Phase might still be initial_placement or could be expansion 
             assert phase_info['phase'] in ['initial_placement', 'expansion']
             assert phase_info['next_settlement_number'] == 3
+    
+    def test_canonical_key(self, game_components):
+        """Test that equivalent game states share a canonical key."""
+        state_a = GameState()
+        state_a.place_settlement_enhanced(0, 10)
+        state_a.place_settlement_enhanced(1, 30)
+        
+        state_b = GameState()
+        state_b.place_settlement_enhanced(1, 30)
+        state_b.place_settlement_enhanced(0, 10)
+        
+        assert state_a.canonical_key() == state_b.canonical_key()
+        assert hash(state_a.canonical_key()) == hash(state_b.canonical_key())
+        
+        state_b.place_settlement_enhanced(2, 40)
+        assert state_a.canonical_key() != state_b.canonical_key()
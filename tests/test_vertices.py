@@ -12,7 +12,7 @@ from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
 
 from catan.board import CatanBoard
-from catan.vertices import VertexManager
+from catan.vertices import VertexManager, standard_board_with_vertices
 from catan.state import GameState
 
 
@@ -157,6 +157,88 @@ def test_boundary_vs_interior_vertices():
     print(f"✅ Boundary classification: {boundary_count} boundary, {interior_count} interior vertices")
 
 
+def test_legal_mask_matches_legal_vertices():
+    """Test that the vectorized legality mask agrees with get_legal_vertices."""
+    board = CatanBoard(seed=42)
+    board.create_standard_board()
+    
+    vertex_manager = VertexManager(board)
+    game_state = GameState()
+    game_state.add_settlement(10, 0)
+    game_state.add_settlement(30, 1)
+    
+    legal_mask = vertex_manager.legal_mask(game_state.occupied_vertices)
+    legal_vertices = vertex_manager.get_legal_vertices(game_state.occupied_vertices)
+    
+    assert legal_mask.shape == (vertex_manager.get_vertex_count(),)
+    assert {int(v) for v in legal_mask.nonzero()[0]} == legal_vertices, "Mask should match legal vertex set"
+    
+    print("✅ Legal mask: Matches set-based legality checks")
+
+
+def test_occupied_bits_track_placements():
+    """Test that the occupancy bitmask stays in sync with settlement changes."""
+    board = CatanBoard(seed=42)
+    board.create_standard_board()
+    
+    vertex_manager = VertexManager(board)
+    game_state = GameState()
+    
+    game_state.add_settlement(10, 0)
+    game_state.add_settlement(30, 1)
+    game_state.remove_settlement(30)
+    
+    assert game_state.occupied_bits == 1 << 10, "Mask should only contain vertex 10"
+    
+    for vertex_id in vertex_manager.vertices:
+        expected = vertex_manager.is_valid_placement(vertex_id, game_state.occupied_vertices)
+        assert game_state.is_legal_settlement_placement(vertex_id, vertex_manager) == expected, \
+            f"Bitmask legality mismatch at vertex {vertex_id}"
+    
+    print("✅ Occupied bits: Bitmask legality matches set-based checks")
+
+
+def test_cached_vertex_counts():
+    """Test that the cached counts agree with the on-demand queries."""
+    board = CatanBoard(seed=42)
+    board.create_standard_board()
+    
+    vertex_manager = VertexManager(board)
+    
+    assert vertex_manager.total_count == vertex_manager.get_vertex_count()
+    assert vertex_manager.legal_count == len(vertex_manager.get_legal_vertices())
+    
+    print(f"✅ Cached counts: {vertex_manager.total_count} total, {vertex_manager.legal_count} legal")
+
+
+def test_adjacency_csr_matches_adjacency():
+    """Test that the CSR neighbor arrays list the same neighbors as the adjacency sets."""
+    board = CatanBoard(seed=42)
+    board.create_standard_board()
+    
+    vertex_manager = VertexManager(board)
+    indptr = vertex_manager.adjacency_indptr
+    indices = vertex_manager.adjacency_indices
+    
+    assert len(indptr) == vertex_manager.get_vertex_count() + 1
+    for vertex_id, neighbors in vertex_manager.adjacency.items():
+        row = indices[indptr[vertex_id]:indptr[vertex_id + 1]]
+        assert set(row.tolist()) == neighbors, f"CSR row mismatch at vertex {vertex_id}"
+    
+    print("✅ Adjacency CSR: Matches adjacency sets")
+
+
+def test_fixed_layout_ignores_seed():
+    """Test that the fixed layout is shared no matter which seed is passed."""
+    board, vertex_manager = standard_board_with_vertices(seed=42, randomize=False)
+    
+    assert standard_board_with_vertices(seed=7, randomize=False)[0] is board
+    assert standard_board_with_vertices(randomize=False)[1] is vertex_manager
+    assert board.seed is None, "The fixed layout should not record an unused seed"
+    
+    print("✅ Fixed layout: Seed ignored, one shared board")
+
+
 def run_all_tests():
     """Run all vertex tests."""
     print("🧪 Running Vertex Tests")
@@ -169,6 +251,11 @@ def run_all_tests():
     test_vertex_resource_calculation()
     test_vertex_hex_relationship()
     test_boundary_vs_interior_vertices()
+    test_legal_mask_matches_legal_vertices()
+    test_occupied_bits_track_placements()
+    test_cached_vertex_counts()
+    test_adjacency_csr_matches_adjacency()
+    test_fixed_layout_ignores_seed()
     
     print("\n🎉 All vertex tests passed!")
 